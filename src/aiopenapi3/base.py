@@ -1,7 +1,7 @@
 import typing
 import warnings
 from typing import Any, ForwardRef, Union, cast
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 
 import re
 import builtins
@@ -85,11 +85,53 @@ class PathItemBase:
     parameters: list[Any]
 
 
+_missing = object()
+
+
 class RootBase:
+    _jp_cache: dict[str, Any]
+    """
+    JSON Pointer → node resolved, declared as PrivateAttr by the Root of each version
+    """
+
     @staticmethod
-    def resolve(api: "OpenAPI", root: "RootBase", obj, _PathItem, _Reference):
+    def resolve(api: "OpenAPI", root: "RootBase", obj, _PathItem, _Reference, sites=None) -> list[tuple[Any, Any]]:
+        """
+        resolve the references below obj
+
+        the document is walked using a worklist - deeply nested documents do not exhaust the stack
+        the sites visited - (parent, Reference) and (Schema, Discriminator) - are returned, passing them as sites
+        resolves these only instead of walking the document again
+        the sites are not recorded while parsing, the first call walks the whole document - including the objects
+        without references - its cost is linear in the size of the document, the calls passing the sites are linear
+        in the number of references
+
+        :param api: the OpenAPI object
+        :param root: the document
+        :param obj: the object to resolve the references of
+        :param _PathItem: the PathItem type of the version
+        :param _Reference: the Reference type of the version
+        :param sites: the sites returned by a previous call
+        :return: the sites
+        """
         from . import v20, v30, v31
 
+        if sites is not None:
+            for parent, value in sites:
+                if isinstance(value, _Reference):
+                    value._target = api.resolve_jr(root, parent, value)
+                else:
+                    RootBase._resolve_discriminator(parent, value, _Reference)
+            return sites
+
+        sites = list()
+
+        # v3.1 - Schema $ref
+        schema_ref = isinstance(root, (v20.root.Root, v30.root.Root, v31.root.Root))
+        discriminator = isinstance(root, (v30.root.Root, v31.root.Root))
+        # Swagger 2.0 nested Schema.ref
+        nested_schema_ref = isinstance(root, (v20.root.Root, v31.root.Root))
+
         def replaceSchemaReference(data):
             def replace(ivalue):
                 if not isinstance(ivalue, SchemaBase):
@@ -115,139 +157,156 @@ class RootBase:
                 if new:
                     data.update(new)
 
-        if isinstance(obj, ObjectBase):
-            for slot in filter(lambda x: not x.startswith("_") or x == "__root__", obj.model_fields_set):
-                value = getattr(obj, slot)
-                if value is None:
-                    continue
-                if isinstance(value, (int, bool, float)):
-                    continue
-
-                # v3.1 - Schema $ref
-                if isinstance(root, (v20.root.Root, v30.root.Root, v31.root.Root)):
-                    if isinstance(value, SchemaBase):
-                        if (r := getattr(value, "ref", None)) and not isinstance(r, ReferenceBase):
-                            value = _Reference.model_construct(ref=r)
-                            setattr(obj, slot, value)
-
-                if isinstance(root, (v30.root.Root, v31.root.Root)):
-                    if isinstance(value, (v30.Discriminator, v31.Discriminator)):
-                        """
-                        Discriminated Unions - implementing undefined behavior
-                        sub-schemas not having the discriminated property "const" or enum or mismatching the mapping
-                        are a problem
-                        pydantic requires these to be mapping Literal and unique
-                        creating a separate Model for the sub-schema with the mapping Literal is possible
-                        but makes using them horrible
-
-                        we warn about it and force feed the mapping Literal to make it work
+        todo: list[tuple[Any, Any]] = [(None, obj)]
+        while todo:
+            parent, obj = todo.pop()
+            if isinstance(obj, _Reference):
+                sites.append((parent, obj))
+                obj._target = api.resolve_jr(root, parent, obj)
+                continue
+
+            children: list[tuple[Any, Any]] = list()
+            if isinstance(obj, ObjectBase):
+                for slot in filter(lambda x: not x.startswith("_") or x == "__root__", obj.model_fields_set):
+                    value = getattr(obj, slot)
+                    if value is None:
+                        continue
+                    if isinstance(value, (int, bool, float)):
+                        continue
+
+                    if schema_ref:
+                        if isinstance(value, SchemaBase):
+                            if (r := getattr(value, "ref", None)) and not isinstance(r, ReferenceBase):
+                                value = _Reference.model_construct(ref=r)
+                                setattr(obj, slot, value)
+
+                    if discriminator:
+                        if isinstance(value, (v30.Discriminator, v31.Discriminator)):
+                            RootBase._resolve_discriminator(obj, value, _Reference)
+                            sites.append((obj, value))
+
+                    if not isinstance(value, ReferenceBase):
                         """
+                        ref fields embedded in objects -> replace the object with a Reference object
 
-                        if not value.mapping:
-                            value.mapping = dict()
-
-                            for v in (obj.oneOf or []) + (obj.anyOf or []):
-                                k = Path(JSONReference.split(v.ref)[1]).parts[-1]
-                                value.mapping[k] = v
-
-                        for k, v in value.mapping.items():
-                            if not isinstance(v, _Reference):
-                                value.mapping[k] = _Reference.model_construct(ref=v)
-                            else:
-                                if v._target is None:
-                                    continue
-                                from .model import Model
-                                from . import errors
-
-                                if "object" not in (t := sorted(Model.types(v._target))):
-                                    raise errors.SpecError(f"Discriminated Union on a schema with types {t}")
-
-                                if (p := v.properties.get(value.propertyName, None)) is None:
-                                    # Warning Model 'Volume' needs a discriminator field for key 'type'
-                                    p = v.properties[value.propertyName] = v._target.__class__(
-                                        type="string", additionalProperties=False, enum=[k]
-                                    )
-
-                                if (c := getattr(p, "const", None)) is None and len(p.enum or []) == 0:
-                                    warnings.warn(
-                                        f"Discriminated Union member {v.ref} without const/enum key property {value.propertyName}",
-                                        category=errors.DiscriminatorWarning,
-                                    )
-                                    v.properties[value.propertyName].enum = [k]
-                                else:
-                                    if c and c != k:
-                                        warnings.warn(
-                                            f"Discriminated Union member key property const mismatches property mapping {c} != {k}",
-                                            category=errors.DiscriminatorWarning,
-                                        )
-                                        v.properties[value.propertyName].const = k
-                                    if p.enum and (len(p.enum) != 1 or p.enum[0] != k):
-                                        warnings.warn(
-                                            f"Discriminated Union member key property enum mismatches property mapping {p.enum[0]} != {k}",
-                                            category=errors.DiscriminatorWarning,
-                                        )
-                                        v.properties[value.propertyName].enum = [k]
-
-                if not isinstance(value, ReferenceBase):
+                        PathItem Ref is ambiguous
+                        https://github.com/OAI/OpenAPI-Specification/issues/2635
+                        """
+                        if schema_ref:
+                            if isinstance(obj, _PathItem) and slot == "ref":
+                                setattr(obj, slot, _Reference.model_construct(ref=value))
+
+                    value = getattr(obj, slot)
+
+                    if isinstance(value, PathsBase):
+                        value.items()
+                        value = value._paths
+
+                    if isinstance(value, (str, int, float)):  # , datetime.datetime, datetime.date)):
+                        continue
+                    elif isinstance(value, AnyUrl):
+                        pass
+                    elif isinstance(value, _Reference):
+                        children.append((obj, value))
+                    elif issubclass(type(value), ObjectBase) or isinstance(value, (dict, list)):
+                        # otherwise, continue resolving down the tree
+                        children.append((obj, value))
+                    else:
+                        raise TypeError(type(value), value)
+            elif isinstance(obj, dict):
+                if nested_schema_ref:
                     """
-                    ref fields embedded in objects -> replace the object with a Reference object
-
-                    PathItem Ref is ambiguous
-                    https://github.com/OAI/OpenAPI-Specification/issues/2635
+                    Resolving/Replacing Swagger 2.0 nested Schema.ref
+                    Schema.properties[name] -> Schema.ref ==> Schema.properties[name] -> Reference
                     """
-                    if isinstance(root, (v20.root.Root, v30.root.Root, v31.root.Root)):
-                        if isinstance(obj, _PathItem) and slot == "ref":
-                            ref = _Reference.model_construct(ref=value)
-                            ref._target = api.resolve_jr(root, obj, ref)
-                            setattr(obj, slot, ref)
+                    replaceSchemaReference(obj)
 
-                value = getattr(obj, slot)
+                for k, v in obj.items():
+                    if isinstance(v, _Reference):
+                        if v.ref:
+                            children.append((obj, v))
+                    elif isinstance(v, (ObjectBase, dict, list)):
+                        children.append((obj, v))
 
-                if isinstance(value, PathsBase):
-                    value.items()
-                    value = value._paths
+            elif isinstance(obj, list):
+                if nested_schema_ref:
+                    replaceSchemaReference(obj)
 
-                if isinstance(value, (str, int, float)):  # , datetime.datetime, datetime.date)):
-                    continue
-                elif isinstance(value, AnyUrl):
-                    pass
-                elif isinstance(value, _Reference):
-                    value._target = api.resolve_jr(root, obj, value)
-                elif issubclass(type(value), ObjectBase) or isinstance(value, (dict, list)):
-                    # otherwise, continue resolving down the tree
-                    RootBase.resolve(api, root, value, _PathItem, _Reference)
-                else:
-                    raise TypeError(type(value), value)
-        elif isinstance(obj, dict):
-            if isinstance(root, (v20.root.Root, v31.root.Root)):
-                """
-                Resolving/Replacing Swagger 2.0 nested Schema.ref
-                Schema.properties[name] -> Schema.ref ==> Schema.properties[name] -> Reference
-                """
-                replaceSchemaReference(obj)
-
-            for k, v in obj.items():
-                if isinstance(v, _Reference):
-                    if v.ref:
-                        v._target = api.resolve_jr(root, obj, v)
-                elif isinstance(v, (ObjectBase, dict, list)):
-                    RootBase.resolve(api, root, v, _PathItem, _Reference)
+                # if it's a list, resolve its item's references
+                for item in obj:
+                    if isinstance(item, (_Reference, ObjectBase, dict, list)):
+                        children.append((obj, item))
 
-        elif isinstance(obj, list):
-            if isinstance(root, (v20.root.Root, v31.root.Root)):
-                replaceSchemaReference(obj)
+            # depth first, in order
+            todo.extend(reversed(children))
+        return sites
 
-            # if it's a list, resolve its item's references
-            for item in obj:
-                if isinstance(item, _Reference):
-                    item._target = api.resolve_jr(root, obj, item)
-                elif isinstance(item, (ObjectBase, dict, list)):
-                    RootBase.resolve(api, root, item, _PathItem, _Reference)
+    @staticmethod
+    def _resolve_discriminator(obj, value, _Reference) -> None:
+        """
+        Discriminated Unions - implementing undefined behavior
+        sub-schemas not having the discriminated property "const" or enum or mismatching the mapping
+        are a problem
+        pydantic requires these to be mapping Literal and unique
+        creating a separate Model for the sub-schema with the mapping Literal is possible
+        but makes using them horrible
+
+        we warn about it and force feed the mapping Literal to make it work
+        """
+
+        if not value.mapping:
+            value.mapping = dict()
 
-    def _resolve_references(self, api):
+            for v in (obj.oneOf or []) + (obj.anyOf or []):
+                k = Path(JSONReference.split(v.ref)[1]).parts[-1]
+                value.mapping[k] = v
+
+        for k, v in value.mapping.items():
+            if not isinstance(v, _Reference):
+                value.mapping[k] = _Reference.model_construct(ref=v)
+            else:
+                if v._target is None:
+                    continue
+                from .model import Model
+                from . import errors
+
+                if "object" not in (t := sorted(Model.types(v._target))):
+                    raise errors.SpecError(f"Discriminated Union on a schema with types {t}")
+
+                if (p := v.properties.get(value.propertyName, None)) is None:
+                    # Warning Model 'Volume' needs a discriminator field for key 'type'
+                    p = v.properties[value.propertyName] = v._target.__class__(
+                        type="string", additionalProperties=False, enum=[k]
+                    )
+
+                if (c := getattr(p, "const", None)) is None and len(p.enum or []) == 0:
+                    warnings.warn(
+                        f"Discriminated Union member {v.ref} without const/enum key property {value.propertyName}",
+                        category=errors.DiscriminatorWarning,
+                    )
+                    v.properties[value.propertyName].enum = [k]
+                else:
+                    if c and c != k:
+                        warnings.warn(
+                            f"Discriminated Union member key property const mismatches property mapping {c} != {k}",
+                            category=errors.DiscriminatorWarning,
+                        )
+                        v.properties[value.propertyName].const = k
+                    if p.enum and (len(p.enum) != 1 or p.enum[0] != k):
+                        warnings.warn(
+                            f"Discriminated Union member key property enum mismatches property mapping {p.enum[0]} != {k}",
+                            category=errors.DiscriminatorWarning,
+                        )
+                        v.properties[value.propertyName].enum = [k]
+
+    def _resolve_references(self, api, sites=None):
         """
         Resolves all reference objects below this object and notes their original
         value was a reference.
+
+        :param api: the OpenAPI object
+        :param sites: the sites returned by a previous call - resolve these only
+        :return: the sites of the references
         """
         # RootBase.resolve(api, self, self, None, None)
         raise NotImplementedError("specific")
@@ -263,6 +322,9 @@ class RootBase:
         :rtype: ObjectBase
         :raises ValueError: if the given path is not valid
         """
+        if (node := self._jp_cache.get(jp, _missing)) is not _missing:
+            return node
+
         path = jp.split("/")[1:]
         node = self
 
@@ -289,6 +351,7 @@ class RootBase:
             else:
                 raise ReferenceResolutionError(f"Invalid node {node} in Reference {path[:idx]}")
 
+        self._jp_cache[jp] = node
         return node
 
 
@@ -309,6 +372,49 @@ class DiscriminatorBase:
 #    mapping: Dict[str, str] = Field(default_factory=dict)
 
 
+class SchemaStructures:
+    """
+    The models of the Schemas by structure - shared by the Schemas of an OpenAPI object using shared_types
+
+    Structurally identical Schemas share the model, the key is the canonical form of the Schema:
+    the fields set, the Schemas inline in canonical form and References by the object referenced.
+    """
+
+    def __init__(self) -> None:
+        self.types: dict[Hashable, type[BaseModel]] = dict()
+        self.keys: dict[int, Hashable] = dict()
+        """
+        the keys of the Schemas - by id of the Schema, valid while creating the models
+        """
+
+    def __reduce__(self):
+        """
+        pickle can't do the models - the models are created again after loading
+        """
+        return (type(self), ())
+
+    def key(self, obj: Any) -> Hashable:
+        if isinstance(obj, SchemaBase):
+            if (k := self.keys.get(id(obj))) is None:
+                k = self.keys[id(obj)] = (self._fields(obj), self.key(obj.__pydantic_extra__))
+            return k
+        elif isinstance(obj, ReferenceBase):
+            return ReferenceBase, id(obj._target)
+        elif isinstance(obj, BaseModel):
+            return self._fields(obj)
+        elif isinstance(obj, dict):
+            return dict, tuple((k, self.key(v)) for k, v in obj.items())
+        elif isinstance(obj, list):
+            return list, tuple(self.key(v) for v in obj)
+        else:
+            return type(obj), obj
+
+    def _fields(self, obj: BaseModel) -> Hashable:
+        return type(obj), tuple(
+            (name, self.key(getattr(obj, name))) for name in type(obj).model_fields if name in obj.model_fields_set
+        )
+
+
 class SchemaBase(BaseModel):
     """
     The Base for the Schema
@@ -346,6 +452,26 @@ class SchemaBase(BaseModel):
     The _identity attribute is set during OpenAPI.__init__ and used to create the class name in get_type()
     """
 
+    _location: str | None = PrivateAttr(default=None)
+    """
+    The location of the Schema - document and JSON Pointer - used to derive the identity if the Schema has no name
+    """
+
+    _identities: set[str] | None = PrivateAttr(default=None)
+    """
+    The identities in use - shared by the Schemas of an OpenAPI object to avoid identity collisions
+    """
+
+    _structures: SchemaStructures | None = PrivateAttr(default=None)
+    """
+    The models by structure - shared by the Schemas of an OpenAPI object using shared_types
+    """
+
+    _defer_build: bool = PrivateAttr(default=False)
+    """
+    The validator of the model is built on first use - set for the Schemas of an OpenAPI object using defer_build
+    """
+
     #    items: Optional[Union["SchemaType", List["SchemaType"]]]
 
     def __getstate__(self):
@@ -368,6 +494,8 @@ class SchemaBase(BaseModel):
         if self._identity is None:
             if name:
                 n = re.sub(r"\W", "_", name, flags=re.ASCII)
+            elif self._location is not None:
+                n = re.sub(r"\W", "_", JSONPointer.decode(self._location).lstrip("#/"), flags=re.ASCII)
             else:
                 n = str(uuid.uuid4()).replace("-", "_")
 
@@ -382,9 +510,18 @@ class SchemaBase(BaseModel):
                 n += "_"
 
             if n != name:
-                self._identity = f"{prefix}{n}"
+                identity = f"{prefix}{n}"
             else:
-                self._identity = name
+                identity = name
+
+            if self._identities is not None:
+                unique, i = identity, 0
+                while unique in self._identities:
+                    i += 1
+                    unique = f"{identity}_{i}"
+                self._identities.add(unique)
+                identity = unique
+            self._identity = identity
         return self._identity
 
     def set_type(
@@ -396,9 +533,16 @@ class SchemaBase(BaseModel):
         from .model import Model
 
         if extra is None or extra == []:
-            self._model_type = Model.from_schema(
-                cast("SchemaType", self), names, cast(list["DiscriminatorType"], discriminators)
-            )
+            if self._structures is None:
+                self._model_type = Model.from_schema(
+                    cast("SchemaType", self), names, cast(list["DiscriminatorType"], discriminators)
+                )
+            elif (t := self._structures.types.get(key := self._structures.key(self))) is not None:
+                self._model_type = t
+            else:
+                self._model_type = self._structures.types[key] = Model.from_schema(
+                    cast("SchemaType", self), names, cast(list["DiscriminatorType"], discriminators)
+                )
             return self._model_type
         else:
             identity = self._identity
@@ -447,6 +591,21 @@ class SchemaBase(BaseModel):
             return r.root
         return r
 
+    def model_json(self, data: str | bytes) -> BaseModel | list[BaseModel]:
+        """
+        Generates a model representing this schema from the given JSON document, without decoding to python first.
+
+        :param data: The JSON data to create the model from.  Should match this schema.
+
+        :returns: A new :any:`Model` created in this Schema's type from the data.
+        """
+
+        type_ = cast("SchemaType", self.get_type())
+        r = type_.model_validate_json(data)
+        if isinstance(r, RootModel):
+            return r.root
+        return r
+
 
 class OperationBase:
     # parameters: Optional[List[Union[ParameterBase, ReferenceBase]]]
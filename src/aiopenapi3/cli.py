@@ -156,7 +156,8 @@ def main(argv=None):
     parser.add_argument("-t", "--tracemalloc", action="store_true", default=False)
     parser.add_argument("-P", "--plugins", action="append")
     parser.add_argument("-L", "--locations", action="append")
-    parser.add_argument("-C", "--cache")
+    parser.add_argument("-C", "--cache", help="pickle file")
+    parser.add_argument("--cache-dir", help="cache directory, c.f. cache_dir")
     parser.add_argument("--disable-ssl-validation", action="store_true", default=False)
     sub = parser.add_subparsers()
 
@@ -227,7 +228,12 @@ def main(argv=None):
                 api.cache_store(cache)
         else:
             api = OpenAPI.load_file(
-                args.input, yarl.URL(args.input), loader=loader, plugins=plugins, session_factory=session_factory
+                args.input,
+                yarl.URL(args.input),
+                loader=loader,
+                plugins=plugins,
+                session_factory=session_factory,
+                cache_dir=Path(args.cache_dir) if args.cache_dir else None,
             )
 
         if args.base_url:
@@ -291,6 +297,17 @@ def main(argv=None):
 
     cmd.set_defaults(func=cmd_validate)
 
+    cmd = sub.add_parser("compile")
+    cmd.add_argument("input")
+    cmd.add_argument("output")
+
+    def cmd_compile(args: argparse.Namespace) -> None:
+        loader = loader_prepare(args, session_factory)
+        api = OpenAPI.load_file(args.input, yarl.URL(args.input), plugins=plugins, loader=loader)
+        api.types_store(Path(args.output))
+
+    cmd.set_defaults(func=cmd_compile)
+
     if argv:
         args = parser.parse_args(argv)
     else:
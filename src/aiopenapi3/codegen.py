@@ -0,0 +1,299 @@
+"""
+ahead-of-time code generation - render the models of an OpenAPI object to a python module
+
+the module can be attached to the (cached) OpenAPI object instead of creating the models at runtime,
+c.f. :meth:`aiopenapi3.OpenAPI.types_store` :meth:`aiopenapi3.OpenAPI.types_load`
+"""
+
+import builtins
+import dataclasses
+import importlib
+import inspect
+import keyword
+import math
+import re
+import types
+import typing
+from typing import TYPE_CHECKING, Annotated, Any, ForwardRef, Literal, Union
+
+import annotated_types
+import pydantic_core
+from pydantic import BaseModel, RootModel
+from pydantic.fields import FieldInfo
+
+from . import me
+from .model import ConfiguredRootModel, is_basemodel
+
+if TYPE_CHECKING:
+    from .openapi import OpenAPI
+
+
+FIELD_CONSTRAINTS = frozenset(
+    [
+        "gt",
+        "ge",
+        "lt",
+        "le",
+        "multiple_of",
+        "min_length",
+        "max_length",
+        "pattern",
+        "strict",
+        "allow_inf_nan",
+        "max_digits",
+        "decimal_places",
+    ]
+)
+"""
+constraints stored in FieldInfo.metadata which can be passed as keyword arguments to Field
+"""
+
+AIO3_PROPERTIES = {
+    "aio3_patternProperties": "get_patternProperties",
+    "aio3_additionalProperties": "get_additionalProperties",
+}
+
+
+class ModuleGenerator:
+    """
+    renders the models created for an OpenAPI object to the source of a python module
+
+    the module provides
+      * the models as classes
+      * ``__types__`` - the identity of the schema → the model
+
+    the models are referenced using an alias (e.g. ``_Pet`` for ``Pet``) in the annotations,
+    property names of the models can not shadow the alias as property names do not start with "_"
+    """
+
+    def __init__(self, api: "OpenAPI") -> None:
+        self.api = api
+        self.imports: dict[str, str] = {"typing": "_typing", "pydantic": "_pydantic"}
+        self.names: dict[int, str] = dict()
+        self.models: list[type[BaseModel]] = list()
+        self.classes: list[str] = list()
+        self.shadowed: frozenset[str] = frozenset()
+
+    def render(self) -> str:
+        types_ = {identity: self._type(t) for identity, t in self.api._types.items()}
+
+        # render the models - models discovered while rendering are appended to self.models
+        idx = 0
+        while idx < len(self.models):
+            self.classes.append(self._model(self.models[idx]))
+            idx += 1
+
+        r = [
+            '"""',
+            f"models for {self.api.info.title} {self.api.info.version}",
+            "",
+            "generated by aiopenapi3 - do not edit",
+            '"""',
+            "",
+            "from __future__ import annotations",
+            "",
+        ]
+        r.extend(f"import {module} as {alias}" for module, alias in sorted(self.imports.items()))
+        for i in self.classes:
+            r.extend(["", "", i])
+        r.extend(["", ""])
+        r.append("__types__ = {")
+        r.extend(f"    {identity!r}: {t}," for identity, t in types_.items())
+        r.append("}")
+        r.append("")
+        r.append("for _model in (")
+        r.extend(f"    {self._alias(m)}," for m in self.models)
+        r.append("):")
+        r.append("    _model.model_rebuild()")
+        r.append("")
+        return "\n".join(r)
+
+    def _import(self, obj: Any) -> str:
+        module, qualname = obj.__module__, obj.__qualname__
+        v: Any = importlib.import_module(module)
+        for i in qualname.split("."):
+            v = getattr(v, i, None)
+        if v is not obj:
+            raise TypeError(f"{obj} can not be imported from {module}")
+        if module == "builtins":
+            if qualname in self.shadowed:
+                return f"{self._module('builtins')}.{qualname}"
+            return qualname
+        return f"{self._module(module)}.{qualname}"
+
+    def _module(self, module: str) -> str:
+        if (alias := self.imports.get(module)) is None:
+            alias = self.imports[module] = "_" + module.replace(".", "_")
+        return alias
+
+    def _name(self, model: type[BaseModel]) -> str:
+        if (name := self.names.get(id(model))) is None:
+            name = re.sub(r"\W", "_", model.__name__, flags=re.ASCII)
+            if name[0].isdigit() or keyword.iskeyword(name) or hasattr(builtins, name):
+                name = f"{name}_"
+            used = set(self.names.values())
+            candidate, n = name, 0
+            while candidate in used:
+                n += 1
+                candidate = f"{name}_{n}"
+            name = self.names[id(model)] = candidate
+            self.models.append(model)
+        return name
+
+    def _alias(self, model: type[BaseModel]) -> str:
+        name = self._name(model)
+        return f"_{name}" if name[0] != "_" else f"_m{name}"
+
+    def _type(self, t: Any) -> str:
+        if t is None or t is types.NoneType:
+            return "None"
+        if t is Any:
+            return "_typing.Any"
+        if t is Ellipsis:
+            return "..."
+        if isinstance(t, ForwardRef):
+            if (m := re.fullmatch(r'__types\["(.+)"\]', t.__forward_arg__)) is None:
+                raise TypeError(f"unexpected ForwardRef {t}")
+            return self._type(self.api._types[m.group(1)])
+
+        origin = typing.get_origin(t)
+        if origin is Annotated:
+            base, *metadata = typing.get_args(t)
+            return f"_typing.Annotated[{', '.join([self._type(base)] + [self._metadata(i) for i in metadata])}]"
+        if origin in (Union, types.UnionType):
+            return f"_typing.Union[{', '.join(self._type(i) for i in typing.get_args(t))}]"
+        if origin is Literal:
+            return f"_typing.Literal[{', '.join(self._value(i) for i in typing.get_args(t))}]"
+        if origin is not None:
+            return f"{self._type(origin)}[{', '.join(self._type(i) for i in typing.get_args(t))}]"
+
+        if is_basemodel(t) and t.__module__ == me.__name__:
+            return self._alias(t)
+        if inspect.isclass(t):
+            return self._import(t)
+        raise TypeError(f"unsupported annotation {t!r}")
+
+    def _value(self, v: Any) -> str:
+        if v is None or isinstance(v, (bool, str, bytes, int)):
+            return repr(v)
+        if isinstance(v, float):
+            return repr(v) if math.isfinite(v) else f"float({str(v)!r})"
+        if v is pydantic_core.PydanticUndefined:
+            return f"{self._module('pydantic_core')}.PydanticUndefined"
+        if isinstance(v, list):
+            return f"[{', '.join(self._value(i) for i in v)}]"
+        if isinstance(v, tuple):
+            return f"({''.join(self._value(i) + ', ' for i in v)})"
+        if isinstance(v, dict):
+            return f"{{{', '.join(f'{self._value(k)}: {self._value(i)}' for k, i in v.items())}}}"
+        if isinstance(v, re.Pattern):
+            return f"{self._module('re')}.compile({v.pattern!r})"
+        if inspect.isclass(v):
+            return self._type(v)
+        raise TypeError(f"unsupported value {v!r}")
+
+    def _metadata(self, v: Any) -> str:
+        if isinstance(v, FieldInfo):
+            args, extra = self._field(v)
+            if extra:
+                raise TypeError(f"unsupported metadata {extra!r}")
+            return args
+        if dataclasses.is_dataclass(v) and not inspect.isclass(v):
+            args = ", ".join(f"{f.name}={self._value(getattr(v, f.name))}" for f in dataclasses.fields(v) if f.init)
+            return f"{self._import(type(v))}({args})"
+        raise TypeError(f"unsupported metadata {v!r}")
+
+    def _field(self, field: FieldInfo) -> tuple[str, list[str]]:
+        """
+        :return: the Field() and the metadata which can not be passed to Field
+        """
+        args = {k: v for k, v in field._attributes_set.items() if k != "annotation"}
+        extra = list()
+        for m in field.metadata:
+            if isinstance(m, annotated_types.BaseMetadata) and dataclasses.is_dataclass(m):
+                values = {f.name: getattr(m, f.name) for f in dataclasses.fields(m)}
+            elif type(m).__name__ == "_PydanticGeneralMetadata":
+                values = dict(vars(m))
+            else:
+                values = dict()
+
+            if values and set(values.keys()) <= FIELD_CONSTRAINTS:
+                args.update(values)
+            else:
+                extra.append(self._metadata(m))
+        return f"_pydantic.Field({', '.join(f'{k}={self._value(v)}' for k, v in args.items())})", extra
+
+    def _model(self, model: type[BaseModel]) -> str:
+        name = self._name(model)
+        self.shadowed = frozenset(model.model_fields.keys())
+        try:
+            return self._model_body(model, name)
+        finally:
+            self.shadowed = frozenset()
+
+    def _model_body(self, model: type[BaseModel], name: str) -> str:
+        decorators = model.__pydantic_decorators__
+        validators = set(decorators.model_validators.keys()) - {"aio3_validate_patternProperties"}
+        if validators or any(
+            getattr(decorators, i) for i in ["validators", "field_validators", "root_validators", "field_serializers"]
+        ):
+            raise TypeError(f"{model} has unsupported validators")
+
+        if issubclass(model, RootModel):
+            base = f"{self._module('aiopenapi3.model')}.ConfiguredRootModel"
+            config = model.model_config != ConfiguredRootModel.model_config
+        elif model.__bases__ == (BaseModel,):
+            base = "_pydantic.BaseModel"
+            config = True
+        else:
+            raise TypeError(f"{model} has unsupported bases {model.__bases__}")
+
+        members: list[tuple[str, str | None, str]] = list()
+        if config:
+            args = ", ".join(f"{k}={self._value(v)}" for k, v in model.model_config.items())
+            members.append(("model_config", None, f"_pydantic.ConfigDict({args})"))
+
+        for fname, field in model.model_fields.items():
+            annotation = self._type(field.annotation)
+            args, extra = self._field(field)
+            if extra:
+                annotation = f"_typing.Annotated[{', '.join([annotation] + extra)}]"
+            members.append((fname, annotation, args))
+
+        aio3 = self._module("aiopenapi3.model")
+        if (f := model.__dict__.get("aio3_patternProperty")) is not None:
+            patterns = typing.get_args(f.__annotations__["item"])
+            members.append(("aio3_patternProperty", None, f"{aio3}.patternProperty({self._value(patterns)})"))
+        for k, v in AIO3_PROPERTIES.items():
+            if isinstance(model.__dict__.get(k), property):
+                members.append((k, None, f"property({aio3}.{v})"))
+        if "aio3_validate_patternProperties" in decorators.model_validators:
+            members.append(
+                (
+                    "aio3_validate_patternProperties",
+                    None,
+                    f"_pydantic.model_validator(mode='after')({aio3}.validate_patternProperties)",
+                )
+            )
+
+        if all(k.isidentifier() and not keyword.iskeyword(k) for k, _, _ in members):
+            r = [f"class {name}({base}):"]
+            for k, annotation, value in members:
+                r.append(f"    {k}: {annotation} = {value}" if annotation else f"    {k} = {value}")
+            if len(r) == 1:
+                r.append("    pass")
+            r.append("")
+        else:
+            # property names which are not valid identifiers - the annotations are evaluated by pydantic
+            r = [f"{name} = {self._module('aiopenapi3.pydanticv2')}.create_model("]
+            r.append(f"    {name!r},")
+            r.append(f"    __base__={base},")
+            r.append("    __module__=__name__,")
+            r.append("    **{")
+            for k, annotation, value in members:
+                r.append(f"        {k!r}: ({annotation!r}, {value}),")
+            r.append("    },")
+            r.append(")")
+        r.append("")
+        r.append(f"{self._alias(model)} = {name}")
+        return "\n".join(r)
@@ -0,0 +1,233 @@
+"""
+create the objects of description documents without validation
+
+for description documents validated before - e.g. from a cache or an artifact store - the validation by pydantic is
+wasted, :func:`construct` creates the object tree the way :meth:`pydantic.BaseModel.model_construct` does instead.
+
+The model validators in mode="before" and "after" are applied as they transform the data (e.g. extensions,
+boolean schemas, the number type of constraints), these are cheap compared to the validation of all fields.
+Unions of a model and Reference are decided the way pydantic's smart mode does,
+the values of other types are validated.
+
+Response bodies are created the same way using validation="construct", c.f. :attr:`aiopenapi3.OpenAPI.validation`.
+"""
+
+import copy
+import enum
+import functools
+import sys
+import types
+import typing
+from typing import Any
+from collections.abc import Callable
+
+if sys.version_info < (3, 12):
+    from typing_extensions import Self
+else:
+    from typing import Self
+
+from pydantic import BaseModel, RootModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from .base import ObjectExtended, ReferenceBase
+
+
+def _default(factory: Callable[[], Any] | None, default: Any) -> Any:
+    if factory is not None:
+        return factory()
+    return copy.deepcopy(default) if isinstance(default, (dict, list, set)) else default
+
+
+class _Plan:
+    """
+    the fields and validators of a model
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        if not model.__pydantic_complete__:
+            # defer_build - resolve the forward references of the annotations
+            model.model_rebuild(raise_errors=False)
+        self.model = model
+        self.fields: list[tuple[str, str, Any]] = [
+            (name, field.alias or name, field.annotation) for name, field in model.model_fields.items()
+        ]
+        self.defaults: list[tuple[str, Callable[[], Any] | None, Any]] = [
+            (name, field.default_factory, None if field.default is PydanticUndefined else field.default)  # type: ignore[misc]
+            for name, field in model.model_fields.items()
+        ]
+        # the private attributes - unless model_post_init is customized
+        self.private: list[tuple[str, Callable[[], Any] | None, Any]] | None = None
+        if getattr(model.model_post_init, "__name__", None) == "init_private_attributes":
+            self.private = [
+                (name, p.default_factory, p.default)  # type: ignore[misc]
+                for name, p in model.__private_attributes__.items()
+                if p.default_factory is not None or p.default is not PydanticUndefined
+            ]
+        self.keys: frozenset[str] = frozenset(key for _, key, _ in self.fields)
+        self.literals: list[tuple[str, tuple[Any, ...]]] = [
+            (key, typing.get_args(type_)) for _, key, type_ in self.fields if typing.get_origin(type_) is typing.Literal
+        ]
+        self.required: frozenset[str] = frozenset(
+            field.alias or name for name, field in model.model_fields.items() if field.is_required()
+        )
+        self.extra: str | None = model.model_config.get("extra", None)
+        self.extensions: bool = issubclass(model, ObjectExtended)
+        validators = model.__pydantic_decorators__.model_validators
+        self.before = [getattr(model, name) for name, v in validators.items() if v.info.mode == "before"]
+        self.after = [name for name, v in validators.items() if v.info.mode == "after"]
+
+    def create(self, values: dict[str, Any], extra: dict[str, Any] | None) -> BaseModel:
+        """
+        BaseModel.model_construct - without inspecting the default_factory for each field
+        """
+        data = dict()
+        for name, factory, default in self.defaults:
+            if name in values:
+                data[name] = values[name]
+            else:
+                data[name] = _default(factory, default)
+        m = self.model.__new__(self.model)
+        object.__setattr__(m, "__dict__", data)
+        object.__setattr__(m, "__pydantic_fields_set__", values.keys() | extra.keys() if extra else set(values.keys()))
+        object.__setattr__(m, "__pydantic_extra__", extra if self.extra == "allow" else None)
+        if self.private is not None:
+            object.__setattr__(
+                m,
+                "__pydantic_private__",
+                {name: _default(factory, default) for name, factory, default in self.private},
+            )
+        else:
+            object.__setattr__(m, "__pydantic_private__", None)
+            if self.model.__pydantic_post_init__:
+                m.model_post_init(None)
+        for name in self.after:
+            m = getattr(m, name)()
+        return m
+
+    def accepts(self, value: dict[str, Any]) -> int | None:
+        """
+        :return: the number of fields the value sets, None if validating the value would fail
+        """
+        if not self.required <= value.keys():
+            return None
+        for key, values in self.literals:
+            if key in value and value[key] not in values:
+                return None
+        if self.extra in ("allow", "ignore"):
+            return len(self.keys & value.keys())
+        n = 0
+        for k in value.keys():
+            if k in self.keys:
+                n += 1
+            elif not (self.extensions and k[:2] == "x-"):
+                return None
+        return n
+
+
+@functools.cache
+def _plan(model: type[BaseModel]) -> _Plan:
+    return _Plan(model)
+
+
+@functools.cache
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _union(annotation: Any, members: tuple[Any, ...], value: Any, owner: type[BaseModel] | None) -> Any:
+    if value is None and types.NoneType in members:
+        return None
+    members = tuple(i for i in members if i is not types.NoneType)
+    if len(members) == 1:
+        return construct(members[0], value, owner)
+
+    if isinstance(value, dict):
+        models = [i for i in members if _is_model(i)]
+        mappings = [i for i in members if i in (dict, Any) or typing.get_origin(i) is dict]
+        if not mappings and sum(1 for i in models if not issubclass(i, ReferenceBase)) <= 1:
+            # Schema | Reference - the most fields set, the first on ties
+            best: tuple[int, Any] | None = None
+            for i in models:
+                if (n := _plan(i).accepts(value)) is not None and (best is None or n > best[0]):
+                    best = (n, i)
+            if best is not None:
+                return construct(best[1], value, owner)
+        elif not mappings and not any(issubclass(i, RootModel) for i in models):
+            # the union of models - e.g. discriminated by a Literal - if a single model accepts the value
+            accepted = [i for i in models if _plan(i).accepts(value) is not None]
+            if len(accepted) == 1:
+                return construct(accepted[0], value, owner)
+    elif isinstance(value, list):
+        lists = [i for i in members if typing.get_origin(i) is list or i is list]
+        if len(lists) == 1:
+            return construct(lists[0], value, owner)
+
+    return _adapter(annotation).validate_python(value)
+
+
+def construct(annotation: Any, value: Any, owner: type[BaseModel] | None = None) -> Any:
+    """
+    create the value of the type annotation without validation
+
+    :param annotation: the type, e.g. :class:`aiopenapi3.v31.Root`
+    :param value: the data
+    :param owner: the model the annotation is used in - typing.Self
+    :return: the value
+    """
+    if annotation is Any:
+        return value
+
+    if annotation is Self:
+        annotation = owner
+
+    if _is_model(annotation):
+        plan = _plan(annotation)
+        if plan.before:
+            if isinstance(value, dict):
+                value = dict(value)
+            for validator in plan.before:
+                value = validator(value)
+
+        if issubclass(annotation, RootModel):
+            return annotation.model_construct(construct(annotation.model_fields["root"].annotation, value, annotation))
+
+        if not isinstance(value, dict):
+            return annotation.model_validate(value)
+
+        values = dict()
+        for name, key, type_ in plan.fields:
+            if key in value:
+                values[name] = construct(type_, value[key], annotation)
+        extra = {k: v for k, v in value.items() if k not in plan.keys} if plan.extra == "allow" else None
+        return plan.create(values, extra)
+
+    origin = typing.get_origin(annotation)
+    if origin is None:
+        if isinstance(annotation, type):
+            if annotation is float and type(value) is int:
+                return float(value)
+            if isinstance(value, annotation):
+                return value
+            if issubclass(annotation, enum.Enum):
+                return annotation(value)
+        return _adapter(annotation).validate_python(value)
+    elif origin is list:
+        if not isinstance(value, list):
+            # raises the ValidationError
+            return _adapter(annotation).validate_python(value)
+        (item,) = typing.get_args(annotation)
+        return [construct(item, i, owner) for i in value]
+    elif origin is dict:
+        if not isinstance(value, dict):
+            return _adapter(annotation).validate_python(value)
+        _, item = typing.get_args(annotation)
+        return {k: construct(item, v, owner) for k, v in value.items()}
+    elif origin in (typing.Union, types.UnionType):
+        return _union(annotation, typing.get_args(annotation), value, owner)
+    elif origin is typing.Literal:
+        return value
+    return _adapter(annotation).validate_python(value)
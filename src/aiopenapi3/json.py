@@ -21,6 +21,14 @@ class JSONPointer:
         part = part.replace("~1", "/")
         return part.replace("~0", "~")
 
+    @staticmethod
+    def encode(part: str) -> str:
+        """
+        encode a reference token
+        :param part:
+        """
+        return part.replace("~", "~0").replace("/", "~1")
+
 
 class JSONReference:
     @staticmethod
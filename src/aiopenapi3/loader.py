@@ -1,12 +1,19 @@
 import abc
+import asyncio
+import hashlib
 import logging
+import os
+import tempfile
 import typing
+from collections.abc import Callable
+from typing import Any
 import yaml
 import httpx
 import yarl
 import re
 
 import importlib
+import json as stdjson
 
 # prefer a fast json library here as we may parse large documents
 for i in ["orjson", "simdjson", "ujson", "json"]:
@@ -28,8 +35,10 @@ if typing.TYPE_CHECKING:
 
 log = logging.getLogger("aiopenapi3.loader")
 
+JSON_START = re.compile(r"\s*[{\[]")
 
-class YAML12Loader(yaml.SafeLoader):
+
+class _YAML12Resolver:
     """
     A YAML 1.2 (2009) parser is still a problem in python (in 2023)
 
@@ -74,14 +83,13 @@ class YAML12Loader(yaml.SafeLoader):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        tags = set(
-            sum(list(map(lambda x: list(map(lambda y: y[0], x)), YAML12Loader.yaml_implicit_resolvers.values())), [])
-        )
+        cls = type(self)
+        tags = set(sum(list(map(lambda x: list(map(lambda y: y[0], x)), cls.yaml_implicit_resolvers.values())), []))
         for tag in tags:
-            YAML12Loader.remove_implicit_resolver(tag)
-        for tag, regex, initial in YAML12Loader._core_resolvers:
+            cls.remove_implicit_resolver(tag)
+        for tag, regex, initial in cls._core_resolvers:
             tag = f"tag:yaml.org,2002:{tag}"
-            YAML12Loader.add_implicit_resolver(tag, regex, initial)
+            cls.add_implicit_resolver(tag, regex, initial)
 
     @classmethod
     def remove_implicit_resolver(cls, tag_to_remove):
@@ -105,6 +113,40 @@ class YAML12Loader(yaml.SafeLoader):
             ]
 
 
+class YAML12Loader(_YAML12Resolver, yaml.SafeLoader):
+    """
+    YAML 1.2 core schema based on the pure python SafeLoader
+    """
+
+
+if yaml.__with_libyaml__:
+
+    class CYAML12Loader(_YAML12Resolver, yaml.CSafeLoader):
+        """
+        YAML 1.2 core schema based on the libyaml CSafeLoader
+        """
+
+else:
+    CYAML12Loader = YAML12Loader  # type: ignore[misc,assignment]
+
+
+def _write(path: Path, write: Callable[[Path], Any]) -> None:
+    """
+    write to a temporary file and rename - concurrent readers never see a partial file
+
+    :param path: the file
+    :param write: writes the temporary file passed
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}", suffix=path.suffix)
+    os.close(fd)
+    try:
+        write(Path(name))
+        os.replace(name, path)
+    except BaseException:
+        os.unlink(name)
+        raise
+
+
 class Loader(abc.ABC):
     """
     Loaders are used to 'get' description documents:
@@ -114,7 +156,7 @@ class Loader(abc.ABC):
      * parse
     """
 
-    def __init__(self, yload: "YAMLLoaderType" = YAML12Loader):
+    def __init__(self, yload: "YAMLLoaderType" = CYAML12Loader):
         self.yload = yload
 
     @abc.abstractmethod
@@ -153,6 +195,16 @@ class Loader(abc.ABC):
             raise ValueError("encoding")
         return r
 
+    @staticmethod
+    def sniff(data: str) -> str:
+        """
+        guess the format of the document by the first non-whitespace character
+
+        :param data: decoded data of the description document
+        :return: "json" or "yaml"
+        """
+        return "json" if JSON_START.match(data) else "yaml"
+
     def parse(self, plugins: Plugins, url: yarl.URL, data: str):
         """
         parse the downloaded document as json or yaml
@@ -163,22 +215,21 @@ class Loader(abc.ABC):
         :return:
         """
         file = Path(url.path)
-        if file.suffix not in (".yaml", ".json"):
-            try:
-                return self.parse(plugins, url.with_path("/test.yaml"), data)
-            except Exception as e:
-                pass
+        if file.suffix == ".json":
+            data = json.loads(data)
+        elif self.sniff(data) == "json":
             try:
-                return self.parse(plugins, url.with_path("/test.json"), data)
-            except Exception as e:
-                pass
-
-        if file.suffix == ".yaml":
+                data = json.loads(data)
+            except ValueError:
+                # a yaml flow mapping/sequence
+                data = yaml.load(data, Loader=self.yload)
+        elif file.suffix == ".yaml":
             data = yaml.load(data, Loader=self.yload)
-        elif file.suffix == ".json":
-            data = json.loads(data)
         else:
-            raise ValueError(f"{file.name} is not yaml/json")
+            try:
+                data = yaml.load(data, Loader=self.yload)
+            except yaml.YAMLError as e:
+                raise ValueError(f"{file.name} is not yaml/json") from e
 
         data = plugins.document.parsed(url=url, document=data).document
         return data
@@ -193,6 +244,15 @@ class Loader(abc.ABC):
         data = self.load(plugins, url)
         return self.parse(plugins, url, data)
 
+    def __enter__(self) -> "Loader":
+        """
+        loading a set of description documents - Loaders may share resources for the duration
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
     def __repr__(self):
         return f"{self.__class__.__qualname__}"
 
@@ -206,23 +266,219 @@ class NullLoader(Loader):
         raise NotImplementedError("load")
 
 
+class AsyncLoader(Loader):
+    """
+    Loader with an additional asynchronous interface
+
+    :meth:`~aiopenapi3.loader.AsyncLoader.prefetch` fetches the transitive closure of the description documents
+    referenced concurrently, the synchronous :meth:`~aiopenapi3.loader.Loader.load` &
+    :meth:`~aiopenapi3.loader.Loader.parse` used when resolving the references return the prefetched documents.
+    """
+
+    concurrency: int = 8
+    """the number of documents fetched concurrently"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prefetched: dict[yarl.URL, tuple[str, "JSON"]] = dict()
+        """the documents prefetched - decoded & parsed"""
+
+    @abc.abstractmethod
+    async def aload(self, plugins: Plugins, url: yarl.URL, codec: str | None = None) -> str:
+        """
+        load and decode description document - asynchronous
+
+        :param plugins: collection of `aiopenapi3.plugin.Document` plugins
+        :param url: location of the description document
+        :param codec:
+        :return: decoded data
+        """
+        raise NotImplementedError("aload")
+
+    async def aget(self, plugins: Plugins, url: yarl.URL):
+        """
+        load & parse the description document - asynchronous
+
+        :param plugins: collection of `aiopenapi3.plugin.Document` plugins
+        :param url: location of the description document
+        :return:
+        """
+        data = await self.aload(plugins, url)
+        return self.parse(plugins, url, data)
+
+    async def prefetch(self, plugins: Plugins, url: yarl.URL, data: str) -> dict[yarl.URL, tuple[str, "JSON"]]:
+        """
+        parse the root description document and fetch all description documents referenced, transitive
+
+        documents which can not be fetched are skipped, resolving the reference will raise
+
+        :param plugins: collection of `aiopenapi3.plugin.Document` plugins
+        :param url: location of the root description document
+        :param data: decoded data of the root description document
+        :return: the prefetched documents
+        """
+        self.prefetched.clear()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        seen: set[yarl.URL] = {url}
+
+        async def fetch(url: yarl.URL) -> None:
+            try:
+                async with semaphore:
+                    data = await self.aload(plugins, url)
+                document = self.parse(plugins, url, data)
+            except Exception as e:
+                log.debug(f"prefetch {url} failed {e!r}")
+                return
+            self.prefetched[url] = (data, document)
+            await asyncio.gather(*map(fetch, self.references(document, seen)))
+
+        document = self.parse(plugins, url, data)
+        self.prefetched[url] = (data, document)
+        await asyncio.gather(*map(fetch, self.references(document, seen)))
+        return self.prefetched
+
+    @staticmethod
+    def references(document: "JSON", seen: set[yarl.URL]) -> list[yarl.URL]:
+        """
+        collect the urls of the description documents referenced via $ref in a parsed document
+
+        :param document: the parsed description document
+        :param seen: urls known already - updated
+        :return: the urls not seen before
+        """
+        r = []
+        todo = [document]
+        while todo:
+            value = todo.pop()
+            if isinstance(value, dict):
+                if isinstance(ref := value.get("$ref"), str) and (urlstr := ref.partition("#")[0]):
+                    if (url := yarl.URL(urlstr)) not in seen:
+                        seen.add(url)
+                        r.append(url)
+                todo.extend(value.values())
+            elif isinstance(value, list):
+                todo.extend(value)
+        return r
+
+    def load(self, plugins: Plugins, url: yarl.URL, codec: str | None = None):
+        if (r := self.prefetched.get(url)) is not None:
+            return r[0]
+        return super().load(plugins, url, codec)
+
+    def parse(self, plugins: Plugins, url: yarl.URL, data: str):
+        if (r := self.prefetched.get(url)) is not None and r[0] is data:
+            del self.prefetched[url]
+            return r[1]
+        return super().parse(plugins, url, data)
+
+
 class WebLoader(Loader):
     """
     Loader downloads data via http/s using the supplied session_factory
+
+    Within the context of the Loader - e.g. while loading an OpenAPI object - all documents are downloaded using a
+    single session.
+
+    Using a cache_dir, the documents are stored with their ETag/Last-Modified headers, requests are conditional and
+    a 304 Not Modified response uses the cached document.
+    In offline mode, the documents are loaded from the cache_dir only.
     """
 
-    def __init__(self, baseurl: yarl.URL, session_factory=httpx.Client, yload: "YAMLLoaderType" = YAML12Loader):
+    def __init__(
+        self,
+        baseurl: yarl.URL,
+        session_factory=httpx.Client,
+        yload: "YAMLLoaderType" = CYAML12Loader,
+        cache_dir: Path | None = None,
+        offline: bool = False,
+    ):
+        """
+        :param baseurl: lookups are relative to this
+        :param session_factory: used to create the session for http/s io
+        :param yload: YAML loader to use
+        :param cache_dir: directory to cache the documents in
+        :param offline: do not use the network, load the documents from the cache_dir
+        """
         super().__init__(yload)
         assert isinstance(baseurl, yarl.URL)
+        if offline and cache_dir is None:
+            raise ValueError("offline requires a cache_dir")
         self.baseurl: yarl.URL = baseurl
         self.session_factory = session_factory
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self._session: httpx.Client | None = None
+        self._session_depth = 0
+
+    def __enter__(self) -> "WebLoader":
+        self._session_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._session_depth -= 1
+        if self._session_depth == 0 and self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _cache_path(self, url: yarl.URL) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / hashlib.sha256(str(url).encode()).hexdigest()
+
+    def _cache_lookup(self, url: yarl.URL) -> tuple[dict[str, str], bytes | None]:
+        """
+        :return: the headers for a conditional request and the cached document
+        """
+        if self.cache_dir is None:
+            return dict(), None
+        path = self._cache_path(url)
+        try:
+            meta = stdjson.loads(path.with_suffix(".json").read_text())
+            data = path.with_suffix(".body").read_bytes()
+        except (FileNotFoundError, ValueError):
+            return dict(), None
+        headers = dict()
+        if etag := meta.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := meta.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers, data
+
+    def _cache_response(self, url: yarl.URL, response: httpx.Response, cached: bytes | None) -> bytes:
+        """
+        :return: the document - from the response or the cache
+        """
+        if response.status_code == 304 and cached is not None:
+            log.debug(f"{url} not modified")
+            return cached
+        assert 200 <= response.status_code <= 299, response
+        data = response.content
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_path(url)
+            meta = {"url": str(url)} | {
+                k: v for k in ["etag", "last-modified"] if (v := response.headers.get(k)) is not None
+            }
+            _write(path.with_suffix(".body"), lambda p: p.write_bytes(data))
+            _write(path.with_suffix(".json"), lambda p: p.write_text(stdjson.dumps(meta)))
+        return data
+
+    def _fetch(self, url: yarl.URL) -> bytes:
+        headers, cached = self._cache_lookup(url)
+        if self.offline:
+            if cached is None:
+                raise FileNotFoundError(url)
+            return cached
+        if self._session_depth == 0:
+            with self:
+                return self._fetch(url)
+        if self._session is None:
+            self._session = self.session_factory()
+        response = self._session.get(str(url), headers=headers)
+        return self._cache_response(url, response, cached)
 
     def load(self, plugins: Plugins, url: yarl.URL, codec: str | None = None) -> "JSON":
         url = self.baseurl.join(url)
-        with self.session_factory() as session:
-            data = session.get(str(url))
-            assert 200 <= data.status_code <= 299, data
-            data = data.content
+        data = self._fetch(url)
         data = self.decode(data, codec)
         data = plugins.document.loaded(url=url, document=data).document
         return data
@@ -231,12 +487,71 @@ class WebLoader(Loader):
         return f"{self.__class__.__qualname__}(baseurl={self.baseurl})"
 
 
+class AsyncWebLoader(AsyncLoader, WebLoader):
+    """
+    WebLoader with concurrent prefetching using a single session of the async_session_factory
+    """
+
+    def __init__(
+        self,
+        baseurl: yarl.URL,
+        session_factory=httpx.Client,
+        yload: "YAMLLoaderType" = CYAML12Loader,
+        cache_dir: Path | None = None,
+        offline: bool = False,
+        async_session_factory=httpx.AsyncClient,
+        concurrency: int = 8,
+    ):
+        """
+        :param baseurl: lookups are relative to this
+        :param session_factory: used to load documents synchronously
+        :param yload: YAML loader to use
+        :param cache_dir: directory to cache the documents in
+        :param offline: do not use the network, load the documents from the cache_dir
+        :param async_session_factory: used to prefetch documents
+        :param concurrency: the number of documents fetched concurrently
+        """
+        super().__init__(baseurl, session_factory, yload, cache_dir, offline)
+        self.async_session_factory = async_session_factory
+        self.concurrency = concurrency
+        self._asession: httpx.AsyncClient | None = None
+
+    async def prefetch(self, plugins: Plugins, url: yarl.URL, data: str) -> dict[yarl.URL, tuple[str, "JSON"]]:
+        if self.offline:
+            return await super().prefetch(plugins, url, data)
+        async with self.async_session_factory() as self._asession:
+            try:
+                return await super().prefetch(plugins, url, data)
+            finally:
+                self._asession = None
+
+    async def _afetch(self, url: yarl.URL) -> bytes:
+        headers, cached = self._cache_lookup(url)
+        if self.offline:
+            if cached is None:
+                raise FileNotFoundError(url)
+            return cached
+        if self._asession is None:
+            async with self.async_session_factory() as session:
+                response = await session.get(str(url), headers=headers)
+        else:
+            response = await self._asession.get(str(url), headers=headers)
+        return self._cache_response(url, response, cached)
+
+    async def aload(self, plugins: Plugins, url: yarl.URL, codec: str | None = None) -> str:
+        url = self.baseurl.join(url)
+        data = await self._afetch(url)
+        data = self.decode(data, codec)
+        data = plugins.document.loaded(url=url, document=data).document
+        return data
+
+
 class FileSystemLoader(Loader):
     """
     Loader to use the local filesystem
     """
 
-    def __init__(self, base: Path, yload: "YAMLLoaderType" = YAML12Loader):
+    def __init__(self, base: Path, yload: "YAMLLoaderType" = CYAML12Loader):
         """
         :param base: basedir - lookups are relative to this
         :param yload:
@@ -262,6 +577,24 @@ class FileSystemLoader(Loader):
         return f"{self.__class__.__qualname__}(base={self.base})"
 
 
+class AsyncFileSystemLoader(AsyncLoader, FileSystemLoader):
+    """
+    FileSystemLoader with concurrent prefetching, the files are read in threads
+    """
+
+    def __init__(self, base: Path, yload: "YAMLLoaderType" = CYAML12Loader, concurrency: int = 8):
+        """
+        :param base: basedir - lookups are relative to this
+        :param yload: YAML loader to use
+        :param concurrency: the number of documents fetched concurrently
+        """
+        super().__init__(base, yload)
+        self.concurrency = concurrency
+
+    async def aload(self, plugins: Plugins, url: yarl.URL, codec: str | None = None) -> str:
+        return await asyncio.to_thread(FileSystemLoader.load, self, plugins, url, codec)
+
+
 class RedirectLoader(FileSystemLoader):
     """
     Loader to redirect web-requests to a local directory
@@ -277,7 +610,7 @@ class ChainLoader(Loader):
     Loader to chain different Loaders: succeed or raise trying
     """
 
-    def __init__(self, *loaders, yload: "YAMLLoaderType" = YAML12Loader):
+    def __init__(self, *loaders, yload: "YAMLLoaderType" = CYAML12Loader):
         """
 
         :param loaders: loaders to use
@@ -286,6 +619,15 @@ class ChainLoader(Loader):
         Loader.__init__(self, yload)
         self.loaders = loaders
 
+    def __enter__(self) -> "ChainLoader":
+        for i in self.loaders:
+            i.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        for i in reversed(self.loaders):
+            i.__exit__(exc_type, exc_value, traceback)
+
     def load(self, plugins: "Plugins", url: yarl.URL, codec: str | None = None):
         log.debug(f"load {url}")
         errors = []
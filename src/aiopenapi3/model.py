@@ -1,5 +1,6 @@
 import collections
 import dataclasses
+import functools
 import inspect
 import logging
 import re
@@ -79,8 +80,74 @@ def class_from_schema(s, _type):
 import pydantic_core
 
 
+@functools.cache
+def pattern_of(pattern: str) -> str | re.Pattern[str]:
+    """
+    the pattern constraint of a field - pydantic-core's rust regex engine if it supports the pattern,
+    the compiled pattern - validating the field using python's re - otherwise
+
+    e.g. rust regex does not support look-around and backreferences
+    """
+    try:
+        pydantic_core.SchemaValidator(pydantic_core.core_schema.str_schema(pattern=pattern))
+    except pydantic_core.SchemaError:
+        return re.compile(pattern)
+    return pattern
+
+
+@functools.cache
+def patterns_compile(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    return tuple(map(re.compile, patterns))
+
+
+def patternProperty(patterns: tuple[str, ...]):
+    """
+    the aio3_patternProperty method of a model with patternProperties, the patterns are the Literal of item
+    """
+    compiled = dict(zip(patterns, patterns_compile(patterns)))
+
+    def get_patternProperty(self_, item):
+        pattern = compiled.get(item) or re.compile(item)
+        for name, value in self_.model_extra.items():
+            if pattern.match(name):
+                yield name, value
+
+    get_patternProperty.__annotations__["item"] = Literal[patterns]
+    return get_patternProperty
+
+
+def get_patternProperties(self_):
+    patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
+    r = {k: list() for k in patterns}
+    compiled = patterns_compile(patterns)
+    for name, value in self_.model_extra.items():
+        for pattern, regex in zip(patterns, compiled):
+            if regex.match(name):
+                r[pattern].append((name, value))
+                break
+            else:
+                # unmatched …
+                pass
+    return r
+
+
+def validate_patternProperties(self_):
+    compiled = patterns_compile(typing.get_args(self_.aio3_patternProperty.__annotations__["item"]))
+    for name, value in self_.model_extra.items():
+        for regex in compiled:
+            if regex.match(name):
+                break
+        else:
+            raise ValueError(f"unmatched property {name}")
+    return self_
+
+
+def get_additionalProperties(x):
+    return x.model_extra
+
+
 class ConfiguredRootModel(RootModel):
-    model_config = ConfigDict(regex_engine="python-re")
+    model_config = ConfigDict(regex_engine="rust-regex")
 
 
 def is_basemodel(m) -> bool:
@@ -366,6 +433,8 @@ class Model:  # (BaseModel):
                     classinfo.root = Annotated[
                         Union[t], Field(discriminator=Model.nameof(schema.discriminator.propertyName))
                     ]
+                elif (discriminator := Model.discriminatorof(t)) is not None:
+                    classinfo.root = Annotated[Union[t], Field(discriminator=discriminator)]
                 else:
                     if len(t):
                         classinfo.root = Union[t]
@@ -384,6 +453,8 @@ class Model:  # (BaseModel):
                     classinfo.root = Annotated[
                         Union[t], Field(discriminator=Model.nameof(schema.discriminator.propertyName))
                     ]
+                elif (discriminator := Model.discriminatorof(t)) is not None:
+                    classinfo.root = Annotated[Union[t], Field(discriminator=discriminator)]
                 else:
                     if len(t):
                         classinfo.root = Union[t]
@@ -392,58 +463,15 @@ class Model:  # (BaseModel):
                 classinfo._createAnnotations(schema, _type, discriminators, schemanames, fwdref=True, overwrite=True)
                 classinfo.createFields(schema, overwrite=True)
                 if "patternProperties" in schema.model_fields_set:
-
-                    def mkx():
-                        def get_patternProperty(self_, item):
-                            patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
-
-                            for name, value in self_.model_extra.items():
-                                if re.match(item, name):
-                                    yield name, value
-
-                        get_patternProperty.__annotations__["item"] = Literal[
-                            tuple(sorted(schema.patternProperties.keys()))
-                        ]
-                        return get_patternProperty
-
-                    classinfo.properties["aio3_patternProperty"].default = mkx()
-
-                    def mkx():
-                        def get_patternProperties(self_):
-                            patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
-                            r = {k: list() for k in patterns}
-                            for name, value in self_.model_extra.items():
-                                for pattern in patterns:
-                                    if re.match(pattern, name):
-                                        r[pattern].append((name, value))
-                                        break
-                                    else:
-                                        # unmatched …
-                                        pass
-                            return r
-
-                        return get_patternProperties
-
-                    classinfo.properties["aio3_patternProperties"].default = property(mkx())
+                    classinfo.properties["aio3_patternProperty"].default = patternProperty(
+                        tuple(sorted(schema.patternProperties.keys()))
+                    )
+                    classinfo.properties["aio3_patternProperties"].default = property(get_patternProperties)
 
                     if Model.booleanFalse(schema.additionalProperties):
-
-                        def mkx():
-                            def validate_patternProperties(self_):
-                                patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
-                                for name, value in self_.model_extra.items():
-                                    for pattern in patterns:
-                                        if re.match(pattern, name):
-                                            break
-                                    else:
-                                        raise ValueError(f"unmatched property {name}")
-                                return self_
-
-                            return validate_patternProperties
-
                         classinfo.properties["aio3_validate_patternProperties"].default = pydantic.model_validator(
                             mode="after"
-                        )(mkx())
+                        )(validate_patternProperties)
 
                 if schema.allOf:
                     for i in schema.allOf:
@@ -471,14 +499,7 @@ class Model:  # (BaseModel):
         classinfo.config = Model.createConfigDict(schema)
 
         if classinfo.config["extra"] == "allow" and classinfo.root is None:
-
-            def mkx():
-                def get_additionalProperties(x):
-                    return x.model_extra
-
-                return get_additionalProperties, None, None
-
-            classinfo.properties["aio3_additionalProperties"].default = property(mkx()[0])
+            classinfo.properties["aio3_additionalProperties"].default = property(get_additionalProperties)
 
         classinfo.validate()
         return classinfo
@@ -512,13 +533,15 @@ class Model:  # (BaseModel):
         if getattr(schema, "patternProperties", None):
             extra_ = "allow"
 
-        return ConfigDict(
+        config = ConfigDict(
             extra=extra_,
             arbitrary_types_allowed=arbitrary_types_allowed_,
-            regex_engine="python-re",
-            # defer_build=True,
+            regex_engine="rust-regex",
             # validate_assignment=True
         )
+        if schema._defer_build:
+            config["defer_build"] = True
+        return config
 
     @staticmethod
     def createAnnotation(
@@ -781,10 +804,37 @@ class Model:  # (BaseModel):
                 "pattern": "pattern",
             }.items():
                 if (v := getattr(schema, k, None)) is not None:
-                    args[m] = v
+                    args[m] = pattern_of(v) if k == "pattern" else v
 
         return Field(**args)
 
+    @staticmethod
+    def discriminatorof(types: tuple[type, ...]) -> str | None:
+        """
+        infer the discriminator of a union without discriminator mapping
+
+        a property required by all members, the const/enum of the property - Literal - distinguishes the members
+
+        :param types: the members of the union
+        :return: the name of the field, None if there is no such field
+        """
+        if len(types) < 2 or not all(is_basemodel(i) and not issubclass(i, RootModel) for i in types):
+            return None
+
+        for name, field in types[0].model_fields.items():
+            values: set[Any] = set()
+            for i in types:
+                if (f := i.model_fields.get(name)) is None or not f.is_required():
+                    break
+                if typing.get_origin(f.annotation) != Literal:
+                    break
+                if values & (v := set(typing.get_args(f.annotation))):
+                    break
+                values |= v
+            else:
+                return name
+        return None
+
     @staticmethod
     def nameof(name: str, args=None):
         """
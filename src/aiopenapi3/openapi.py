@@ -1,11 +1,18 @@
 import typing
 
-from typing import Any, Union, cast, Optional, ForwardRef
-from collections.abc import Callable
+from typing import Any, Literal, Union, cast, Optional, ForwardRef
+from collections.abc import Callable, Iterable
 import logging
+import concurrent.futures
 import copy
+import hashlib
+import importlib.util
+import json
 import pickle
 import random
+import sys
+import threading
+from types import ModuleType
 
 import pathlib
 
@@ -15,24 +22,27 @@ from typing import TypeGuard
 
 import httpx
 import yarl
-from pydantic import BaseModel
+import pydantic
+from pydantic import BaseModel, RootModel
 
 from aiopenapi3.v30.general import Reference
 import aiopenapi3.request
-from .json import JSONReference
+from .json import JSONReference, JSONPointer
 from . import v20
 from . import v30
 from . import v31
 from . import v32
 from . import log
+from .version import __version__
 from .request import OperationIndex, HTTP_METHODS
 from .errors import ReferenceResolutionError, HTTPClientError, HTTPServerError
-from .loader import Loader, NullLoader
+from .loader import Loader, NullLoader, AsyncLoader, _write
 from .plugin import Plugin, Plugins
-from .base import RootBase, ReferenceBase, SchemaBase, DiscriminatorBase
+from .base import RootBase, ReferenceBase, SchemaBase, SchemaStructures, DiscriminatorBase, PathsBase
 from .request import RequestBase
 from .v30.paths import Operation
 from .model import is_basemodel, Model
+from .construct import construct
 
 
 if typing.TYPE_CHECKING:
@@ -45,6 +55,8 @@ if typing.TYPE_CHECKING:
         RequestType,
         HTTPMethodType,
         ServerType,
+        RequestParameters,
+        RequestData,
     )
 
 
@@ -63,8 +75,26 @@ def is_schema(v: tuple[str, "SchemaType"]) -> TypeGuard["SchemaType"]:
     return isinstance(v[1], (v20.Schema, v30.Schema, v31.Schema))
 
 
+def _deferred_rebuild(model: type[BaseModel], types: dict[str, Any]) -> Callable[..., bool | None]:
+    """
+    defer_build - model_rebuild of the model, resolving the forward references using the models created
+    """
+    rebuild = model.model_rebuild.__func__  # type: ignore[attr-defined]
+
+    def model_rebuild(cls: type[BaseModel], **kwargs: Any) -> bool | None:
+        if kwargs.get("_types_namespace") is None:
+            kwargs["_types_namespace"] = {"__types": types}
+        return rebuild(cls, **kwargs)
+
+    return model_rebuild
+
+
 class OpenAPI:
     log = logging.getLogger("aiopenapi3.OpenAPI")
+    _cache_failed: set[pathlib.Path] = set()
+    """
+    cache_dir - the manifests which could not be written, warned about already
+    """
     #    _root: Union[v20.Root, v30.Root, v31.Root] | None
     _root: "RootType"
 
@@ -96,6 +126,12 @@ class OpenAPI:
         loader: Loader | None = None,
         plugins: list[Plugin] | None = None,
         use_operation_tags: bool = False,
+        *,
+        lazy_types: bool = False,
+        cache_dir: pathlib.Path | None = None,
+        trusted: bool = False,
+        shared_types: bool = False,
+        defer_build: bool = False,
     ) -> "OpenAPI":
         """
         Create a synchronous OpenAPI object from a description document.
@@ -105,11 +141,28 @@ class OpenAPI:
         :param loader: the backend to access referenced description documents
         :param plugins: potions to cure defects in the description document or requests/responses
         :param use_operation_tags: honor tags
+        :param lazy_types: create the models of an operation when creating the first Request for the operation
+        :param cache_dir: directory to cache the OpenAPI object and the models in
+        :param trusted: the description documents were validated before - create the objects without validation
+        :param shared_types: share the models of structurally identical schemas
+        :param defer_build: build the validator of a model on first use instead of creating all validators
         """
 
         with session_factory() as client:
             resp = client.get(url)
-        return cls._load_response(url, resp, session_factory, loader, plugins, use_operation_tags)
+        return cls._load_response(
+            url,
+            resp,
+            session_factory,
+            loader,
+            plugins,
+            use_operation_tags,
+            lazy_types=lazy_types,
+            cache_dir=cache_dir,
+            trusted=trusted,
+            shared_types=shared_types,
+            defer_build=defer_build,
+        )
 
     @classmethod
     async def load_async(
@@ -119,25 +172,96 @@ class OpenAPI:
         loader: Loader | None = None,
         plugins: list[Plugin] | None = None,
         use_operation_tags: bool = False,
+        *,
+        lazy_types: bool = False,
+        cache_dir: pathlib.Path | None = None,
+        trusted: bool = False,
+        shared_types: bool = False,
+        defer_build: bool = False,
     ) -> "OpenAPI":
         """
         Create an asynchronous OpenAPI object from a description document.
 
         :param url: the url of the description document
         :param session_factory: used to create the session for http/s io
-        :param loader: the backend to access referenced description documents
+        :param loader: the backend to access referenced description documents, an
+            :class:`~aiopenapi3.loader.AsyncLoader` prefetches the referenced description documents concurrently
         :param plugins: potions to cure defects in the description document or requests/responses
         :param use_operation_tags: honor tags
+        :param lazy_types: create the models of an operation when creating the first Request for the operation
+        :param cache_dir: directory to cache the OpenAPI object and the models in
+        :param trusted: the description documents were validated before - create the objects without validation
+        :param shared_types: share the models of structurally identical schemas
+        :param defer_build: build the validator of a model on first use instead of creating all validators
         """
         async with session_factory() as client:
             resp = await client.get(url)
-        return cls._load_response(url, resp, session_factory, loader, plugins, use_operation_tags)
+
+        if not isinstance(loader, AsyncLoader) or resp.is_redirect:
+            return cls._load_response(
+                url,
+                resp,
+                session_factory,
+                loader,
+                plugins,
+                use_operation_tags,
+                lazy_types=lazy_types,
+                cache_dir=cache_dir,
+                trusted=trusted,
+                shared_types=shared_types,
+                defer_build=defer_build,
+            )
+
+        data = resp.text
+        await loader.prefetch(Plugins(plugins or []), yarl.URL(url), data)
+        try:
+            return cls.loads(
+                url,
+                data,
+                session_factory,
+                loader,
+                plugins,
+                use_operation_tags,
+                lazy_types=lazy_types,
+                cache_dir=cache_dir,
+                trusted=trusted,
+                shared_types=shared_types,
+                defer_build=defer_build,
+            )
+        finally:
+            loader.prefetched.clear()
 
     @classmethod
-    def _load_response(cls, url, resp, session_factory, loader, plugins, tags):
+    def _load_response(
+        cls,
+        url,
+        resp,
+        session_factory,
+        loader,
+        plugins,
+        tags,
+        *,
+        lazy_types,
+        cache_dir,
+        trusted,
+        shared_types,
+        defer_build,
+    ):
         if resp.is_redirect:
             raise ValueError(f"Redirect to {resp.headers.get('Location', '')}")
-        return cls.loads(url, resp.text, session_factory, loader, plugins, tags)
+        return cls.loads(
+            url,
+            resp.text,
+            session_factory,
+            loader,
+            plugins,
+            tags,
+            lazy_types=lazy_types,
+            cache_dir=cache_dir,
+            trusted=trusted,
+            shared_types=shared_types,
+            defer_build=defer_build,
+        )
 
     @classmethod
     def load_file(
@@ -148,6 +272,12 @@ class OpenAPI:
         loader: Loader | None = None,
         plugins: list[Plugin] | None = None,
         use_operation_tags: bool = False,
+        *,
+        lazy_types: bool = False,
+        cache_dir: pathlib.Path | None = None,
+        trusted: bool = False,
+        shared_types: bool = False,
+        defer_build: bool = False,
     ) -> "OpenAPI":
         """
         Create an OpenAPI object from a description document file.
@@ -173,14 +303,32 @@ class OpenAPI:
         :param loader: the backend to access referenced description documents
         :param plugins: potions to cure defects in the description document or requests/responses
         :param use_operation_tags: honor tags
+        :param lazy_types: create the models of an operation when creating the first Request for the operation
+        :param cache_dir: directory to cache the OpenAPI object and the models in
+        :param trusted: the description documents were validated before - create the objects without validation
+        :param shared_types: share the models of structurally identical schemas
+        :param defer_build: build the validator of a model on first use instead of creating all validators
 
 
         """
         assert loader
         if not isinstance(path, yarl.URL):
             path = yarl.URL(str(path))
-        data = loader.load(Plugins(plugins or []), path)
-        return cls.loads(url, data, session_factory, loader, plugins, use_operation_tags)
+        with loader:
+            data = loader.load(Plugins(plugins or []), path)
+            return cls.loads(
+                url,
+                data,
+                session_factory,
+                loader,
+                plugins,
+                use_operation_tags,
+                lazy_types=lazy_types,
+                cache_dir=cache_dir,
+                trusted=trusted,
+                shared_types=shared_types,
+                defer_build=defer_build,
+            )
 
     @classmethod
     def loads(
@@ -191,6 +339,12 @@ class OpenAPI:
         loader: Loader | None = None,
         plugins: list[Plugin] | None = None,
         use_operation_tags: bool = False,
+        *,
+        lazy_types: bool = False,
+        cache_dir: pathlib.Path | None = None,
+        trusted: bool = False,
+        shared_types: bool = False,
+        defer_build: bool = False,
     ) -> "OpenAPI":
         """
 
@@ -200,38 +354,186 @@ class OpenAPI:
         :param loader: the backend to access referenced description documents
         :param plugins: potions to cure defects in the description document or requests/responses
         :param use_operation_tags: honor tags
+        :param lazy_types: create the models of an operation when creating the first Request for the operation
+        :param cache_dir: directory to cache the OpenAPI object and the models in
+        :param trusted: the description documents were validated before - create the objects without validation
+        :param shared_types: share the models of structurally identical schemas
+        :param defer_build: build the validator of a model on first use instead of creating all validators
         """
         if loader is None:
             loader = NullLoader()
-        data = loader.parse(Plugins(plugins or []), yarl.URL(url), data)
-        return cls(url, data, session_factory, loader, plugins, use_operation_tags)
+        with loader:
+            if cache_dir is not None:
+                return cls._loads_cache(
+                    url,
+                    data,
+                    session_factory,
+                    loader,
+                    plugins,
+                    use_operation_tags,
+                    lazy_types=lazy_types,
+                    cache_dir=cache_dir,
+                    trusted=trusted,
+                    shared_types=shared_types,
+                    defer_build=defer_build,
+                )
+            data = loader.parse(Plugins(plugins or []), yarl.URL(url), data)
+            return cls(
+                url,
+                data,
+                session_factory,
+                loader,
+                plugins,
+                use_operation_tags,
+                lazy_types=lazy_types,
+                trusted=trusted,
+                shared_types=shared_types,
+                defer_build=defer_build,
+            )
 
     @classmethod
-    def _parse_obj(cls, document: "JSON") -> "RootType":
+    def _loads_cache(
+        cls,
+        url,
+        data,
+        session_factory,
+        loader,
+        plugins,
+        use_operation_tags,
+        *,
+        lazy_types,
+        cache_dir,
+        trusted,
+        shared_types,
+        defer_build,
+    ) -> "OpenAPI":
+        """
+        load the OpenAPI object and the models from cache_dir, on a miss create the OpenAPI object and store it
+
+        the key is the hash of the description documents, the plugins, the arguments and the versions of
+        aiopenapi3 & pydantic, the manifest - keyed by the root document - lists the documents referenced
+        on a hit, the documents referenced are loaded using the loader to verify their hash
+        """
+        plugins_ = Plugins(plugins or [])
+        key = hashlib.sha256()
+        for i in [
+            __version__,
+            pydantic.VERSION,
+            url,
+            use_operation_tags,
+            lazy_types,
+            shared_types,
+            defer_build,
+            *(f"{type(p).__module__}.{type(p).__qualname__}" for p in plugins or []),
+        ]:
+            key.update(f"{i}\0".encode())
+        key.update(cls._cache_digest(data).encode())
+        manifest = cache_dir / f"{key.hexdigest()}.json"
+
+        def cache_path(documents: dict[str, str]) -> pathlib.Path:
+            k = key.copy()
+            for name, digest in documents.items():
+                k.update(f"{name}\0{digest}\0".encode())
+            return cache_dir / f"{k.hexdigest()}.pickle"
+
+        try:
+            documents = json.loads(manifest.read_text())
+            for name, digest in documents.items():
+                if cls._cache_digest(loader.load(plugins_, yarl.URL(name))) != digest:
+                    raise FileNotFoundError(name)
+            path = cache_path(documents)
+            api = cls.cache_load(path, plugins, session_factory, types=cls._cache_import(path.with_suffix(".py")))
+            api.loader = loader
+            return api
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.getLogger("aiopenapi3.OpenAPI").warning(f"cache {manifest} not usable: {e!r}")
+
+        data = loader.parse(plugins_, yarl.URL(url), data)
+        api = cls(
+            url,
+            data,
+            session_factory,
+            loader,
+            plugins,
+            use_operation_tags,
+            lazy_types=lazy_types,
+            trusted=trusted,
+            shared_types=shared_types,
+            defer_build=defer_build,
+        )
+        documents = {str(k): v for k, v in api._documents_digest.items()}
+        path = cache_path(documents)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _write(path.with_suffix(".py"), api.types_store)
+            _write(path, api.cache_store)
+            _write(manifest, lambda p: p.write_text(json.dumps(documents)))
+        except Exception as e:
+            # the cache is not populated - each load creates the models, warn once
+            if manifest not in cls._cache_failed:
+                cls._cache_failed.add(manifest)
+                api.log.warning(f"cache {manifest} not written: {e!r}")
+            else:
+                api.log.debug(f"cache {manifest} not written: {e!r}")
+        return api
+
+    @staticmethod
+    def _cache_digest(data: str) -> str:
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    @staticmethod
+    def _cache_import(path: pathlib.Path) -> ModuleType:
+        name = f"aiopenapi3_cache_{path.stem}"
+        if (module := sys.modules.get(name)) is None:
+            if not path.exists():
+                raise FileNotFoundError(path)
+            spec = importlib.util.spec_from_file_location(name, path)
+            assert spec and spec.loader
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[name]
+                raise
+        return module
+
+    @classmethod
+    def _parse_obj(cls, document: "JSON", trusted: bool = False) -> "RootType":
+        """
+        :param document: the description document
+        :param trusted: the description document was validated before - create the objects without validation
+        """
         document = cast(dict[str, Any], document)
+        root: type["RootType"]
         if (version := document.get("openapi", None)) is not None:
             v = list(map(int, version.split(".")))
             if v[0] == 3:
                 if v[1] == 0:
-                    return v30.Root.model_validate(document)
+                    root = v30.Root
                 elif v[1] == 1:
-                    return v31.Root.model_validate(document)
+                    root = v31.Root
                 elif v[1] == 2:
-                    return v32.Root.model_validate(document)
+                    root = v32.Root
                 else:
                     raise ValueError(f"openapi version 3.{v[1]} not supported")
             else:
                 raise ValueError(f"openapi major version {version} not supported")
-
-        if (version := document.get("swagger", None)) is not None:
+        elif (version := document.get("swagger", None)) is not None:
             v = list(map(int, version.split(".")))
             if v[0] == 2 and v[1] == 0:
-                return v20.Root.model_validate(document)
+                root = v20.Root
             else:
                 raise ValueError(f"swagger version {version} not supported")
         else:
             raise ValueError("missing openapi/swagger field")
 
+        if trusted:
+            return construct(root, document)
+        return root.model_validate(document)
+
     def __init__(
         self,
         url: str,
@@ -240,6 +542,11 @@ class OpenAPI:
         loader: Loader | None = None,
         plugins: list[Plugin] | None = None,
         use_operation_tags: bool = True,
+        *,
+        lazy_types: bool = False,
+        trusted: bool = False,
+        shared_types: bool = False,
+        defer_build: bool = False,
     ) -> None:
         """
         Creates a new OpenAPI document from a loaded spec file.  This is
@@ -252,6 +559,10 @@ class OpenAPI:
         :param loader: the Loader for the description document(s)
         :param plugins: list of plugins
         :param use_operation_tags: honor tags
+        :param lazy_types: create the models of an operation when creating the first Request for the operation
+        :param trusted: the description documents were validated before - create the objects without validation
+        :param shared_types: share the models of structurally identical schemas
+        :param defer_build: build the validator of a model on first use instead of creating all validators
         """
         self._base_url: yarl.URL = yarl.URL(url)
 
@@ -280,6 +591,26 @@ class OpenAPI:
         Raise for http status code
         """
 
+        self.validation: Literal["full", "construct", "none"] = "full"
+        """
+        the validation of response bodies - c.f. :attr:`aiopenapi3.request.RequestBase.validation`
+
+        * full - validate
+        * construct - create the models without validation
+        * none - the JSON document decoded
+        """
+
+        self.executor: concurrent.futures.Executor | None = None
+        """
+        the executor to decode & validate the response bodies of asyncio requests,
+        None to process the response bodies on the event loop - c.f. :attr:`aiopenapi3.request.RequestBase.executor`
+        """
+
+        self.executor_threshold: int = 256 * 1024
+        """
+        the minimum size of a response body processed using the executor
+        """
+
         self._security: dict[str, tuple[str]] = dict()
         """
         authorization informations
@@ -291,6 +622,11 @@ class OpenAPI:
         the related documents
         """
 
+        self._documents_digest: dict[yarl.URL, str] = dict()
+        """
+        the hash of the referenced documents loaded - used as cache key
+        """
+
         self._server_variables: dict[str, str] = dict()
         """
         server variable mapping
@@ -298,6 +634,43 @@ class OpenAPI:
 
         self._server_select: Callable[[list["ServerType"]], "ServerType"] = random.choice
 
+        self._sessions: dict[Any, httpx.Client | httpx.AsyncClient] | None = None
+        """
+        managed sessions, keyed by client certificate - None unless in managed session mode
+        """
+
+        self._sessions_lock: threading.Lock | None = None
+
+        self._types: dict[str, ForwardRef | type[BaseModel] | type[int] | type[str] | type[float] | type[bool]] = dict()
+        """
+        the models created, the namespace to resolve the forward references of the models
+        """
+
+        self._types_lazy: set[tuple[str, str]] | None = set() if lazy_types else None
+        """
+        lazy_types - the operations (path, method) the models were created for already
+        """
+
+        self._types_lock: threading.Lock = threading.Lock()
+        """
+        lazy_types - serializes creating the models of operations used by multiple threads
+        """
+
+        self._trusted: bool = trusted
+        """
+        create the objects of the description documents without validation
+        """
+
+        self._structures: SchemaStructures | None = SchemaStructures() if shared_types else None
+        """
+        shared_types - the models by structure, shared by the Schemas
+        """
+
+        self._defer_build: bool = defer_build
+        """
+        the validators of the models are built on first use
+        """
+
         self._init_plugins(plugins)
         """
         the plugin interface allows taking care of defects in description documents and implementations
@@ -309,7 +682,7 @@ class OpenAPI:
         """
         Document Plugins get called via OpenAPI.load… - this is processed already
         """
-        self._root = self._parse_obj(document)
+        self._root = self._parse_obj(document, trusted)
         if isinstance(self._root, v32.Root) and self._root.self_:
             docref = yarl.URL(str(self._root.self_))
         else:
@@ -319,8 +692,12 @@ class OpenAPI:
 
         self._init_session_factory(session_factory)
         self._init_references()
+        self._init_schema_locations()
         only_required = self._init_operationindex(use_operation_tags)
-        self._init_schema_types(only_required)
+        if self._types_lazy is None:
+            self._init_schema_types(only_required)
+        else:
+            self._init_schema_types_lazy(only_required)
 
         self.plugins.init.initialized(initialized=self._root)
 
@@ -352,31 +729,79 @@ class OpenAPI:
             raise ValueError("invalid return value annotation for session_factory")
 
     def _init_references(self):
-        self._root._resolve_references(self)
-
-        processed = set()
-        while True:
-            values = {id(x): x for x in self._documents.values()}
-            names = {id(v): k for k, v in self._documents.items()}
-            todo = set(values.keys()) - processed
-            if not todo:
-                break
-            for i in todo:
-                #                print(names[i])
-                try:
-                    values[i]._resolve_references(self)
-                except ReferenceResolutionError as e:
-                    e.document = names[i]
-                    raise
-            processed = set(values.keys())
+        sites = self._root._resolve_references(self)
+
+        # in order of the documents - the documents loaded and identities derived are deterministic
+        # resolving the references may load additional documents
+        # the root document is resolved twice, the second time the sites of the first walk are sufficient
+        # each document is walked once to find the sites, c.f. RootBase.resolve
+        processed: set[int] = set()
+        documents = list(self._documents.items())
+        idx = 0
+        while idx < len(documents):
+            name, document = documents[idx]
+            idx += 1
+            if id(document) in processed:
+                continue
+            processed.add(id(document))
+            try:
+                document._resolve_references(self, sites if document is self._root else None)
+            except ReferenceResolutionError as e:
+                e.document = name
+                raise
+            if len(self._documents) > len(documents):
+                documents.extend(list(self._documents.items())[len(documents) :])
         return
 
-    #        for i in self._documents.values():
-    #            i._resolve_references(self)
+    def _jp_cache_invalidate(self, name: str) -> None:
+        """
+        plugins may modify the documents - the JSON Pointers resolved may be outdated
+
+        :param name: the name of the Init plugin method called
+        """
+        if not self.plugins.init.implements(name):
+            return
+        for document in self._documents.values():
+            document._jp_cache.clear()
+
+    def _init_schema_locations(self) -> None:
+        """
+        assign the location - document and JSON Pointer - to the Schemas of the documents
+        the identity of a Schema without name is derived from the location
+        """
+        identities: set[str] = set()
+        for url, document in self._documents.items():
+            prefix = "" if document is self._root else url.name
+            todo: list[tuple[Any, str]] = [(document, "")]
+            while todo:
+                obj, pointer = todo.pop()
+                if isinstance(obj, BaseModel):
+                    if isinstance(obj, ReferenceBase):
+                        continue
+                    if isinstance(obj, SchemaBase):
+                        obj._location = f"{prefix}#{pointer}"
+                        obj._identities = identities
+                        obj._structures = self._structures
+                        obj._defer_build = self._defer_build
+                    if isinstance(obj, RootModel):
+                        todo.append((obj.root, pointer))
+                        continue
+                    for name, field in type(obj).model_fields.items():
+                        if name == "extensions" or (value := getattr(obj, name)) is None:
+                            continue
+                        if isinstance(obj, PathsBase) and name == "paths":
+                            todo.append((value, pointer))
+                        else:
+                            todo.append((value, f"{pointer}/{JSONPointer.encode(field.alias or name)}"))
+                elif isinstance(obj, dict):
+                    todo.extend((v, f"{pointer}/{JSONPointer.encode(str(k))}") for k, v in obj.items())
+                elif isinstance(obj, list):
+                    todo.extend((v, f"{pointer}/{i}") for i, v in enumerate(obj))
 
     def _init_operationindex(self, use_operation_tags: bool) -> bool:
         if (p := self.plugins.init.paths(initialized=self._root, paths=self.paths).paths) is not None:
             self._root.paths = p
+        self._jp_cache_invalidate("paths")
 
         if isinstance(self._root, v20.Root):
             if self.paths:
@@ -511,17 +936,7 @@ class OpenAPI:
                 for path, obj in (self.paths or dict()).items():
                     for m in obj.model_fields_set & HTTP_METHODS:
                         op = getattr(obj, m)
-
-                        for r, response in op.responses.items():
-                            if isinstance(response, ReferenceBase):
-                                response = response._target
-                            if isinstance(response, (v20.paths.Response)):
-                                if isinstance(response.schema_, (v20.Schema, v31.Schema)):
-                                    name = response.schema_._get_identity("PI", f"{path}.{m}.{r}")
-                                    # assert byname.get(name, None) in [None, response.schema_]
-                                    byname[name] = response.schema_
-                            else:
-                                raise TypeError(f"{type(response)} at {path}")
+                        self._init_schema_types_collect_operation(byname, path, m, obj, op)
 
             # Response
             for byid in map(lambda x: x.responses, documents):
@@ -549,51 +964,7 @@ class OpenAPI:
             for path, obj in (self.paths or dict()).items():
                 for m in obj.model_fields_set & HTTP_METHODS:
                     op = getattr(obj, m)
-
-                    for parameter in op.parameters + obj.parameters:
-                        if parameter.schema_:
-                            if isinstance(parameter.schema_, ReferenceBase):
-                                schema = parameter.schema_._target
-                            else:
-                                schema = parameter.schema_
-                            # assert schema is not None
-                            name = schema._get_identity("I2", f"{path}.{m}.{parameter.name}")
-                            # assert byname.get(name, None) in [None, schema]
-                            byname[name] = schema
-                        else:
-                            for key, mto in parameter.content.items():
-                                if isinstance(mto.schema_, ReferenceBase):
-                                    schema = mto.schema_._target
-                                else:
-                                    schema = mto.schema_
-                                # assert schema is not None
-                                name = schema._get_identity("I2", f"{path}.{m}.{parameter.name}.{key}")
-                                # assert byname.get(name, None) in [None, schema]
-                                byname[name] = schema
-
-                    if op.requestBody:
-                        for mt, mto in op.requestBody.content.items():
-                            if mto.schema_ is None:
-                                continue
-                            n = mto.schema_._get_identity("B")
-                            # assert byname.get(n, None) in [None, getattr(mto.schema_, "_target", mto.schema_)]
-                            byname[n] = mto.schema_
-
-                    for r, response in op.responses.items():
-                        if isinstance(response, ReferenceBase):
-                            response = response._target
-                        if isinstance(response, (v30.paths.Response, v31.paths.Response)):
-                            assert response.content is not None
-                            for mt, mto in response.content.items():
-                                if mto.schema_ is None:
-                                    continue
-                                name = mto.schema_._get_identity("I2", f"{path}.{m}.{r}.{mt}")
-                                # assert (v := byname.get(name, None)) in [None, mto.schema_] or type(v) != type(
-                                #    mto.schema_
-                                # ), (name, v, mto.schema_)
-                                byname[name] = mto.schema_
-                        else:
-                            raise TypeError(f"{type(response)} at {path}")
+                    self._init_schema_types_collect_operation(byname, path, m, obj, op)
 
             # Response
             if only_required is False:
@@ -608,58 +979,191 @@ class OpenAPI:
                             byname[n] = mto.schema_
 
         byname = self.plugins.init.schemas(initialized=self._root, schemas=byname).schemas
+        self._jp_cache_invalidate("schemas")
         return byname
 
+    def _init_schema_types_collect_operation(
+        self, byname: dict[str, "SchemaType"], path: str, m: str, obj: "PathItemType", op: "OperationType"
+    ) -> None:
+        """
+        collect the schemas of the parameters, body and responses of an operation
+        """
+        if isinstance(self._root, v20.Root):
+            for r, response in op.responses.items():
+                if isinstance(response, ReferenceBase):
+                    response = response._target
+                if isinstance(response, (v20.paths.Response)):
+                    if isinstance(response.schema_, (v20.Schema, v31.Schema)):
+                        name = response.schema_._get_identity("PI", f"{path}.{m}.{r}")
+                        # assert byname.get(name, None) in [None, response.schema_]
+                        byname[name] = response.schema_
+                else:
+                    raise TypeError(f"{type(response)} at {path}")
+            return
+
+        for parameter in op.parameters + obj.parameters:
+            if parameter.schema_:
+                if isinstance(parameter.schema_, ReferenceBase):
+                    schema = parameter.schema_._target
+                else:
+                    schema = parameter.schema_
+                # assert schema is not None
+                name = schema._get_identity("I2", f"{path}.{m}.{parameter.name}")
+                # assert byname.get(name, None) in [None, schema]
+                byname[name] = schema
+            else:
+                for key, mto in parameter.content.items():
+                    if isinstance(mto.schema_, ReferenceBase):
+                        schema = mto.schema_._target
+                    else:
+                        schema = mto.schema_
+                    # assert schema is not None
+                    name = schema._get_identity("I2", f"{path}.{m}.{parameter.name}.{key}")
+                    # assert byname.get(name, None) in [None, schema]
+                    byname[name] = schema
+
+        if op.requestBody:
+            for mt, mto in op.requestBody.content.items():
+                if mto.schema_ is None:
+                    continue
+                n = mto.schema_._get_identity("B")
+                # assert byname.get(n, None) in [None, getattr(mto.schema_, "_target", mto.schema_)]
+                byname[n] = mto.schema_
+
+        for r, response in op.responses.items():
+            if isinstance(response, ReferenceBase):
+                response = response._target
+            if isinstance(response, (v30.paths.Response, v31.paths.Response)):
+                assert response.content is not None
+                for mt, mto in response.content.items():
+                    if mto.schema_ is None:
+                        continue
+                    name = mto.schema_._get_identity("I2", f"{path}.{m}.{r}.{mt}")
+                    # assert (v := byname.get(name, None)) in [None, mto.schema_] or type(v) != type(
+                    #    mto.schema_
+                    # ), (name, v, mto.schema_)
+                    byname[name] = mto.schema_
+            else:
+                raise TypeError(f"{type(response)} at {path}")
+
     def _init_schema_types(self, only_required: bool) -> None:
+        byname: dict[str, "SchemaType"] = self._init_schema_types_collect(only_required)
+        self._types = dict()
+        self._init_schema_types_create(byname)
+
+    def _init_schema_types_lazy(self, only_required: bool) -> None:
+        """
+        lazy_types - assign the identities and call the Init plugins for all schemas, the models are created per
+        operation on first use
+        """
         byname: dict[str, "SchemaType"] = self._init_schema_types_collect(only_required)
         byid: dict[int, "SchemaType"] = {id(i): i for i in byname.values()}
-        data: set[int] = set(byid.keys())
-        todo: set[int] = self._iterate_schemas(byid, data, set())
-        types: dict[str, ForwardRef | type[BaseModel] | type[int] | type[str] | type[float] | type[bool]] = dict()
+        self._init_schema_types_resolved(byid, self._iterate_schemas(byid, set(byid.keys()), set()))
+
+    def _init_schema_types_operation(self, path: str, method: str, op: "OperationType") -> None:
+        """
+        lazy_types - create the models required for the operation on first use
+        only the models which were not created for other operations are created
+        """
+        assert self._types_lazy is not None
+        if (path, method) in self._types_lazy:
+            return
+        with self._types_lock:
+            if (path, method) in self._types_lazy:
+                return
+            byname: dict[str, "SchemaType"] = dict()
+            obj = self.paths[path]
+            if obj.ref:
+                obj = cast("PathItemType", cast(ReferenceBase, obj.ref)._target)
+            self._init_schema_types_collect_operation(byname, path, method, obj, op)
+            if isinstance(self._root, v20.Root):
+                for parameter in op.parameters:
+                    if getattr(parameter, "in_", None) == "body" and parameter.schema_ is not None:
+                        byname[parameter.schema_._get_identity("B")] = parameter.schema_
+            self._init_schema_types_create(byname)
+            self._types_lazy.add((path, method))
 
+    def _init_schema_types_resolved(self, byid: dict[int, "SchemaType"], schemas: set[int]) -> None:
         """
+        Init.resolved - the schemas resolved
+
         Due to Plugins (e.g. Cull/Reduce) byname may be incomplete
         """
         resolved: list["SchemaType"] = list(
-            map(lambda x: byid[x]._target if isinstance(byid[x], ReferenceBase) else byid[x], todo | data)
+            map(lambda x: byid[x]._target if isinstance(byid[x], ReferenceBase) else byid[x], schemas)
         )
         self.plugins.init.resolved(initialized=self._root, resolved=resolved)
+        self._jp_cache_invalidate("resolved")
+
+    def _init_schema_types_create(self, byname: dict[str, "SchemaType"]) -> None:
+        """
+        create the models for the schemas and the schemas reachable from them
+        models created already are re-used, the new models are rebuilt using the models created as namespace
+
+        :param byname: the schemas
+        """
+        byid: dict[int, "SchemaType"] = {id(i): i for i in byname.values()}
+        data: set[int] = set(byid.keys())
+        todo: set[int] = self._iterate_schemas(byid, data, set())
+        types = self._types
+        created: dict[str, ForwardRef | type[BaseModel] | type[int] | type[str] | type[float] | type[bool]] = dict()
+
+        if self._types_lazy is None:
+            # lazy_types - the Init plugins were called for all schemas already
+            self._init_schema_types_resolved(byid, todo | data)
 
         # print(f"{len(todo | data)} {only_required=}")
-        for i in todo | data:
-            b = byid[i]
+        # in document order - the suffixes resolving identity collisions do not depend on the order of the set
+        for b in sorted((byid[i] for i in todo | data), key=lambda x: getattr(x, "_location", None) or ""):
             name = b._get_identity("X")
+            if name in types:
+                continue
             t = b.get_type()
             # assert (v := byname.get(name, None)) in [None, b], (name, b, v)
-            types[name] = t
+            created[name] = t
             for j in b._model_types:
-                types[j.__name__] = j
+                created[j.__name__] = j
 
         # as previous .get_type() may have created new models, we need to reindex
-        for name, schema in list(types.items()):
+        for name, schema in list(created.items()):
             if not is_basemodel(schema):
                 continue
             thes = byname.get(name, None)
             if thes is not None:
                 for v in byid[id(thes)]._model_types:
-                    if v.__name__ not in types:
-                        types[v.__name__] = v
+                    if v.__name__ not in types and v.__name__ not in created:
+                        created[v.__name__] = v
+
+        types.update(created)
+
+        def rebuild(model: type[BaseModel]) -> None:
+            if self._defer_build:
+                """
+                pydantic builds the validator on first use calling model_rebuild - the models created are passed as
+                types namespace, the namespace is used for the models built as part of the validator as well
+                """
+                model.model_rebuild = classmethod(_deferred_rebuild(model, types))  # type: ignore[method-assign,assignment]
+            else:
+                model.model_rebuild(_types_namespace={"__types": types})
 
         # print(f"{len(types)}")
-        for name, schema in types.items():
+        for name, schema in created.items():
             if not is_basemodel(schema):
                 # primitive types: str, int …
                 continue
             try:
-                schema.model_rebuild(_types_namespace={"__types": types})
+                rebuild(schema)
                 thes = byname.get(name, None)
                 if thes is not None:
                     for v in byid[id(thes)]._model_types:
                         assert v.__name__ in types, v.__name__
-                        v.model_rebuild(_types_namespace={"__types": types})
+                        rebuild(v)
             except Exception as e:
                 raise e
 
+        if self._structures is not None:
+            self._structures.keys.clear()
+
     @property
     def url(self) -> yarl.URL:
         if isinstance(self._root, v20.Root):
@@ -727,11 +1231,84 @@ class OpenAPI:
             else:
                 self._security[security_scheme] = value
 
+    def open(self) -> "OpenAPI":
+        """
+        enter managed session mode
+
+        Instead of creating a new session for each request, sessions created via the session_factory are kept and
+        re-used for all requests, sharing the connection pool.
+        Sessions are keyed by the client certificate, authentication is applied per request.
+        Close the sessions using :meth:`close`/:meth:`aclose` or use the OpenAPI object as (async) context manager.
+
+        .. code:: python
+
+            with OpenAPI.load_sync(url) as api:
+                api._.listPets()
+
+        :return: the OpenAPI object
+        """
+        if self._sessions is None:
+            self._sessions_lock = threading.Lock()
+            self._sessions = dict()
+        return self
+
+    def close(self) -> None:
+        """
+        close the sessions and leave managed session mode
+
+        :raises TypeError: for asyncio sessions - use :meth:`aclose` or async with
+        """
+        if issubclass(self._createRequest, aiopenapi3.request.AsyncRequestBase):
+            raise TypeError("asyncio sessions can not be closed using close(), use aclose() or async with")
+        sessions, self._sessions = self._sessions or dict(), None
+        for session in sessions.values():
+            cast(httpx.Client, session).close()
+
+    async def aclose(self) -> None:
+        """
+        close the sessions and leave managed session mode
+
+        :raises TypeError: for sync sessions - use :meth:`close` or with
+        """
+        if not issubclass(self._createRequest, aiopenapi3.request.AsyncRequestBase):
+            raise TypeError("sync sessions can not be closed using aclose(), use close() or with")
+        sessions, self._sessions = self._sessions or dict(), None
+        for session in sessions.values():
+            await cast(httpx.AsyncClient, session).aclose()
+
+    def __enter__(self) -> "OpenAPI":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "OpenAPI":
+        return self.open()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def _session(self, args: dict[str, Any]) -> httpx.Client | httpx.AsyncClient:
+        """
+        the managed session for the client certificate, created on first use
+
+        :param args: the session_factory arguments
+        """
+        assert self._sessions is not None and self._sessions_lock is not None
+        key = args.get("cert")
+        if (session := self._sessions.get(key)) is None:
+            with self._sessions_lock:
+                if (session := self._sessions.get(key)) is None:
+                    session = self._sessions[key] = self._session_factory(**args)
+        return session
+
     def _load(self, url: yarl.URL):
         self.log.debug(f"Downloading Description Document {url} using {self.loader} …")
         assert self.loader
-        data = self.loader.get(self.plugins, url)
-        return self._parse_obj(data)
+        data = self.loader.load(self.plugins, url)
+        self._documents_digest[url] = self._cache_digest(data)
+        data = self.loader.parse(self.plugins, url, data)
+        return self._parse_obj(data, self._trusted)
 
     @property
     def _(self) -> OperationIndex:
@@ -787,6 +1364,30 @@ class OpenAPI:
         except Exception as e:
             raise aiopenapi3.errors.RequestError(operation, request, None, {}) from e
 
+    def batch(
+        self,
+        operationId: str | tuple[str, "HTTPMethodType"],
+        items: Iterable[tuple[Optional["RequestParameters"], Optional["RequestData"]]],
+        concurrency: int = 8,
+        ordered: bool = True,
+    ):
+        """
+        call an operation for many (parameters, data) with bounded concurrency
+
+        .. code:: python
+
+            async for r in api.batch("getPetById", [({"petId": i}, None) for i in range(1000)], concurrency=32):
+                if r.error is None:
+                    print(r.index, r.response.data)
+
+        :param operationId: the operationId or tuple of path & method
+        :param items: the (parameters, data) to send
+        :param concurrency: the number of requests in flight - threads for sync, tasks for async
+        :param ordered: return the results in order of the items, or as they complete
+        :return: (async) iterator of :class:`aiopenapi3.request.RequestBase.BatchResult`
+        """
+        return self._[operationId].batch(items, concurrency=concurrency, ordered=ordered)
+
     def resolve_jr(self, root: RootBase, obj, value: Reference):
         """
         Resolve a `JSON Reference<https://datatracker.ietf.org/doc/html/draft-pbryan-zyp-json-ref-03>`_ in our documents
@@ -855,6 +1456,13 @@ class OpenAPI:
         api._createRequest = self._createRequest
         api._session_factory = self._session_factory
         api.loader = self.loader
+        api._types = self._types
+        api._types_lazy = self._types_lazy
+        api._types_lock = self._types_lock
+        api._structures = self._structures
+        api.validation = self.validation
+        api.executor = self.executor
+        api.executor_threshold = self.executor_threshold
         return api
 
     def clone(self, baseurl: yarl.URL | None = None) -> "OpenAPI":
@@ -870,18 +1478,33 @@ class OpenAPI:
         return api
 
     @staticmethod
-    def cache_load(path: pathlib.Path, plugins: list[Plugin] | None = None, session_factory=None) -> "OpenAPI":
+    def cache_load(
+        path: pathlib.Path,
+        plugins: list[Plugin] | None = None,
+        session_factory=None,
+        types: ModuleType | str | None = None,
+    ) -> "OpenAPI":
         """
         read a pickle api object from path and init the schema types
 
         :param path: cache path
+        :param types: the module written along with the cache using :meth:`types_store`, attached instead of
+            creating the models
         """
         with path.open("rb") as f:
             api = pickle.load(f)
 
         api._init_plugins(plugins)
+        api._sessions = api._sessions_lock = None
+        api._types_lock = threading.Lock()
 
-        api._init_schema_types(only_required=False)
+        if types is not None:
+            api.types_load(types)
+        elif getattr(api, "_types_lazy", None) is None:
+            api._init_schema_types(only_required=False)
+        else:
+            api._types_lazy = set()
+            api._init_schema_types_lazy(only_required=False)
 
         if session_factory is not None:
             api._session_factory = session_factory
@@ -893,13 +1516,70 @@ class OpenAPI:
     def cache_store(self, path: pathlib.Path) -> None:
         """
         write the pickled api object to Path
-        to dismiss potentially local defined objects loader, plugins and the session_factory are dropped
+        to dismiss potentially local defined objects loader, plugins and the session_factory are dropped,
+        managed sessions, the executor and the models are not stored
 
         :param path: cache path
         """
 
-        restore = (self.loader, self.plugins, self._session_factory)
-        self.loader = self._session_factory = self.plugins = None  # type: ignore[assignment]
+        restore = (
+            self.loader,
+            self.plugins,
+            self._session_factory,
+            self._sessions,
+            self._sessions_lock,
+            self._types,
+            self._types_lock,
+            self.executor,
+        )
+        self.loader = self._session_factory = self.plugins = self._types_lock = None  # type: ignore[assignment]
+        self._sessions = self._sessions_lock = self.executor = None
+        self._types = dict()
         with path.open("wb") as f:
             pickle.dump(self, f)
-        self.loader, self.plugins, self._session_factory = restore
+        (
+            self.loader,
+            self.plugins,
+            self._session_factory,
+            self._sessions,
+            self._sessions_lock,
+            self._types,
+            self._types_lock,
+            self.executor,
+        ) = restore
+
+    def types_store(self, path: pathlib.Path) -> None:
+        """
+        write the models as python module to path
+        attaching the module using :meth:`types_load` replaces creating the models
+
+        the models are matched to the schemas by identity - derived from the name or the location of the schema,
+        the module can be attached to OpenAPI objects of the same description document or using :meth:`cache_load`
+        using lazy_types, the models of all schemas are created to write the module
+
+        :param path: module path
+        """
+        from .codegen import ModuleGenerator
+
+        if self._types_lazy is not None:
+            with self._types_lock:
+                self._init_schema_types_create(self._init_schema_types_collect(False))
+        path.write_text(ModuleGenerator(self).render())
+
+    def types_load(self, module: ModuleType | str) -> None:
+        """
+        attach the models of a module written using :meth:`types_store` to the schemas
+
+        :param module: the module or the name of the module
+        """
+        if isinstance(module, str):
+            module = importlib.import_module(module)
+
+        types = module.__types__
+        byid: dict[int, "SchemaType"] = {id(i): i for i in self._init_schema_types_collect(False).values()}
+        for i in self._iterate_schemas(byid, set(byid.keys()), set()):
+            if (t := types.get(identity := byid[i]._get_identity("X"))) is None:
+                raise ValueError(f"model {identity} missing in {module.__name__}")
+            byid[i]._model_type = t
+        self._types = dict(types)
+        self._types_lazy = None
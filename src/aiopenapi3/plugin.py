@@ -147,7 +147,7 @@ class Message(Plugin):
 
     def parsed(self, ctx: "Message.Context") -> "Message.Context":  # pragma: no cover
         """
-        modify the parsed dict structure
+        modify the parsed dict structure - implementing this disables validating the JSON response without decoding
         """
         return ctx  # noqa
 
@@ -159,19 +159,34 @@ class Message(Plugin):
 
 
 class Domain:
-    def __init__(self, ctx, plugins: list[Plugin]):
+    def __init__(self, ctx, plugins: list[Plugin], domain: type[Plugin] | None = None):
         self.ctx = ctx
         self.plugins = plugins
+        self.domain = domain
 
     def __getstate__(self):
-        return self.ctx, self.plugins
+        return self.ctx, self.plugins, self.domain
 
     def __setstate__(self, state):
-        self.ctx, self.plugins = state
+        self.ctx, self.plugins, self.domain = state
 
     def __getattr__(self, name: str) -> "Method":
         return Method(name, self)
 
+    def implements(self, name: str) -> bool:
+        """
+        check if any of the plugins implements the method - inheriting the no-op of the domain does not count
+
+        :param name: the name of the method
+        """
+        default = getattr(self.domain, name, None)
+        for plugin in self.plugins:
+            if (method := getattr(plugin, name, None)) is None:
+                continue
+            if getattr(method, "__func__", method) is not default:
+                return True
+        return False
+
 
 class Method:
     def __init__(self, name: str, domain: Domain):
@@ -212,7 +227,7 @@ class Plugins:
             return isinstance(p, domain)
 
         p: list[Plugin] = list(filter(domain_type_f, plugins))
-        return Domain(domain.Context, p)
+        return Domain(domain.Context, p, domain)
 
     @property
     def init(self) -> Domain:
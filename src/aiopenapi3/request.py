@@ -1,14 +1,16 @@
 import abc
+import asyncio
 import collections
+import concurrent.futures
 import contextlib
+import itertools
+import copy
 import typing
-import json
 import logging
-from contextlib import closing
-from typing import Any, NamedTuple, Optional, Union, cast
-from collections.abc import AsyncIterator, AsyncGenerator, Generator
+import time
+from typing import Any, Literal, NamedTuple, Optional, Union, cast
+from collections.abc import AsyncIterator, AsyncGenerator, Callable, Generator, Iterable
 from collections.abc import Iterator
-from contextlib import aclosing
 
 import httpx
 import pydantic
@@ -18,6 +20,8 @@ from aiopenapi3.errors import ContentLengthExceededError
 
 
 from .base import HTTP_METHODS, ReferenceBase
+from .construct import construct
+from .sse import EventStreamDecoder
 from .version import __version__
 from .errors import RequestError, OperationIdDuplicationError
 
@@ -46,6 +50,47 @@ if typing.TYPE_CHECKING:
 log = logging.getLogger("aiopenapi3.request")
 
 
+class RecordDecoder:
+    """
+    splits a byte stream into records at the separator, records may span chunks
+      * application/jsonl & application/x-ndjson - newline terminated
+      * application/json-seq - record separator (RS, 0x1E) prefixed
+    """
+
+    def __init__(self, separator: bytes) -> None:
+        self.separator = separator
+        self._pending: list[bytes] = []
+
+    def decode(self, chunk: bytes) -> list[bytes]:
+        records = chunk.split(self.separator)
+        if len(records) == 1:
+            # no separator - keep the chunk, the record is joined once it is complete
+            if chunk:
+                self._pending.append(chunk)
+            return []
+        if self._pending:
+            self._pending.append(records[0])
+            records[0] = b"".join(self._pending)
+            self._pending = []
+        if tail := records.pop():
+            self._pending.append(tail)
+        return [r for r in records if r and not r.isspace()]
+
+    def flush(self) -> list[bytes]:
+        r, self._pending = b"".join(self._pending), []
+        return [r] if r and not r.isspace() else []
+
+
+def _validate_batched(adapter: pydantic.TypeAdapter, records: list[bytes], size: int) -> Iterator[pydantic.BaseModel]:
+    """
+    validate the records in batches of size, a single call per batch
+
+    :param adapter: the TypeAdapter of the list of the model - created per call
+    """
+    for i in range(0, len(records), size):
+        yield from adapter.validate_json(b"[" + b",".join(records[i : i + size]) + b"]")
+
+
 class RequestParameter:
     def __init__(self, url: yarl.URL | str):
         self.url: str = str(url)
@@ -59,6 +104,81 @@ class RequestParameter:
         self.files: Optional["RequestFiles"] = {}  # form-data files
         self.cert: Any = None
 
+    def copy(self) -> "RequestParameter":
+        r = copy.copy(self)
+        r.cookies = self.cookies.copy()
+        r.params = self.params.copy()
+        r.headers = self.headers.copy()
+        r.data = self.data.copy()
+        r.files = self.files.copy() if isinstance(self.files, dict) else self.files
+        return r
+
+
+class RequestPlan:
+    """
+    The parameter handling of an Operation - compiled once per Operation and path and stored with the Operation.
+
+    Preparing a Request only binds the values provided to the encoders and locations of the plan.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        parameters: dict[str, "ParameterType"],
+        locations: dict[str, str | None],
+        encoders: dict[str, Callable[[str, Any], dict[str, Any]]],
+        defaults: dict[str, Any],
+        required: frozenset[str],
+    ):
+        self.path: str = path
+        """
+        HTTP path the plan was compiled for
+        """
+
+        self.parameters: dict[str, "ParameterType"] = parameters
+        """
+        the parameters by name
+        """
+
+        self.locations: dict[str, str | None] = locations
+        """
+        the location to bind the encoded parameter to by name, None for parameters not to be bound
+        """
+
+        self.encoders: dict[str, Callable[[str, Any], dict[str, Any]]] = encoders
+        """
+        the encoders by name
+        """
+
+        self.defaults: dict[str, Any] = defaults
+        """
+        the default values by name
+        """
+
+        self.accepted: frozenset[str] = frozenset(parameters.keys())
+        self.required: frozenset[str] = required
+
+        self.format_path: Callable[..., str] = path.format
+        """
+        the path formatter
+        """
+
+    def bind(self, provided: Optional["RequestParameters"]) -> dict[str, Any]:
+        """
+        merge the provided values with the defaults and check for unknown & missing parameters
+
+        :param provided: the parameter values provided
+        :return: the parameter values
+        """
+        parameters = self.defaults | provided if provided else self.defaults.copy()
+
+        available = parameters.keys()
+        if unknown := available - self.accepted:
+            raise ValueError(f"Parameter {sorted(unknown)} unknown (accepted {sorted(self.accepted)})")
+        if missing := self.required - available:
+            raise ValueError(f"Required Parameter {sorted(missing)} missing (provided {sorted(available)})")
+        return parameters
+
 
 class RequestBase:
     class StreamResponse(NamedTuple):
@@ -68,10 +188,27 @@ class RequestBase:
         result: httpx.Response
 
     class Sequencer:
-        def __init__(self, headers: "ResponseHeadersType", stream: Iterator["JSON"], model: pydantic.BaseModel) -> None:
+        def __init__(
+            self,
+            headers: "ResponseHeadersType",
+            stream: Iterator["JSON"],
+            model: pydantic.BaseModel,
+            validate: Callable[[Any], pydantic.BaseModel] | None = None,
+        ) -> None:
             self.headers: ResponseHeadersType = headers
             self.stream: Iterator["JSON"] = stream
             self.model = model
+            self.validate = validate or model.model_validate
+            """
+            the validator for the items of the stream, model_validate_json for streams of JSON documents
+            """
+
+        @staticmethod
+        def validated(obj: pydantic.BaseModel) -> pydantic.BaseModel:
+            """
+            the items of the stream are validated already
+            """
+            return obj
 
         def __iter__(self) -> Iterator:
             return self
@@ -79,7 +216,7 @@ class RequestBase:
         def __next__(self) -> pydantic.BaseModel:
             data: JSON
             for data in self.stream:
-                obj = self.model.model_validate(data)
+                obj = self.validate(data)
                 return obj
             raise StopIteration
 
@@ -96,6 +233,17 @@ class RequestBase:
         call provided context data for use in :func:`aiopenapi3.plugin.Message`
         """
 
+    class BatchResult(NamedTuple):
+        index: int
+        """
+        the index of the item in the batch
+        """
+        response: Optional["RequestBase.Response"]
+        error: Exception | None
+        """
+        the Exception raised processing the item
+        """
+
     """
     A Request compiles all required information to call an Operation
 
@@ -155,6 +303,24 @@ class RequestBase:
         Servers to use for this request
         """
 
+        self.validation: Literal["full", "construct", "none"] | None = None
+        """
+        the validation of the response body, None for the validation of the OpenAPI object
+        """
+
+        self.executor: concurrent.futures.Executor | None = None
+        """
+        the executor to process the response body of asyncio requests, None for the executor of the OpenAPI object
+        """
+
+        self.executor_threshold: int | None = None
+        """
+        the minimum size of a response body processed using the executor, None for the threshold of the OpenAPI object
+        """
+
+        if api._types_lazy is not None:
+            api._init_schema_types_operation(path, method, operation)
+
     def __call__(
         self, *args, return_headers: bool = False, context=None, **kwargs
     ) -> Union["JSON", tuple["ResponseHeadersType", "JSON"]]:
@@ -180,16 +346,70 @@ class RequestBase:
         """
         return {"cert": self.req.cert, "auth": self.req.auth, "headers": {"user-agent": f"aiopenapi3/{__version__}"}}
 
+    def _bind(
+        self, data: Optional["RequestData"], parameters: Optional["RequestParameters"], context: Any
+    ) -> "RequestBase":
+        """
+        the state of a call is kept in a call context - a shallow copy of the Request with its own RequestParameter,
+        derived from the Request's RequestParameter
+        this allows using a Request concurrently, and the call context is passed to the plugins as request
+
+        :return: the call context, prepared for sending
+        """
+        call = copy.copy(self)
+        call.req = self.req.copy()
+        call.vars = RequestBase.Vars(parameters, data, context)
+        call._prepare(data, parameters)
+        return call
+
+    def _session(self) -> httpx.Client | httpx.AsyncClient:
+        """
+        the session to use for sending the request
+
+        in managed session mode (:meth:`aiopenapi3.OpenAPI.open`) this is the long-lived session of the OpenAPI object,
+        otherwise a new session which has to be closed after use via :meth:`_session_close`
+        """
+        if self.api._sessions is not None:
+            args = self._session_factory_default_args
+            # auth is applied per request in _send
+            del args["auth"]
+            return self.api._session(args)
+        return self.api._session_factory(**self._session_factory_default_args)
+
+    def _session_close(self, session: httpx.Client) -> None:
+        if self.api._sessions is None:
+            session.close()
+
     def _send(
         self, session: httpx.Client, data: Optional["RequestData"], parameters: Optional["RequestParameters"]
     ) -> httpx.Response:
         req = self._build_req(session)
         try:
-            result = session.send(req, stream=True)
+            # the auth is applied per request, a managed session is shared by requests with different credentials
+            result = session.send(req, stream=True, auth=self.req.auth or httpx.USE_CLIENT_DEFAULT)
         except Exception as e:
             raise RequestError(self.operation, self, data, parameters) from e
         return result
 
+    def _process__model(self, schema: "SchemaType", data: "JSON") -> "ResponseDataType":
+        """
+        create the model of the response body
+
+        * full - validate the data
+        * construct - create the models without validation, c.f. :func:`aiopenapi3.construct.construct`
+        * none - the data as is
+        """
+        if (validation := self.validation or self.api.validation) == "full":
+            return schema.model(data)
+        elif validation == "construct":
+            r = construct(schema.get_type(), data)
+            if isinstance(r, pydantic.RootModel):
+                return r.root
+            return r
+        elif validation == "none":
+            return data
+        raise ValueError(validation)
+
     @abc.abstractmethod
     def _process_stream(self, result: httpx.Response) -> tuple["ResponseHeadersType", Optional["SchemaType"]]:
         """
@@ -217,6 +437,18 @@ class RequestBase:
     @abc.abstractmethod
     def _prepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]) -> None: ...
 
+    @abc.abstractmethod
+    def _compile_plan(self) -> RequestPlan: ...
+
+    @property
+    def _plan(self) -> RequestPlan:
+        """
+        the RequestPlan of the Operation for the path, compiled on first use
+        """
+        if (plan := self.operation._plans.get(self.path)) is None:
+            plan = self.operation._plans[self.path] = self._compile_plan()
+        return plan
+
     def _build_req(self, session: httpx.Client | httpx.AsyncClient) -> httpx.Request:
         url: yarl.URL = self.api.url
 
@@ -241,6 +473,17 @@ class RequestBase:
             if start <= status_code <= end:
                 raise exc(status_code, headers, data)
 
+    def _process_request_unmarshalled(
+        self, status_code: str, rheaders: "ResponseHeadersType", data: "ResponseDataType"
+    ) -> tuple["ResponseHeadersType", "ResponseDataType"]:
+        data = self.api.plugins.message.unmarshalled(
+            request=self, operationId=self.operation.operationId, unmarshalled=data
+        ).unmarshalled
+
+        self._raise_on_http_status(int(status_code), rheaders, data)
+
+        return rheaders, data
+
     def request(
         self,
         data: Optional["RequestData"] = None,
@@ -258,19 +501,38 @@ class RequestBase:
         :type context: Any
         :return: headers, data, response
         """
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        with closing(self.api._session_factory(**self._session_factory_default_args)) as session:
-            result = self._send(session, data, parameters)
+        return self._request(None, data, parameters, context)
+
+    def _request(
+        self,
+        session: httpx.Client | None,
+        data: Optional["RequestData"],
+        parameters: Optional["RequestParameters"],
+        context: Any,
+    ) -> "RequestBase.Response":
+        """
+        :param session: the session to use, None to use the session of the call context
+        """
+        call = self._bind(data, parameters, context)
+        owned = session is None
+        if owned:
+            session = call._session()
+        assert session is not None
+        try:
+            result = call._send(session, data, parameters)
 
             if (cl := int(result.headers.get("Content-Length", 0))) > (m := self.api._max_response_content_length):
+                result.close()
                 raise ContentLengthExceededError(
                     self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({m})", result
                 )
 
             result.read()
+        finally:
+            if owned:
+                call._session_close(session)
 
-        headers, data = self._process_request(result)
+        headers, data = call._process_request(result)
         return RequestBase.Response(headers, data, result)
 
     def stream(
@@ -282,7 +544,8 @@ class RequestBase:
         """
         Sends an HTTP request as described by this Path - but do not process the result
           * returns a tuple of Schema, httpx.Client, httpx.Response
-          * requires closing the Client when done processing the response
+          * requires closing the Client when done processing the response - in managed session mode
+            (:meth:`aiopenapi3.OpenAPI.open`) the Client is owned by the OpenAPI object, close the Response instead
           * requires manual processing of the data
           * intended for use with of large results
           * httpx response streaming via Response.iter_bytes()
@@ -295,11 +558,10 @@ class RequestBase:
         :return: schema, session, response
         """
 
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        session = self.api._session_factory(**self._session_factory_default_args)
-        result = self._send(session, data, parameters)
-        headers, schema_ = self._process_stream(result)
+        call = self._bind(data, parameters, context)
+        session = call._session()
+        result = call._send(session, data, parameters)
+        headers, schema_ = call._process_stream(result)
         return RequestBase.StreamResponse(headers, schema_, session, result)
 
     @contextlib.contextmanager
@@ -308,92 +570,228 @@ class RequestBase:
         data: Optional["RequestData"] = None,
         parameters: Optional["RequestParameters"] = None,
         context: Any = None,
+        max_content_length: int | None = None,
+        batch: int = 0,
+        reconnect: int = 3,
     ) -> Generator["RequestBase.Sequencer", None, None]:
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        session: httpx.Client = self.api._session_factory(**self._session_factory_default_args)
-        result = self._send(session, data, parameters)
-        headers, schema_, content_type = self._process_sequence(result)
+        """
+        Sends an HTTP request as described by this Path and validates the items of the response as they are received
+          * JSON Lines, JSON Text Sequences, Server-Sent Events
+          * JSON arrays - application/json with a response schema of type array, parsed incrementally using ijson
 
-        if content_type in ["application/jsonl", "application/x-ndjson"]:
+        :param data: The request body to send.
+        :type data: any, should match content/type
+        :param parameters: The path/header/query/cookie parameters required for the operation
+        :type parameters: dict{str: str}
+        :param context: The request context for use in aiopenapi3.plugin.Message
+        :param max_content_length: the maximum Content-Length of the response, the bytes received are limited as well,
+            unlimited if None
+        :param batch: validate the JSON Lines/JSON Text Sequence records received in batches of up to batch records
+            using a single call per batch, 0 validates each record on its own
+        :param reconnect: the maximum number of consecutive attempts to reconnect a Server-Sent Events stream,
+            0 does not reconnect - reconnecting waits the reconnection time of the stream using time.sleep, blocking
+            the thread iterating the Sequencer
+        :return: Sequencer of the validated items
+        """
+        call = self._bind(data, parameters, context)
+        session: httpx.Client = call._session()
+        try:
+            result = call._send(session, data, parameters)
+            if (
+                max_content_length is not None
+                and (cl := int(result.headers.get("Content-Length", 0))) > max_content_length
+            ):
+                result.close()
+                raise ContentLengthExceededError(
+                    self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({max_content_length})", result
+                )
+            headers, schema_, content_type = call._process_sequence(result)
+        except Exception:
+            call._session_close(session)
+            raise
+
+        def iter_bytes(response: httpx.Response) -> Iterator[bytes]:
             """
-            https://jsonlines.org/
-            https://github.com/ndjson/ndjson-spec
+            the chunks received - the Content-Length may be missing or wrong, the bytes received count
             """
-
-            def iter_json(response: httpx.Response) -> Iterator["JSON"]:
-                for i in response.iter_lines():
-                    yield json.loads(i)
-
-        elif content_type == "application/json-seq":
+            received = 0
+            for chunk in response.iter_bytes():
+                received += len(chunk)
+                if max_content_length is not None and received > max_content_length:
+                    raise ContentLengthExceededError(
+                        self.operation,
+                        received,
+                        f"received ({received}) exceeds maximum ({max_content_length})",
+                        response,
+                    )
+                yield chunk
+
+        records = False
+
+        if content_type in ["application/jsonl", "application/x-ndjson", "application/json-seq"]:
             """
+            https://jsonlines.org/
+            https://github.com/ndjson/ndjson-spec
             JSON Text Sequence
             https://datatracker.ietf.org/doc/html/rfc7464
+
+            the records of each chunk received
             """
 
-            import jsonseq.decode
+            def iter_json(response: httpx.Response) -> Iterator[list[bytes]]:
+                decoder = RecordDecoder(b"\x1e" if content_type == "application/json-seq" else b"\n")
+                for chunk in iter_bytes(response):
+                    yield decoder.decode(chunk)
+                yield decoder.flush()
 
-            def iter_json(response: httpx.Response) -> Iterator["JSON"]:
-                decoder = jsonseq.decode.JSONSeqDecoder()
-                for text in response.iter_text():
-                    yield from decoder.decode(text)
+            records = True
 
         elif content_type == "text/event-stream":
             """
             Server-Sent Events (SSE)
-            https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events/Using_server-sent_events
+            https://html.spec.whatwg.org/multipage/server-sent-events.html#parsing-an-event-stream
+
+            reconnects if the connection is lost or closed, resuming with Last-Event-ID
+            up to reconnect consecutive attempts, receiving data resets the attempts
+            a 204 response or a response which is not an event-stream ends the stream
             """
 
             def iter_json(response: httpx.Response) -> Iterator["JSON"]:
-                for chunk in response.iter_text():
-                    data_ = ""
-                    for line in chunk.splitlines(keepends=True):
-                        data_ += line
-                        if not data_.endswith(("\r\r", "\n\n", "\r\n\r\n")):
-                            continue
+                nonlocal result
+                decoder = EventStreamDecoder()
+                attempts = 0
+                while True:
+                    try:
+                        if attempts:
+                            response.close()
+                            time.sleep(decoder.retry / 1000)
+                            if decoder.last_event_id:
+                                call.req.headers["Last-Event-ID"] = decoder.last_event_id
+                            response = result = call._send(session, data, parameters)
+                            if response.status_code == 204:
+                                return
+                            if call._process_sequence(response)[2] != "text/event-stream":
+                                return
+                            decoder = EventStreamDecoder(decoder.last_event_id, decoder.retry)
+                        for chunk in iter_bytes(response):
+                            attempts = 0
+                            yield from decoder.decode(chunk)
+                    except (httpx.TransportError, RequestError) as e:
+                        if attempts >= reconnect:
+                            raise
+                        reason = repr(e)
+                    else:
+                        if attempts >= reconnect:
+                            return
+                        reason = "closed"
+                    attempts += 1
+                    log.info(f"{self.operation.operationId} event-stream reconnect {attempts}/{reconnect}: {reason}")
 
-                        v = dict()
-                        for l in data_.splitlines(keepends=False):
-                            if l == "":
-                                continue
-                            cmd, _, value = l.partition(":")
-                            if cmd not in ("event", "data", "id", "retry", ""):
-                                # ignore
-                                continue
-                            v[cmd or "comment"] = value.lstrip()
-                        data_ = ""
-                        yield v
-        elif False:
+        elif content_type.lower() == "application/json":
+            """
+            JSON array - the items are parsed incrementally
+            """
             import ijson
 
-            class ReadEventStream:
-                """
-                Using a AsyncIterator input to feed a coroutine
-                """
-
-                def __init__(self, response: httpx.Response) -> None:
-                    self._iter_bytes = response.iter_bytes()
-
-                def read(self, num_bytes: int) -> bytes:
-                    if num_bytes == 0:
-                        return b""
-
-                    return next(self._iter_bytes)
-
             def iter_json(response: httpx.Response) -> Iterator["JSON"]:
-                reader = ReadEventStream(response)
-                yield from ijson.items(reader, "item")
+                items = ijson.sendable_list()
+                coro = ijson.items_coro(items, "item", use_float=True)
+                for chunk in iter_bytes(response):
+                    coro.send(chunk)
+                    yield from items
+                    del items[:]
+                coro.close()
+                yield from items
+
         else:
             raise NotImplementedError(content_type)
 
         try:
             """__enter__"""
             stream = iter_json(result)
-            yield RequestBase.Sequencer(headers, stream, schema_.get_type())
+            model = schema_.get_type()
+            validate = None
+            if records and batch:
+                adapter = pydantic.TypeAdapter(list[model])  # type: ignore[valid-type]
+                stream = (obj for chunk in stream for obj in _validate_batched(adapter, chunk, batch))
+                validate = RequestBase.Sequencer.validated
+            elif records:
+                stream = itertools.chain.from_iterable(stream)
+                validate = model.model_validate_json
+            yield RequestBase.Sequencer(headers, stream, model, validate)
         finally:
             """__exit__"""
             if not result.is_closed:
                 result.close()
+            call._session_close(session)
+
+    def _batch_session(self) -> httpx.Client | httpx.AsyncClient | None:
+        """
+        the session shared by the items of a batch - None in managed session mode, the items use the managed sessions
+        otherwise a session owned by the batch, the OpenAPI object is not modified
+        """
+        if self.api._sessions is not None:
+            return None
+        args = self._session_factory_default_args
+        # auth is applied per request in _send
+        del args["auth"]
+        return self.api._session_factory(**args)
+
+    def _batch_item(
+        self,
+        session: httpx.Client | None,
+        index: int,
+        item: tuple[Optional["RequestParameters"], Optional["RequestData"]],
+    ) -> "RequestBase.BatchResult":
+        parameters, data = item
+        try:
+            return RequestBase.BatchResult(index, self._request(session, data, parameters, None), None)
+        except Exception as e:
+            return RequestBase.BatchResult(index, None, e)
+
+    def batch(
+        self,
+        items: Iterable[tuple[Optional["RequestParameters"], Optional["RequestData"]]],
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> Iterator["RequestBase.BatchResult"]:
+        """
+        Sends an HTTP request for each item using a thread pool
+          * items are tuples of parameters & data
+          * errors are not raised but returned with the item
+          * unless in managed session mode, the batch uses a session of its own, shared by the items of the batch
+
+        :param items: the (parameters, data) to send
+        :param concurrency: the number of requests in flight
+        :param ordered: return the results in order of the items, or as they complete
+        :return: iterator of :class:`RequestBase.BatchResult`
+        """
+        session = cast(httpx.Client | None, self._batch_session())
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            if ordered:
+                # the items are submitted as the results are consumed, limiting the results pending
+                window: collections.deque[concurrent.futures.Future] = collections.deque()
+                for index, item in enumerate(items):
+                    window.append(executor.submit(self._batch_item, session, index, item))
+                    if len(window) >= 2 * concurrency:
+                        yield window.popleft().result()
+                while window:
+                    yield window.popleft().result()
+            else:
+                running: set[concurrent.futures.Future] = set()
+                for index, item in enumerate(items):
+                    running.add(executor.submit(self._batch_item, session, index, item))
+                    if len(running) >= concurrency:
+                        done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                for future in concurrent.futures.as_completed(running):
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if session is not None:
+                session.close()
 
     @property
     @abc.abstractmethod
@@ -421,11 +819,16 @@ class AsyncRequestBase(RequestBase):
 
     class Sequencer:
         def __init__(
-            self, headers: "ResponseHeadersType", stream: AsyncIterator["JSON"], model: pydantic.BaseModel
+            self,
+            headers: "ResponseHeadersType",
+            stream: AsyncIterator["JSON"],
+            model: pydantic.BaseModel,
+            validate: Callable[[Any], pydantic.BaseModel] | None = None,
         ) -> None:
             self.headers: "ResponseHeadersType" = headers
             self.stream: AsyncIterator["JSON"] = stream
             self.model = model
+            self.validate = validate or model.model_validate
 
         def __aiter__(self) -> AsyncIterator:
             return self
@@ -433,7 +836,7 @@ class AsyncRequestBase(RequestBase):
         async def __anext__(self) -> pydantic.BaseModel:
             data: JSON
             async for data in self.stream:
-                obj = self.model.model_validate(data)
+                obj = self.validate(data)
                 return obj
             raise StopAsyncIteration
 
@@ -450,30 +853,58 @@ class AsyncRequestBase(RequestBase):
     ) -> httpx.Response:  # type: ignore[override]
         req = self._build_req(session)
         try:
-            result = await session.send(req, stream=True)
+            result = await session.send(req, stream=True, auth=self.req.auth or httpx.USE_CLIENT_DEFAULT)
         except Exception as e:
             raise RequestError(self.operation, self, data, parameters or dict()) from e
         return result
 
+    async def _session_close(self, session: httpx.AsyncClient) -> None:  # type: ignore[override]
+        if self.api._sessions is None:
+            await session.aclose()
+
     async def request(  # type: ignore[override]
         self,
         data: Optional["RequestData"] = None,
         parameters: Optional["RequestParameters"] = None,
         context: Any = None,
     ) -> "RequestBase.Response":
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        async with aclosing(self.api._session_factory(**self._session_factory_default_args)) as session:
-            result = await self._send(session, data, parameters)
+        return await self._request(None, data, parameters, context)
+
+    async def _request(  # type: ignore[override]
+        self,
+        session: httpx.AsyncClient | None,
+        data: Optional["RequestData"],
+        parameters: Optional["RequestParameters"],
+        context: Any,
+    ) -> "RequestBase.Response":
+        call = self._bind(data, parameters, context)
+        owned = session is None
+        if owned:
+            session = call._session()
+        assert session is not None
+        try:
+            result = await call._send(session, data, parameters)
 
             if (cl := int(result.headers.get("Content-Length", 0))) > (m := self.api._max_response_content_length):
+                await result.aclose()
                 raise ContentLengthExceededError(
                     self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({m})", result
                 )
 
             await result.aread()
+        finally:
+            if owned:
+                await call._session_close(session)
 
-        headers, data = self._process_request(result)
+        if (executor := call.executor or self.api.executor) is not None and len(result.content) >= (
+            call.executor_threshold if call.executor_threshold is not None else self.api.executor_threshold
+        ):
+            """
+            decode & validate large response bodies using the executor, keeping the event loop responsive
+            """
+            headers, data = await asyncio.get_running_loop().run_in_executor(executor, call._process_request, result)
+        else:
+            headers, data = call._process_request(result)
         return RequestBase.Response(headers, data, result)
 
     async def stream(  # type: ignore[override]
@@ -482,11 +913,10 @@ class AsyncRequestBase(RequestBase):
         parameters: Optional["RequestParameters"] = None,
         context: Any = None,
     ) -> "AsyncRequestBase.StreamResponse":
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        session = self.api._session_factory(**self._session_factory_default_args)
-        result = await self._send(session, data, parameters)
-        headers, schema_ = self._process_stream(result)
+        call = self._bind(data, parameters, context)
+        session = call._session()
+        result = await call._send(session, data, parameters)
+        headers, schema_ = call._process_stream(result)
         return AsyncRequestBase.StreamResponse(headers, schema_, session, result)
 
     @contextlib.asynccontextmanager
@@ -495,96 +925,230 @@ class AsyncRequestBase(RequestBase):
         data: Optional["RequestData"] = None,
         parameters: Optional["RequestParameters"] = None,
         context: Any = None,
+        max_content_length: int | None = None,
+        batch: int = 0,
+        reconnect: int = 3,
     ) -> AsyncGenerator["AsyncRequestBase.Sequencer", None]:
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        session = self.api._session_factory(**self._session_factory_default_args)
-        result = await self._send(session, data, parameters)
-        headers, schema_, content_type = self._process_sequence(result)
+        call = self._bind(data, parameters, context)
+        session = call._session()
+        try:
+            result = await call._send(session, data, parameters)
+            if (
+                max_content_length is not None
+                and (cl := int(result.headers.get("Content-Length", 0))) > max_content_length
+            ):
+                await result.aclose()
+                raise ContentLengthExceededError(
+                    self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({max_content_length})", result
+                )
+            headers, schema_, content_type = call._process_sequence(result)
+        except Exception:
+            await call._session_close(session)
+            raise
 
-        if content_type in ["application/jsonl", "application/x-ndjson"]:
+        async def aiter_bytes(response: httpx.Response) -> AsyncIterator[bytes]:
             """
-            https://jsonlines.org/
-            https://github.com/ndjson/ndjson-spec
+            the chunks received - the Content-Length may be missing or wrong, the bytes received count
             """
-
-            async def aiter_json(response: httpx.Response) -> AsyncIterator["JSON"]:
-                async for i in response.aiter_lines():
-                    yield json.loads(i)
-
-        elif content_type == "application/json-seq":
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if max_content_length is not None and received > max_content_length:
+                    raise ContentLengthExceededError(
+                        self.operation,
+                        received,
+                        f"received ({received}) exceeds maximum ({max_content_length})",
+                        response,
+                    )
+                yield chunk
+
+        records = False
+
+        if content_type in ["application/jsonl", "application/x-ndjson", "application/json-seq"]:
             """
+            https://jsonlines.org/
+            https://github.com/ndjson/ndjson-spec
             JSON Text Sequence
             https://datatracker.ietf.org/doc/html/rfc7464
+
+            the records of each chunk received
             """
 
-            import jsonseq.decode
+            async def aiter_json(response: httpx.Response) -> AsyncIterator[list[bytes]]:
+                decoder = RecordDecoder(b"\x1e" if content_type == "application/json-seq" else b"\n")
+                async for chunk in aiter_bytes(response):
+                    yield decoder.decode(chunk)
+                yield decoder.flush()
 
-            async def aiter_json(response: httpx.Response) -> AsyncIterator["JSON"]:
-                decoder = jsonseq.decode.JSONSeqDecoder()
-                async for text in response.aiter_text():
-                    for obj in decoder.decode(text):
-                        yield obj
+            records = True
 
         elif content_type == "text/event-stream":
             """
             Server-Sent Events (SSE)
-            https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events/Using_server-sent_events
             https://html.spec.whatwg.org/multipage/server-sent-events.html#parsing-an-event-stream
-            https://github.com/mpetazzoni/sseclient/blob/main/sseclient/__init__.py#L36
+
+            reconnects if the connection is lost or closed, resuming with Last-Event-ID
+            up to reconnect consecutive attempts, receiving data resets the attempts
+            a 204 response or a response which is not an event-stream ends the stream
             """
 
             async def aiter_json(response: httpx.Response) -> AsyncIterator["JSON"]:
+                nonlocal result
+                decoder = EventStreamDecoder()
+                attempts = 0
+                while True:
+                    try:
+                        if attempts:
+                            await response.aclose()
+                            await asyncio.sleep(decoder.retry / 1000)
+                            if decoder.last_event_id:
+                                call.req.headers["Last-Event-ID"] = decoder.last_event_id
+                            response = result = await call._send(session, data, parameters)
+                            if response.status_code == 204:
+                                return
+                            if call._process_sequence(response)[2] != "text/event-stream":
+                                return
+                            decoder = EventStreamDecoder(decoder.last_event_id, decoder.retry)
+                        async for chunk in aiter_bytes(response):
+                            attempts = 0
+                            for event in decoder.decode(chunk):
+                                yield event
+                    except (httpx.TransportError, RequestError) as e:
+                        if attempts >= reconnect:
+                            raise
+                        reason = repr(e)
+                    else:
+                        if attempts >= reconnect:
+                            return
+                        reason = "closed"
+                    attempts += 1
+                    log.info(f"{self.operation.operationId} event-stream reconnect {attempts}/{reconnect}: {reason}")
 
-                async for chunk in response.aiter_text():
-                    data_ = ""
-                    for line in chunk.splitlines(keepends=True):
-                        data_ += line
-                        if not data_.endswith(("\r\r", "\n\n", "\r\n\r\n")):
-                            continue
-
-                        v = dict()
-                        for l in data_.splitlines(keepends=False):
-                            if l == "":
-                                continue
-                            cmd, _, value = l.partition(":")
-                            if cmd not in ("event", "data", "id", "retry", ""):
-                                # ignore
-                                continue
-                            v[cmd or "comment"] = value.lstrip()
-                        data_ = ""
-                        yield v
-        elif False:
+        elif content_type.lower() == "application/json":
+            """
+            JSON array - the items are parsed incrementally
+            """
             import ijson
 
-            class ReadEventStream:
-                """
-                Using a AsyncIterator input to feed a coroutine
-                """
-
-                def __init__(self, response: httpx.Response) -> None:
-                    self._aiter_bytes = response.aiter_bytes()
-
-                async def read(self, num_bytes: int) -> bytes:
-                    if num_bytes == 0:
-                        return b""
-
-                    return await anext(self._aiter_bytes)
-
             async def aiter_json(response: httpx.Response) -> AsyncIterator["JSON"]:
-                reader = ReadEventStream(response)
-                async for item in ijson.items(reader, "item"):
+                items = ijson.sendable_list()
+                coro = ijson.items_coro(items, "item", use_float=True)
+                async for chunk in aiter_bytes(response):
+                    coro.send(chunk)
+                    for item in items:
+                        yield item
+                    del items[:]
+                coro.close()
+                for item in items:
                     yield item
+
         else:
             raise NotImplementedError(content_type)
 
         try:
             """__aenter__"""
             stream = aiter_json(result)
-            yield AsyncRequestBase.Sequencer(headers, stream, schema_.get_type())
+            model = schema_.get_type()
+            validate = None
+            if records and batch:
+                adapter = pydantic.TypeAdapter(list[model])  # type: ignore[valid-type]
+
+                async def abatched(chunks: AsyncIterator[list[bytes]]) -> AsyncIterator[pydantic.BaseModel]:
+                    async for chunk in chunks:
+                        for obj in _validate_batched(adapter, chunk, batch):
+                            yield obj
+
+                stream = abatched(stream)
+                validate = RequestBase.Sequencer.validated
+            elif records:
+
+                async def achain(chunks: AsyncIterator[list[bytes]]) -> AsyncIterator[bytes]:
+                    async for chunk in chunks:
+                        for record in chunk:
+                            yield record
+
+                stream = achain(stream)
+                validate = model.model_validate_json
+            yield AsyncRequestBase.Sequencer(headers, stream, model, validate)
         finally:
             """__aexit__"""
-            await session.aclose()
+            if not result.is_closed:
+                await result.aclose()
+            await call._session_close(session)
+
+    async def _batch_item(  # type: ignore[override]
+        self,
+        session: httpx.AsyncClient | None,
+        index: int,
+        item: tuple[Optional["RequestParameters"], Optional["RequestData"]],
+    ) -> "RequestBase.BatchResult":
+        parameters, data = item
+        try:
+            return RequestBase.BatchResult(index, await self._request(session, data, parameters, None), None)
+        except Exception as e:
+            return RequestBase.BatchResult(index, None, e)
+
+    async def batch(  # type: ignore[override]
+        self,
+        items: Iterable[tuple[Optional["RequestParameters"], Optional["RequestData"]]],
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator["RequestBase.BatchResult"]:
+        """
+        Sends an HTTP request for each item using a bounded number of tasks
+          * items are tuples of parameters & data
+          * errors are not raised but returned with the item
+          * unless in managed session mode, the batch uses a session of its own, shared by the items of the batch
+
+        :param items: the (parameters, data) to send
+        :param concurrency: the number of requests in flight
+        :param ordered: return the results in order of the items, or as they complete
+        :return: async iterator of :class:`RequestBase.BatchResult`
+        """
+        source = enumerate(items)
+        results: asyncio.Queue[RequestBase.BatchResult | None] = asyncio.Queue()
+        # an item is started if there is a slot, the slot is released once the result was consumed
+        # limiting the results queued/pending to 2 * concurrency
+        slots = asyncio.Semaphore(2 * concurrency)
+
+        async def worker() -> None:
+            try:
+                while True:
+                    await slots.acquire()
+                    if (i := next(source, None)) is None:
+                        slots.release()
+                        return
+                    index, item = i
+                    await results.put(await self._batch_item(session, index, item))
+            finally:
+                await results.put(None)
+
+        session = cast(httpx.AsyncClient | None, self._batch_session())
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            pending: dict[int, RequestBase.BatchResult] = dict()
+            next_index = 0
+            running = len(workers)
+            while running:
+                if (r := await results.get()) is None:
+                    running -= 1
+                    continue
+                if not ordered:
+                    slots.release()
+                    yield r
+                    continue
+                pending[r.index] = r
+                while next_index in pending:
+                    slots.release()
+                    yield pending.pop(next_index)
+                    next_index += 1
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if session is not None:
+                await session.aclose()
 
 
 class OperationIndex:
@@ -598,8 +1162,7 @@ class OperationIndex:
 
         def __getattr__(self, item) -> RequestBase:
             if item in self._operations:
-                (method, path, op, servers) = self._operations[item]
-                return self._oi._api._createRequest(self._oi._api, method, path, op, servers)
+                return self._oi._request(self._operations[item])
             else:
                 return self._tags[item]
 
@@ -727,6 +1290,7 @@ class OperationIndex:
         # convert to dict as pickle does not like local functions
         self._tags = dict(self._tags)
         self._use_operation_tags = use_operation_tags
+        self._requests: dict[tuple["HTTPMethodType", str], "RequestType"] = dict()
 
     def __getattr__(self, item: str) -> "RequestType":
         """
@@ -738,11 +1302,20 @@ class OperationIndex:
         if self._use_operation_tags and item in self._tags:
             return self._tags[item]
         elif item in self._operations:
-            (method, path, op, servers) = self._operations[item]
-            return self._api._createRequest(self._api, method, path, op, servers)
+            return self._request(self._operations[item])
         else:
             raise KeyError(f"operationId {item} not found in tags or operations")
 
+    def _request(self, item: tuple["HTTPMethodType", str, "OperationType", list["ServerType"] | None]) -> "RequestType":
+        """
+        the Request for the operation, created on first use
+        Requests keep the state of a call in a call context and can be shared
+        """
+        (method, path, op, servers) = item
+        if (r := self._requests.get((method, path))) is None:
+            r = self._requests[(method, path)] = self._api._createRequest(self._api, method, path, op, servers)
+        return r
+
     def __getitem__(self, item: str | tuple[str, "HTTPMethodType"]) -> "RequestType":
         """
         index operator interface
@@ -757,9 +1330,10 @@ class OperationIndex:
         return self.Iter(self._api, self._use_operation_tags)
 
     def __getstate__(self):
-        return self.__dict__
+        return self.__dict__ | {"_requests": dict()}
 
     def __setstate__(self, values):
+        self._requests = dict()
         self.__dict__.update(values)
 
     def tag(self, name: str):
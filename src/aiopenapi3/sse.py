@@ -0,0 +1,101 @@
+import re
+from collections.abc import Iterator
+from typing import Any
+
+
+class EventStreamDecoder:
+    """
+    incremental decoder for text/event-stream (Server-Sent Events)
+
+    https://html.spec.whatwg.org/multipage/server-sent-events.html#parsing-an-event-stream
+
+    the decoder is fed the bytes as received, lines and events may span chunks
+    the last event id and the reconnection time are kept across events, they are required to resume the stream
+    """
+
+    EOL = re.compile(rb"\r\n|\r|\n")
+    BOM = b"\xef\xbb\xbf"
+
+    def __init__(self, last_event_id: str = "", retry: int = 3000) -> None:
+        self.last_event_id: str = last_event_id
+        """
+        the id of the last event dispatched, sent as Last-Event-ID when reconnecting
+        """
+        self.retry: int = retry
+        """
+        the reconnection time in milliseconds
+        """
+        self._line: list[bytes] = []
+        self._cr = False
+        self._bom = True
+        self._id: str = last_event_id
+        self._data: list[bytes] = []
+        self._event: bytes | None = None
+        self._retry: int | None = None
+
+    def decode(self, chunk: bytes) -> Iterator[dict[str, Any]]:
+        if not chunk:
+            return
+        if self._cr and chunk.startswith(b"\n"):
+            # CRLF split across chunks
+            chunk = chunk[1:]
+        self._cr = chunk.endswith(b"\r")
+
+        lines = self.EOL.split(chunk)
+        tail = lines.pop()
+        if lines and self._line:
+            self._line.append(lines[0])
+            lines[0] = b"".join(self._line)
+            self._line = []
+        if tail:
+            self._line.append(tail)
+
+        for line in lines:
+            if self._bom:
+                self._bom = False
+                if line.startswith(self.BOM):
+                    line = line[len(self.BOM) :]
+            if (event := self._process(line)) is not None:
+                yield event
+
+    def _process(self, line: bytes) -> dict[str, Any] | None:
+        if not line:
+            return self._dispatch()
+
+        if line.startswith(b":"):
+            # comment
+            return None
+
+        name, sep, value = line.partition(b":")
+        if sep and value.startswith(b" "):
+            value = value[1:]
+
+        if name == b"data":
+            self._data.append(value)
+        elif name == b"event":
+            self._event = value
+        elif name == b"id":
+            if b"\0" not in value:
+                self._id = value.decode("utf-8", errors="replace")
+        elif name == b"retry":
+            if value.isdigit():
+                self.retry = self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> dict[str, Any] | None:
+        self.last_event_id = self._id
+        data, self._data = self._data, []
+        event, self._event = self._event, None
+        retry, self._retry = self._retry, None
+
+        if not data:
+            return None
+
+        r: dict[str, Any] = {"data": b"\n".join(data).decode("utf-8", errors="replace")}
+        if event:
+            r["event"] = event.decode("utf-8", errors="replace")
+        if self.last_event_id:
+            r["id"] = self.last_event_id
+        if retry is not None:
+            r["retry"] = retry
+        return r
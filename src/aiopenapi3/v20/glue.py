@@ -8,8 +8,9 @@ from typing import TypeGuard
 
 import httpx
 import pydantic
+import pydantic_core
 
-from ..request import RequestBase, AsyncRequestBase
+from ..request import RequestBase, AsyncRequestBase, RequestPlan
 from ..errors import HTTPStatusError, ContentTypeError, ResponseSchemaError, ResponseDecodingError, HeadersMissingError
 
 
@@ -157,57 +158,62 @@ class Request(RequestBase):
                 # apiKey in query header data
                 self.req.auth = httpx_auth.HeaderApiKey(value, ss.name)
 
-    def _prepare_parameters(self, provided: Optional["RequestParameters"]):
-        provided = provided or dict()
+    def _compile_plan(self) -> RequestPlan:
         possible = {_.name: _ for _ in self.operation.parameters + self.root.paths[self.path].parameters}
 
-        parameters = {i.name: i.default for i in filter(lambda x: x.default is not None, possible.values())}
-        parameters.update(provided)
-
-        available = frozenset(parameters.keys())
-        accepted = frozenset(possible.keys())
-        required = frozenset(
-            map(lambda x: x[0], filter(lambda y: y[1].required and y[1].in_ != "body", possible.items()))
-        )
-        if available - accepted:
-            raise ValueError(f"Parameter {sorted(available - accepted)} unknown (accepted {sorted(accepted)})")
-        if required - available:
-            raise ValueError(
-                f"Required Parameter {sorted(required - available)} missing (provided {sorted(available)})"
-            )
-
-        path_parameters = {}
-
-        for name, value in parameters.items():
-            spec = possible[name]
-
-            values = spec._encode(name, value)
-            assert isinstance(values, dict)
+        defaults = {i.name: i.default for i in filter(lambda x: x.default is not None, possible.values())}
 
+        locations: dict[str, str | None] = dict()
+        for name, spec in possible.items():
             if spec.in_ == "formData":
                 if "multipart/form-data" in self.operation.consumes:
-                    if spec.type == "file":
-                        self.req.files.update(values)
-                    else:
-                        self.req.data.update(values)
+                    locations[name] = "files" if spec.type == "file" else "data"
                 elif "application/x-www-form-urlencoded" in self.operation.consumes:
-                    self.req.data.update(values)
+                    locations[name] = "data"
                 else:
-                    raise ValueError(f"operation does not consume form data but parameter {name} is formData")
+                    # rejected if provided
+                    locations[name] = "formData"
+            elif spec.in_ in ["path", "query", "header"]:
+                locations[name] = spec.in_
+            else:
+                locations[name] = None
+
+        return RequestPlan(
+            self.path,
+            possible,
+            locations,
+            {name: spec._encoder() for name, spec in possible.items()},
+            defaults,
+            frozenset(map(lambda x: x[0], filter(lambda y: y[1].required and y[1].in_ != "body", possible.items()))),
+        )
 
-            if spec.in_ == "path":
-                # The string method `format` is incapable of partial updates,
-                # as such we need to collect all the path parameters before
-                # applying them to the format string.
-                path_parameters.update(values)
+    def _prepare_parameters(self, provided: Optional["RequestParameters"]):
+        plan = self._plan
+        parameters = plan.bind(provided)
+
+        path_parameters: dict[str, str] = {}
+        targets = {
+            "files": self.req.files,
+            "data": self.req.data,
+            # The string method `format` is incapable of partial updates,
+            # as such we need to collect all the path parameters before
+            # applying them to the format string.
+            "path": path_parameters,
+            "query": self.req.params,
+            "header": self.req.headers,
+        }
 
-            if spec.in_ == "query":
-                self.req.params.update(values)
+        for name, value in parameters.items():
+            values = plan.encoders[name](name, value)
+            assert isinstance(values, dict)
 
-            if spec.in_ == "header":
-                self.req.headers.update(values)
+            if (location := plan.locations[name]) is None:
+                continue
+            if location == "formData":
+                raise ValueError(f"operation does not consume form data but parameter {name} is formData")
+            targets[location].update(values)
 
-        self.req.url = self.req.url.format(**path_parameters)
+        self.req.url = plan.format_path(**path_parameters)
 
     def _prepare_body(self, data: Optional["RequestData"]):
         try:
@@ -220,17 +226,25 @@ class Request(RequestBase):
 
         consumes = frozenset(self.operation.consumes or self.root.consumes)
         if "application/json" in consumes:
-            if isinstance(data, (dict, list)):
-                pass
-            elif isinstance(data, pydantic.BaseModel):
-                data = data.model_dump(mode="json")
-            else:
+            if not isinstance(data, (dict, list, pydantic.BaseModel)):
                 raise TypeError(data)
-            data = self.api.plugins.message.marshalled(
-                request=self, operationId=self.operation.operationId, marshalled=data
-            ).marshalled
-            data = json.dumps(data)
-            data = data.encode()
+            if not self.api.plugins.message.implements("marshalled"):
+                """
+                no plugin requires the marshalled data - serialize to bytes directly
+                """
+                data = (
+                    data.__pydantic_serializer__.to_json(data)
+                    if isinstance(data, pydantic.BaseModel)
+                    else pydantic_core.to_json(data)
+                )
+            else:
+                if isinstance(data, pydantic.BaseModel):
+                    data = data.model_dump(mode="json")
+                data = self.api.plugins.message.marshalled(
+                    request=self, operationId=self.operation.operationId, marshalled=data
+                ).marshalled
+                data = json.dumps(data)
+                data = data.encode()
             data = self.api.plugins.message.sending(
                 request=self, operationId=self.operation.operationId, sending=data
             ).sending
@@ -325,7 +339,23 @@ class Request(RequestBase):
                 result,
             )
 
-        if content_type == "application/json":
+        if (
+            content_type == "application/json"
+            and not self.api.plugins.message.implements("parsed")
+            and (self.validation or self.api.validation) == "full"
+        ):
+            """
+            no plugin requires the parsed data - validate the JSON document
+            """
+            try:
+                data = expected_response.schema_.model_json(ctx.received)
+            except pydantic.ValidationError as e:
+                if any(i["type"] == "json_invalid" for i in e.errors(include_url=False)):
+                    raise ResponseDecodingError(self.operation, ctx.received, result)
+                raise ResponseSchemaError(self.operation, expected_response, expected_response.schema_, result, e)
+
+            return self._process_request_unmarshalled(status_code, rheaders, data)
+        elif content_type == "application/json":
             data = ctx.received.decode()
             try:
                 data = json.loads(data)
@@ -343,17 +373,11 @@ class Request(RequestBase):
                 raise ResponseSchemaError(self.operation, expected_response, None, result, None)
 
             try:
-                data = expected_response.schema_.model(data)
-            except pydantic.ValidationError as e:
+                data = self._process__model(expected_response.schema_, data)
+            except (pydantic.ValidationError, TypeError) as e:
                 raise ResponseSchemaError(self.operation, expected_response, expected_response.schema_, result, e)
 
-            data = self.api.plugins.message.unmarshalled(
-                request=self, operationId=self.operation.operationId, unmarshalled=data
-            ).unmarshalled
-
-            self._raise_on_http_status(int(status_code), rheaders, data)
-
-            return rheaders, data
+            return self._process_request_unmarshalled(status_code, rheaders, data)
         else:
             """
             We have received a valid (i.e. expected) content type,
@@ -30,6 +30,12 @@ class _ParameterCodec:
         else:
             raise ParameterFormatError(self)
 
+    def _encoder(self):
+        """
+        the encoder for the parameter - for use in :class:`aiopenapi3.request.RequestPlan`
+        """
+        return self._encode
+
     def _encode(self, name, value):
         if self.type == "array":
             value = self._encode__collection(value)
@@ -75,6 +81,12 @@ class Items(ObjectExtended, _ParameterCodec):
     enum: Any | None = Field(default=None)
     multipleOf: int | None = Field(default=None)
 
+    def _encoder(self):
+        """
+        the encoder for the parameter - for use in :class:`aiopenapi3.request.RequestPlan`
+        """
+        return self._encode
+
     def _encode(self, name, value):
         if self.type == "array":
             value = self._encode__collection(value)
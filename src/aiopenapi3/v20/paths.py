@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import Field, model_validator
+from pydantic import Field, model_validator, PrivateAttr
 
 from .general import ExternalDocumentation
 from .general import Reference
@@ -43,6 +43,11 @@ class Operation(ObjectExtended, OperationBase):
     deprecated: bool | None = Field(default=None)
     security: list[SecurityRequirement] | None = Field(default=None)
 
+    _plans: dict[str, Any] = PrivateAttr(default_factory=dict)
+    """
+    the compiled :class:`aiopenapi3.request.RequestPlan` by HTTP path - an Operation may be referenced by PathItems
+    """
+
 
 class PathItem(ObjectExtended, PathItemBase):
     """
@@ -1,4 +1,6 @@
-from pydantic import Field
+from typing import Any
+
+from pydantic import Field, PrivateAttr
 
 from .general import Reference, ExternalDocumentation
 from .info import Info
@@ -33,5 +35,7 @@ class Root(ObjectExtended, RootBase):
     tags: list[Tag] = Field(default_factory=list)
     externalDocs: ExternalDocumentation | None = Field(default=None)
 
-    def _resolve_references(self, api):
-        RootBase.resolve(api, self, self, PathItem, Reference)
+    _jp_cache: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _resolve_references(self, api, sites=None):
+        return RootBase.resolve(api, self, self, PathItem, Reference, sites)
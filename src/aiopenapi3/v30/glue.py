@@ -21,11 +21,13 @@ else:
     }
 
 import pydantic
+import pydantic_core
 
 # import pydantic.json
 
 import aiopenapi3.v30.media
-from ..request import RequestBase, AsyncRequestBase
+from ..model import Model
+from ..request import RequestBase, AsyncRequestBase, RequestPlan
 from ..errors import HTTPStatusError, ContentTypeError, ResponseDecodingError, ResponseSchemaError, HeadersMissingError
 from .formdata import (
     parameters_from_multipart,
@@ -262,16 +264,12 @@ class Request(RequestBase):
             else:
                 self.req.auth = auth
 
-    def _prepare_parameters(self, provided: Optional["RequestParameters"]) -> dict[str, str]:
+    def _compile_plan(self) -> RequestPlan:
         """
-        assigns the parameters provided to the header/path/cookie …
-
         FIXME: handle parameter location
           https://spec.openapis.org/oas/v3.0.3#parameter-object
           A unique parameter is defined by a combination of a name and location.
         """
-
-        provided = provided or dict()
         possible = {_.name: _ for _ in self.operation.parameters + self.root.paths[self.path].parameters}
 
         from .. import v30, v31, v32
@@ -288,53 +286,64 @@ class Request(RequestBase):
                     rbq.update(v.headers)
                 possible.update(rbq)
 
-        parameters = {}
-
         """collect default values"""
-        for i in possible.values():
+        defaults = dict()
+        for name, i in possible.items():
             if i.schema_ is not None and i.schema_.default is not None:
-                parameters[i.name] = i.schema_.default
+                defaults[name] = i.schema_.default
             elif (
                 i.content is not None
                 and (m := i.content.get("application/json", None)) is not None
                 and m.schema_.default
             ):
-                parameters[i.name] = m.schema_.default
-
-        parameters.update(provided)
-
-        available = frozenset(parameters.keys())
-        accepted = frozenset(possible.keys())
-        required = frozenset(map(lambda x: x[0], filter(lambda y: y[1].required, possible.items())))
-        if available - accepted:
-            raise ValueError(f"Parameter {sorted(available - accepted)} unknown (accepted {sorted(accepted)})")
-        if required - available:
-            raise ValueError(
-                f"Required Parameter {sorted(required - available)} missing (provided {sorted(available)})"
-            )
+                defaults[name] = m.schema_.default
+
+        locations: dict[str, str | None] = dict()
+        for name, spec in possible.items():
+            if isinstance(spec, (v30.parameter.Header, v31.parameter.Header, v32.parameter.Header)):
+                locations[name] = "multipart"
+            elif spec.in_ == "querystring":
+                locations[name] = "query"
+            elif spec.in_ in ["header", "path", "query", "cookie"]:
+                locations[name] = spec.in_
+            else:
+                locations[name] = None
+
+        return RequestPlan(
+            self.path,
+            possible,
+            locations,
+            {name: spec._encoder() for name, spec in possible.items()},
+            defaults,
+            frozenset(map(lambda x: x[0], filter(lambda y: y[1].required, possible.items()))),
+        )
 
-        path_parameters = {}
-        mph = dict()
+    def _prepare_parameters(self, provided: Optional["RequestParameters"]) -> dict[str, str]:
+        """
+        assigns the parameters provided to the header/path/cookie …
+        """
+        plan = self._plan
+        parameters = plan.bind(provided)
+
+        path_parameters: dict[str, str] = {}
+        mph: dict[str, str] = dict()
+        targets = {
+            "multipart": mph,
+            "header": self.req.headers,
+            # The string method `format` is incapable of partial updates,
+            # as such we need to collect all the path parameters before
+            # applying them to the format string.
+            "path": path_parameters,
+            "query": self.req.params,
+            "cookie": self.req.cookies,
+        }
         for name, value in parameters.items():
-            spec = possible[name]
-            values = spec._encode(name, value)
+            values = plan.encoders[name](name, value)
             assert isinstance(values, dict)
+            if (location := plan.locations[name]) is not None:
+                targets[location].update(values)
 
-            if isinstance(spec, (v30.parameter.Header, v31.parameter.Header)):
-                mph.update(values)
-            elif spec.in_ == "header":
-                self.req.headers.update(values)
-            elif spec.in_ == "path":
-                # The string method `format` is incapable of partial updates,
-                # as such we need to collect all the path parameters before
-                # applying them to the format string.
-                path_parameters.update(values)
-            elif spec.in_ in ["query", "querystring"]:
-                self.req.params.update(values)
-            elif spec.in_ == "cookie":
-                self.req.cookies.update(values)
-
-        self.req.url = self.req.url.format(**path_parameters)
+        self.req.url = plan.format_path(**path_parameters)
         return mph
 
     def _prepare_body(self, data_: Optional["RequestData"], mph: dict[str, str]) -> None:
@@ -359,17 +368,24 @@ class Request(RequestBase):
             raise ValueError("Request Body is required but none was provided.")
 
         if "application/json" in self.operation.requestBody.content:
-            if isinstance(data_, (dict, list)):
-                data = data_
-            elif isinstance(data_, pydantic.BaseModel):
-                data = data_.model_dump(mode="json")
-            else:
+            if not isinstance(data_, (dict, list, pydantic.BaseModel)):
                 raise TypeError(data_)
-            data = self.api.plugins.message.marshalled(
-                request=self, operationId=self.operation.operationId, marshalled=data
-            ).marshalled
-            data: str = json.dumps(data)
-            data: bytes = data.encode()  # type: ignore[union-attr]
+            if not self.api.plugins.message.implements("marshalled"):
+                """
+                no plugin requires the marshalled data - serialize to bytes directly
+                """
+                data: bytes = (
+                    data_.__pydantic_serializer__.to_json(data_)
+                    if isinstance(data_, pydantic.BaseModel)
+                    else pydantic_core.to_json(data_)
+                )
+            else:
+                data = data_.model_dump(mode="json") if isinstance(data_, pydantic.BaseModel) else data_
+                data = self.api.plugins.message.marshalled(
+                    request=self, operationId=self.operation.operationId, marshalled=data
+                ).marshalled
+                data: str = json.dumps(data)
+                data: bytes = data.encode()  # type: ignore[union-attr]
             self.req.headers["Content-Type"] = "application/json"
             ctx = self.api.plugins.message.sending(
                 request=self,
@@ -580,7 +596,22 @@ class Request(RequestBase):
 
         headers = self._process__headers(result, result.headers, expected_response)
 
-        return headers, expected_media.itemSchema, content_type
+        schema_ = getattr(expected_media, "itemSchema", None)
+        if schema_ is None and content_type.lower() == "application/json":
+            """
+            a JSON array - the items are streamed
+            """
+            array = getattr(expected_media.schema_, "_target", expected_media.schema_)
+            if array is None or not Model.is_type(array, "array") or array.items is None:
+                raise ContentTypeError(
+                    self.operation,
+                    content_type,
+                    f"Response schema of operation {self.operation.operationId} is not an array",
+                    result,
+                )
+            schema_ = getattr(array.items, "_target", array.items)
+
+        return headers, schema_, content_type
 
     def _process_request(self, result: httpx.Response) -> tuple["ResponseHeadersType", "ResponseDataType"]:
         rheaders = dict()
@@ -614,6 +645,22 @@ class Request(RequestBase):
             data = ctx.received
             expected_type = getattr(expected_media.schema_, "_target", expected_media.schema_)
 
+            if (
+                expected_type is not None
+                and not self.api.plugins.message.implements("parsed")
+                and (self.validation or self.api.validation) == "full"
+            ):
+                """
+                no plugin requires the parsed data - validate the JSON document
+                """
+                try:
+                    data = expected_type.model_json(data)
+                except pydantic.ValidationError as e:
+                    if any(i["type"] == "json_invalid" for i in e.errors(include_url=False)):
+                        raise ResponseDecodingError(self.operation, data, result)
+                    raise ResponseSchemaError(self.operation, expected_media, expected_type, result, e)
+                return self._process_request_unmarshalled(status_code, rheaders, data)
+
             try:
                 data = json.loads(data)
             except json.decoder.JSONDecodeError:
@@ -634,17 +681,11 @@ class Request(RequestBase):
                 raise ResponseSchemaError(self.operation, expected_media, expected_type, result, None)
 
             try:
-                data = expected_type.model(data)
-            except pydantic.ValidationError as e:
+                data = self._process__model(expected_type, data)
+            except (pydantic.ValidationError, TypeError) as e:
                 raise ResponseSchemaError(self.operation, expected_media, expected_type, result, e)
 
-            data = self.api.plugins.message.unmarshalled(
-                request=self, operationId=self.operation.operationId, unmarshalled=data
-            ).unmarshalled
-
-            self._raise_on_http_status(int(status_code), rheaders, data)
-
-            return rheaders, data
+            return self._process_request_unmarshalled(status_code, rheaders, data)
         else:
             """
             We have received a valid (i.e. expected) content type,
@@ -1,11 +1,12 @@
 import enum
 import datetime
+import functools
 import decimal
 import typing
 import uuid
 import json
 from typing import Union, Any
-from collections.abc import MutableMapping
+from collections.abc import Callable, MutableMapping
 
 from pydantic import BaseModel, Field, model_validator
 import more_itertools
@@ -54,8 +55,18 @@ class _ParameterCodec:
 
         return schema, style, explode
 
+    def _encoder(self) -> Callable[[str, Any], dict[str, Any]]:
+        """
+        the encoder for the parameter with the codec resolved - for use in :class:`aiopenapi3.request.RequestPlan`
+        """
+        schema, style, explode = self._codec()
+        return functools.partial(self._encode_schema, schema, style, explode)
+
     def _encode(self, name: str, value):
         schema, style, explode = self._codec()
+        return self._encode_schema(schema, style, explode, name, value)
+
+    def _encode_schema(self, schema: "v3xSchemaType", style: str, explode: bool, name: str, value):
         value = schema.model(value)
         if isinstance(value, BaseModel):
             type_ = "object"
@@ -1,7 +1,7 @@
 from typing import Any
 
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 
 from ..base import ObjectExtended, RootBase
@@ -32,5 +32,7 @@ class Root(ObjectExtended, RootBase):
     tags: list[Tag] = Field(default_factory=list)
     externalDocs: dict[Any, Any] = Field(default_factory=dict)
 
-    def _resolve_references(self, api):
-        RootBase.resolve(api, self, self, PathItem, Reference)
+    _jp_cache: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _resolve_references(self, api, sites=None):
+        return RootBase.resolve(api, self, self, PathItem, Reference, sites)
@@ -1,6 +1,6 @@
 from typing import Union, Any
 
-from pydantic import Field, model_validator, RootModel
+from pydantic import Field, model_validator, RootModel, PrivateAttr
 
 from ..base import ObjectExtended, PathsBase, OperationBase, PathItemBase
 from .general import ExternalDocumentation
@@ -88,6 +88,11 @@ class Operation(ObjectExtended, OperationBase):
     security: list[SecurityRequirement] | None = Field(default=None)
     servers: list[Server] | None = Field(default=None)
 
+    _plans: dict[str, Any] = PrivateAttr(default_factory=dict)
+    """
+    the compiled :class:`aiopenapi3.request.RequestPlan` by HTTP path - an Operation may be referenced by PathItems
+    """
+
 
 class PathItem(ObjectExtended, PathItemBase):
     """
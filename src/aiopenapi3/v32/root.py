@@ -1,7 +1,7 @@
 from typing import Any
 
 import pydantic
-from pydantic import Field, model_validator
+from pydantic import Field, model_validator, PrivateAttr
 
 from ..base import ObjectExtended, RootBase
 
@@ -36,10 +36,12 @@ class Root(ObjectExtended, RootBase):
     tags: list[Tag] = Field(default_factory=list)
     externalDocs: dict[Any, Any] = Field(default_factory=dict)
 
+    _jp_cache: dict[str, Any] = PrivateAttr(default_factory=dict)
+
     @model_validator(mode="after")
     def validate_Root(self) -> "Self":  # noqa: F821
         assert self.paths or self.components or self.webhooks
         return self
 
-    def _resolve_references(self, api):
-        RootBase.resolve(api, self, self, PathItem, Reference)
+    def _resolve_references(self, api, sites=None):
+        return RootBase.resolve(api, self, self, PathItem, Reference, sites)
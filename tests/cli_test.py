@@ -1,9 +1,14 @@
+import importlib.util
 import os
 import shlex
+import sys
 from pathlib import Path
 import json
 
+import yaml
 
+
+from aiopenapi3 import OpenAPI
 from aiopenapi3.cli import main
 import aiopenapi3.log
 
@@ -66,3 +71,25 @@ def test_call():
         )
     )
     auth.unlink()
+
+
+def test_compile_cli(tmp_path, monkeypatch):
+    main(shlex.split(f"compile tests/fixtures/petstore-expanded.yaml {tmp_path}/petstore.py"))
+
+    spec = importlib.util.spec_from_file_location("petstore_cli_types", tmp_path / "petstore.py")
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+
+    document = yaml.safe_load(Path("tests/fixtures/petstore-expanded.yaml").read_text())
+    api = OpenAPI("petstore-expanded.yaml", document)
+    assert module.__types__.keys() == api._types.keys()
+    pets = [{"id": 1, "name": "dog", "tag": "a"}]
+    schema = api._.findPets.return_value()
+    Pets = module.__types__[schema._get_identity("X")]
+    assert Pets.model_validate(pets).model_dump() == schema.get_type().model_validate(pets).model_dump()
+
+    api = OpenAPI("petstore-expanded.yaml", document)
+    api.types_load(module)
+    assert api.components.schemas["Pet"].get_type() is module.Pet
+    assert api._.findPets.return_value().get_type().model_validate(pets).root[0].name == "dog"
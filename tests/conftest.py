@@ -600,3 +600,8 @@ def with_paths_parameter_querystring():
 @pytest.fixture
 def with_schema_tags_v32():
     yield _get_parsed_yaml("schema-tags-v32.yaml")
+
+
+@pytest.fixture
+def with_schema_discriminated_union_inferred(openapi_version):
+    yield _get_parsed_yaml("schema-discriminated-union-inferred.yaml", openapi_version)
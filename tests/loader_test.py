@@ -2,10 +2,22 @@ import json
 
 from pathlib import Path
 
+import httpx
 import yarl
+import yaml
 import pytest
 from aiopenapi3 import OpenAPI, FileSystemLoader, ReferenceResolutionError
-from aiopenapi3.loader import Loader, Plugins, NullLoader
+from aiopenapi3.loader import (
+    Loader,
+    Plugins,
+    NullLoader,
+    YAML12Loader,
+    CYAML12Loader,
+    AsyncLoader,
+    AsyncFileSystemLoader,
+    AsyncWebLoader,
+    WebLoader,
+)
 
 SPECTPL = """
 openapi: "3.0.0"
@@ -72,6 +84,27 @@ def test_loader_format():
     api = OpenAPI.loads("loader.json", spec)
 
 
+def test_loader_sniff():
+    values = {"jsonref": "'#/components/schemas/Example'", "description": ""}
+    spec = NullLoader().parse(Plugins([]), yarl.URL("loader.yaml"), SPECTPL.format(**values))
+
+    loader = NullLoader()
+    for name in ["loader", "loader.yaml", "loader.txt"]:
+        assert loader.parse(Plugins([]), yarl.URL(name), json.dumps(spec)) == spec
+
+    assert Loader.sniff('  \n{"a":1}') == "json"
+    assert Loader.sniff("a: 1") == "yaml"
+
+    # yaml flow style is not json
+    assert loader.parse(Plugins([]), yarl.URL("loader.yaml"), "{a: 1, b: [on, 0o10]}") == {"a": 1, "b": ["on", 8]}
+
+
+@pytest.mark.parametrize("yload", [YAML12Loader, CYAML12Loader])
+def test_loader_yaml12(yload):
+    data = yaml.load("a: [yes, no, on, off, 0o10, 1_000, 2001-12-14, ~, null, true]", Loader=yload)
+    assert data == {"a": ["yes", "no", "on", "off", 8, "1_000", "2001-12-14", None, None, True]}
+
+
 @pytest.mark.skip_env("GITHUB_ACTIONS")
 def test_webload():
     # FIXME https://github.com/pydantic/pydantic/issues/5730
@@ -82,3 +115,164 @@ def test_webload():
 
     loader = WebLoader(yarl.URL(name))
     api = OpenAPI.load_sync(name, loader=loader)
+
+
+PREFETCH = {
+    "root.yaml": SPECTPL.format(jsonref="'a.yaml#/components/schemas/A'", description=""),
+    "a.yaml": """
+openapi: "3.0.0"
+info:
+  title: a
+  version: 1.0.0
+paths: {}
+components:
+  schemas:
+    A:
+      type: object
+      properties:
+        b:
+          $ref: "b.yaml#/components/schemas/B"
+        c:
+          $ref: "c.yaml#/components/schemas/C"
+""",
+    "b.yaml": """
+openapi: "3.0.0"
+info:
+  title: b
+  version: 1.0.0
+paths: {}
+components:
+  schemas:
+    B:
+      type: string
+""",
+    "c.yaml": """
+openapi: "3.0.0"
+info:
+  title: c
+  version: 1.0.0
+paths: {}
+components:
+  schemas:
+    C:
+      $ref: "b.yaml#/components/schemas/B"
+""",
+}
+
+
+def prefetch_session_factory(requested, documents=PREFETCH):
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path[1:]
+        requested.append(name)
+        if name not in documents:
+            return httpx.Response(404)
+        return httpx.Response(200, content=documents[name].encode())
+
+    def session_factory(*args, **kwargs) -> httpx.AsyncClient:
+        return httpx.AsyncClient(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    return session_factory
+
+
+def test_loader_prefetch_references():
+    document = NullLoader().parse(Plugins([]), yarl.URL("a.yaml"), PREFETCH["a.yaml"])
+    seen = {yarl.URL("b.yaml")}
+    assert AsyncLoader.references(document, seen) == [yarl.URL("c.yaml")]
+    assert seen == {yarl.URL("b.yaml"), yarl.URL("c.yaml")}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_loader_prefetch_filesystem(tmp_path):
+    for name, data in PREFETCH.items():
+        (tmp_path / name).write_text(data)
+
+    loader = AsyncFileSystemLoader(tmp_path, concurrency=2)
+    requested = []
+    api = await OpenAPI.load_async(
+        "http://example.com/root.yaml", session_factory=prefetch_session_factory(requested), loader=loader
+    )
+    assert requested == ["root.yaml"]
+    assert set(api._documents.keys()) == {yarl.URL("http://example.com/root.yaml")} | {
+        yarl.URL(i) for i in ["a.yaml", "b.yaml", "c.yaml"]
+    }
+    assert loader.prefetched == {}
+
+    # missing documents are not prefetched, resolving the reference raises
+    documents = {"missing.yaml": SPECTPL.format(jsonref="'nosuch.yaml#/components/schemas/A'", description="")}
+    with pytest.raises(ReferenceResolutionError):
+        await OpenAPI.load_async(
+            "http://example.com/missing.yaml",
+            session_factory=prefetch_session_factory(requested, documents),
+            loader=loader,
+        )
+    assert loader.prefetched == {}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_loader_prefetch_web():
+    requested = []
+    session_factory = prefetch_session_factory(requested)
+
+    def sync_session_factory(*args, **kwargs) -> httpx.Client:
+        raise ValueError("prefetched")
+
+    loader = AsyncWebLoader(
+        yarl.URL("http://example.com/"), session_factory=sync_session_factory, async_session_factory=session_factory
+    )
+    api = await OpenAPI.load_async("http://example.com/root.yaml", session_factory=session_factory, loader=loader)
+    assert sorted(requested) == ["a.yaml", "b.yaml", "c.yaml", "root.yaml"]
+    assert api.components.schemas["Object"]
+
+
+def test_loader_web_cache(tmp_path):
+    requests = []
+    sessions = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        name = request.url.path[1:]
+        etag = f'"{hash(PREFETCH[name])}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=PREFETCH[name].encode(), headers={"ETag": etag})
+
+    def session_factory(*args, **kwargs) -> httpx.Client:
+        sessions.append(httpx.Client(*args, transport=httpx.MockTransport(handler), **kwargs))
+        return sessions[-1]
+
+    def load(loader):
+        return OpenAPI.load_file("http://example.com/root.yaml", yarl.URL("root.yaml"), loader=loader)
+
+    loader = WebLoader(yarl.URL("http://example.com/"), session_factory=session_factory, cache_dir=tmp_path)
+    api = load(loader)
+    assert api.components.schemas["Object"]
+    # a single session for all documents
+    assert len(sessions) == 1 and sessions[0].is_closed
+    assert len(requests) == 4 and all("If-None-Match" not in i.headers for i in requests)
+
+    # revalidated
+    requests.clear()
+    PREFETCH["b.yaml"] = PREFETCH["b.yaml"].replace("type: string", "type: integer")
+    try:
+        api = load(WebLoader(yarl.URL("http://example.com/"), session_factory=session_factory, cache_dir=tmp_path))
+        assert len(requests) == 4 and all("If-None-Match" in i.headers for i in requests)
+        assert api._documents[yarl.URL("b.yaml")].components.schemas["B"].type == "integer"
+
+        # offline
+        requests.clear()
+        api = load(
+            WebLoader(
+                yarl.URL("http://example.com/"), session_factory=session_factory, cache_dir=tmp_path, offline=True
+            )
+        )
+        assert requests == []
+        assert api._documents[yarl.URL("b.yaml")].components.schemas["B"].type == "integer"
+    finally:
+        PREFETCH["b.yaml"] = PREFETCH["b.yaml"].replace("type: integer", "type: string")
+
+    loader = WebLoader(yarl.URL("http://example.com/"), cache_dir=tmp_path, offline=True)
+    with pytest.raises(FileNotFoundError):
+        loader.load(Plugins([]), yarl.URL("nosuch.yaml"))
+
+    with pytest.raises(ValueError, match="offline"):
+        WebLoader(yarl.URL("http://example.com/"), offline=True)
@@ -7,7 +7,7 @@ import uuid
 
 import pytest
 
-from pydantic import ValidationError
+from pydantic import ValidationError, BaseModel
 from aiopenapi3 import OpenAPI, ReferenceResolutionError
 from aiopenapi3.errors import OperationParameterValidationError, OperationIdDuplicationError
 
@@ -235,3 +235,57 @@ def test_pydantic_classes():
     p0 = dog0.model_dump()
     pet0 = Pet.model_validate({"root": p0})
     assert pet0.root == dog0
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "petstore-expanded.yaml",
+        "paths-parameter-format.yaml",
+        "parsing-paths-content-schema-float-validation.yaml",
+        "paths-response-header-v20.yaml",
+        "schema-boolean-v20.yaml",
+        "schema-discriminated-union-deep.yaml",
+        "schema-additionalProperties-v20.yaml",
+        "schema-yaml12-tags.yaml",
+        "paths-security-v20.yaml",
+        "paths-security.yaml",
+        "schema-v32.yaml",
+        "schema-tags-v32.yaml",
+    ],
+)
+def test_parsing_trusted(name):
+    """
+    Tests creating the objects without validation results in the same objects
+    """
+    import copy
+    from pathlib import Path
+
+    import yaml
+    from aiopenapi3.loader import YAML12Loader
+
+    document = yaml.load(Path("tests/fixtures", name).read_text(), Loader=YAML12Loader)
+
+    validated = OpenAPI(URLBASE, copy.deepcopy(document))
+    trusted = OpenAPI(URLBASE, document, trusted=True)
+
+    def compare(a, b):
+        assert type(a) is type(b)
+        if isinstance(a, BaseModel):
+            assert a.model_fields_set == b.model_fields_set
+            assert a.__pydantic_extra__ == b.__pydantic_extra__
+            for name in type(a).model_fields:
+                compare(getattr(a, name), getattr(b, name))
+        elif isinstance(a, dict):
+            assert a.keys() == b.keys()
+            for k in a.keys():
+                compare(a[k], b[k])
+        elif isinstance(a, list):
+            assert len(a) == len(b)
+            for x, y in zip(a, b):
+                compare(x, y)
+        else:
+            assert a == b
+
+    compare(validated._root, trusted._root)
+    assert len(validated._types) == len(trusted._types)
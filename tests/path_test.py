@@ -672,3 +672,64 @@ def test_paths_parameter_querystring(httpx_mock, with_paths_parameter_querystrin
     req = httpx_mock.get_requests()[-1]
     assert querymatch(req.url.query.decode(), ex.serializedValue)
     assert req.url.query.decode() == ex.serializedValue + "="
+
+
+def test_paths_parameter_plan(monkeypatch):
+    """
+    the parameter handling is compiled once per operation, preparing a request only binds the values
+    """
+    import aiopenapi3.v30.glue
+
+    def document(n):
+        return {
+            "openapi": "3.0.3",
+            "info": {"title": "plan", "version": "1.0.0"},
+            "servers": [{"url": "http://127.0.0.1/"}],
+            "paths": {
+                "/items/{id}": {
+                    "get": {
+                        "operationId": "items",
+                        "parameters": [
+                            {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}},
+                            *[{"name": f"p{i}", "in": "query", "schema": {"type": "string"}} for i in range(n)],
+                        ],
+                        "responses": {"204": {"description": "empty"}},
+                    }
+                },
+            },
+        }
+
+    compiled = list()
+    compile_plan = aiopenapi3.v30.glue.Request._compile_plan
+
+    def counting(self):
+        compiled.append(self.path)
+        return compile_plan(self)
+
+    monkeypatch.setattr(aiopenapi3.v30.glue.Request, "_compile_plan", counting)
+
+    api = OpenAPI(URLBASE, document(200), session_factory=httpx.Client)
+    for _ in range(3):
+        r = api.createRequest("items")
+        r._prepare(None, {"id": 1, "p0": "a"})
+        assert r.req.url == "/items/1" and r.req.params == {"p0": "a"}
+    assert compiled == ["/items/{id}"]
+
+    # an Operation shared by PathItems - a plan per path
+    shared = document(2)
+    del shared["paths"]["/items/{id}"]["get"]["operationId"]
+    shared["paths"]["/other/{id}"] = {"$ref": "#/paths/~1items~1{id}"}
+    api = OpenAPI(URLBASE, shared, session_factory=httpx.Client)
+    compiled.clear()
+    for _ in range(3):
+        for path in ["/items/{id}", "/other/{id}"]:
+            r = api.createRequest((path, "get"))
+            r._prepare(None, {"id": 1})
+            assert r.req.url == path.replace("{id}", "1")
+    assert compiled == ["/items/{id}", "/other/{id}"]
+
+    api = OpenAPI(URLBASE, document(2), session_factory=httpx.Client)
+    with pytest.raises(ValueError, match=r"Parameter \['p9'\] unknown"):
+        api.createRequest("items")._prepare(None, {"id": 1, "p9": "a"})
+    with pytest.raises(ValueError, match=r"Required Parameter \['id'\] missing"):
+        api.createRequest("items")._prepare(None, {"p0": "a"})
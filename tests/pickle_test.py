@@ -3,11 +3,14 @@ Tests parsing specs
 """
 
 from pathlib import Path
+import logging
 import pickle
 import copy
 
+import yaml
 
-from aiopenapi3 import OpenAPI
+
+from aiopenapi3 import OpenAPI, FileSystemLoader
 
 URLBASE = "/"
 
@@ -47,3 +50,78 @@ def test_copy(petstore_expanded):
     api = copy.copy(api_)
     assert api != api_
     assert id(api_._security) != id(api._security)
+
+
+def test_cache_dir(tmp_path):
+    (tmp_path / "root.yaml").write_text(
+        """
+openapi: "3.1.0"
+info:
+  title: cache
+  version: 1.0.0
+paths: {}
+components:
+  schemas:
+    Pets:
+      type: array
+      items:
+        $ref: "schemas.yaml#/components/schemas/Pet"
+"""
+    )
+    schemas = """
+openapi: "3.1.0"
+info:
+  title: schemas
+  version: 1.0.0
+components:
+  schemas:
+    Pet:
+      type: object
+      additionalProperties: false
+      properties:
+        {}:
+          type: string
+"""
+    (tmp_path / "schemas.yaml").write_text(schemas.format("name"))
+
+    def load():
+        return OpenAPI.load_file(
+            "/root.yaml", "root.yaml", loader=FileSystemLoader(tmp_path), cache_dir=tmp_path / "cache"
+        )
+
+    api = load()
+    assert api.components.schemas["Pets"].get_type().__module__ == "aiopenapi3.me"
+    assert sorted(i.suffix for i in (tmp_path / "cache").iterdir()) == [".json", ".pickle", ".py"]
+
+    api = load()
+    Pets = api.components.schemas["Pets"].get_type()
+    assert Pets.__module__.startswith("aiopenapi3_cache_")
+    assert Pets.model_validate([{"name": "dog"}]).root[0].name == "dog"
+
+    (tmp_path / "schemas.yaml").write_text(schemas.format("nick"))
+    api = load()
+    assert api.components.schemas["Pets"].get_type().model_validate([{"nick": "dog"}]).root[0].nick == "dog"
+    api = load()
+    assert api.components.schemas["Pets"].get_type().__module__.startswith("aiopenapi3_cache_")
+    assert len(list((tmp_path / "cache").glob("*.pickle"))) == 2
+
+
+def test_cache_dir_not_written(tmp_path, monkeypatch, caplog, petstore_expanded):
+    (tmp_path / "root.yaml").write_text(yaml.safe_dump(petstore_expanded))
+
+    def types_store(self, path):
+        raise TypeError("unsupported annotation")
+
+    monkeypatch.setattr(OpenAPI, "types_store", types_store)
+
+    def load():
+        return OpenAPI.load_file(
+            "/root.yaml", "root.yaml", loader=FileSystemLoader(tmp_path), cache_dir=tmp_path / "cache"
+        )
+
+    with caplog.at_level(logging.DEBUG, logger="aiopenapi3.OpenAPI"):
+        load()
+        load()
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING and "not written" in r.getMessage()]
+    assert len(warnings) == 1 and "unsupported annotation" in warnings[0].getMessage()
+    assert list((tmp_path / "cache").iterdir()) == []
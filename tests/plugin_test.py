@@ -5,7 +5,7 @@ import httpx
 import yarl
 
 from aiopenapi3 import FileSystemLoader, OpenAPI
-from aiopenapi3.plugin import Init, Message, Document
+from aiopenapi3.plugin import Init, Message, Document, Plugins
 
 
 class OnInit(Init):
@@ -96,3 +96,47 @@ def test_Plugins(httpx_mock, with_plugin_base):
     assert item.weight is None  # default does not apply as it it unsed
     assert item.color == "red"  # default does not apply
     assert item.created == datetime.datetime.fromtimestamp(4711, tz=datetime.timezone.utc)
+
+
+def test_Plugins_implements():
+    class OnReceived(Message):
+        def received(self, ctx):
+            return ctx
+
+    plugins = Plugins([OnReceived()])
+    assert plugins.message.implements("received")
+    assert not plugins.message.implements("parsed")
+
+    plugins = Plugins([OnReceived(), OnMessage()])
+    assert plugins.message.implements("parsed")
+    assert not plugins.init.implements("initialized")
+
+
+def test_Plugins_lazy_types(httpx_mock, petstore_expanded):
+    class Resolved(Init):
+        def __init__(self):
+            super().__init__()
+            self.schemas_ = list()
+            self.resolved_ = list()
+
+        def schemas(self, ctx):
+            self.schemas_.append(sorted(ctx.schemas.keys()))
+            return ctx
+
+        def resolved(self, ctx):
+            self.resolved_.append(len(ctx.resolved))
+            return ctx
+
+    eager = Resolved()
+    OpenAPI("test.yaml", petstore_expanded, plugins=[eager])
+
+    # the Init plugins are called once for all schemas, the models are created per operation
+    lazy = Resolved()
+    api = OpenAPI("test.yaml", petstore_expanded, plugins=[lazy], session_factory=httpx.Client, lazy_types=True)
+    assert api._types == dict()
+    assert lazy.schemas_ == eager.schemas_ and lazy.resolved_ == eager.resolved_
+
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=[{"id": 1, "name": "dog"}])
+    api._.findPets()
+    assert "Pet" in api._types
+    assert lazy.schemas_ == eager.schemas_ and lazy.resolved_ == eager.resolved_
@@ -121,3 +121,79 @@ components:
     """
     api = OpenAPI.loads("test.yaml", SPEC)
     assert api.paths["/pets"].get.responses["200"].content["application/json"].schema_.items.__class__ == expected
+
+
+def test_ref_resolution_memoized(monkeypatch):
+    """
+    Tests the JSON Pointers resolved are memoized - resolving scales with the number of targets, not references
+    """
+    from aiopenapi3.json import JSONPointer
+
+    def spec(references, targets):
+        return {
+            "openapi": "3.0.3",
+            "info": {"title": "memoized", "version": "1"},
+            "paths": {},
+            "components": {
+                "schemas": {
+                    "Object": {
+                        "type": "object",
+                        "properties": {
+                            f"p{i}": {"$ref": f"#/components/schemas/T{i % targets}"} for i in range(references)
+                        },
+                    },
+                    **{f"T{i}": {"type": "string"} for i in range(targets)},
+                }
+            },
+        }
+
+    decode = JSONPointer.decode
+    calls = list()
+
+    def counted(part):
+        calls.append(part)
+        return decode(part)
+
+    monkeypatch.setattr(JSONPointer, "decode", staticmethod(counted))
+
+    counts = []
+    for references in [10, 1000]:
+        calls.clear()
+        api = OpenAPI("/", spec(references, 4))
+        counts.append(len(calls))
+        assert len(api._root._jp_cache) == 4
+
+    assert counts[0] == counts[1]
+
+    properties = api.components.schemas["Object"].properties
+    assert properties["p0"]._target is properties["p4"]._target is api.components.schemas["T0"]
+
+
+def test_ref_resolution_deep():
+    """
+    Tests resolving the references of deeply nested schemas does not depend on the recursion limit
+    """
+    import inspect
+    import sys
+
+    schema = {"$ref": "#/components/schemas/Leaf"}
+    for i in range(150):
+        schema = {"type": "object", "properties": {"a": schema}}
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": "deep", "version": "1"},
+        "paths": {},
+        "components": {"schemas": {"Deep": schema, "Leaf": {"type": "string"}}},
+    }
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 100)
+    try:
+        api = OpenAPI("/", spec, lazy_types=True)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    schema = api.components.schemas["Deep"]
+    for i in range(150):
+        schema = schema.properties["a"]
+    assert schema._target is api.components.schemas["Leaf"]
@@ -1,4 +1,9 @@
+import concurrent.futures
 import copy
+import importlib.util
+import re
+import sys
+import time
 import typing
 import uuid
 from datetime import datetime
@@ -122,14 +127,29 @@ def test_schema_regex_engine(with_schema_regex_engine):
     with pytest.raises(pydantic_core._pydantic_core.SchemaError, match="error: unclosed character class$"):
         t = Root.model_fields["root"]
         assert t.annotation is str
-        assert isinstance(t.metadata[0].pattern, str)
-        pattern = t.metadata[0].pattern
+        # not supported by rust regex - validated using the compiled pattern
+        assert isinstance(t.metadata[0].pattern, re.Pattern)
+        pattern = t.metadata[0].pattern.pattern
         from typing import Annotated
 
         C = Annotated[str, pydantic.Field(pattern=pattern)]
         pydantic.create_model("C", __base__=(pydantic.RootModel[C],))
 
 
+def test_schema_regex_engine_per_pattern(with_schema_regex_engine):
+    api = OpenAPI("/", with_schema_regex_engine)
+    Mixed = api.components.schemas["Mixed"].get_type()
+    patterns = {name: f.metadata[0].pattern for name, f in Mixed.model_fields.items()}
+    # the rust regex engine unless the pattern requires python's re
+    assert isinstance(patterns["digits"], str)
+    assert isinstance(patterns["lookahead"], re.Pattern) and isinstance(patterns["backreference"], re.Pattern)
+
+    Mixed.model_validate({"digits": "123-4567", "lookahead": "abc1", "backreference": "aa"})
+    for k, v in {"digits": "1234567", "lookahead": "abc", "backreference": "ab"}.items():
+        with pytest.raises(ValidationError):
+            Mixed.model_validate({k: v})
+
+
 def test_schema_type_list(with_schema_type_list):
     api = OpenAPI("/", with_schema_type_list)
     _Any = api.components.schemas["Any"]
@@ -352,6 +372,89 @@ def test_schema_with_patternProperties(with_schema_patternProperties):
         O.model_validate({"X_5": {1: 2}})
 
 
+def test_schema_identity(petstore_expanded):
+    def identities(api):
+        return {name: schema._identity for name, schema in api.components.schemas.items()} | {
+            "types": sorted(api._types.keys())
+        }
+
+    a = OpenAPI("test.yaml", petstore_expanded)
+    b = OpenAPI("test.yaml", petstore_expanded)
+    assert identities(a) == identities(b)
+
+    document = {
+        "openapi": "3.1.0",
+        "info": {"version": "1.0.0", "title": "identity collision"},
+        "components": {
+            "schemas": {
+                "A": {
+                    "type": "object",
+                    "properties": {
+                        "a": {"type": "object", "properties": {"b": {"type": "string"}}},
+                        "c_d": {"type": "object", "properties": {"e": {"type": "string"}}},
+                        "c.d": {"type": "object", "properties": {"f": {"type": "string"}}},
+                    },
+                },
+                "FWDcomponents_schemas_A_properties_a": {"type": "string"},
+            }
+        },
+    }
+    api = OpenAPI("test.yaml", document)
+    a = api.components.schemas["A"].properties["a"]
+    assert a._location == "#/components/schemas/A/properties/a"
+    assert a._identity == "FWDcomponents_schemas_A_properties_a_1"
+    assert (
+        api.components.schemas["FWDcomponents_schemas_A_properties_a"]._identity
+        == "FWDcomponents_schemas_A_properties_a"
+    )
+    # collisions are resolved in document order
+    properties = api.components.schemas["A"].properties
+    assert properties["c_d"]._identity == "FWDcomponents_schemas_A_properties_c_d"
+    assert properties["c.d"]._identity == "FWDcomponents_schemas_A_properties_c_d_1"
+
+
+def _import_types(monkeypatch, path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_schema_types_store(tmp_path, monkeypatch, httpx_mock, petstore_expanded, with_schema_patternProperties):
+    api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.Client)
+    api.cache_store(tmp_path / "petstore.pickle")
+    api.types_store(tmp_path / "petstore_types.py")
+    module = _import_types(monkeypatch, tmp_path / "petstore_types.py", "petstore_types")
+
+    api = OpenAPI.cache_load(tmp_path / "petstore.pickle", session_factory=httpx.Client, types="petstore_types")
+    assert api.components.schemas["Pet"].get_type() is module.Pet
+    schema = api._.findPets.return_value()
+    assert schema.get_type() is module.__types__[schema._get_identity("X")]
+
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=[{"id": 1, "name": "dog"}])
+    r = api._.findPets()
+    assert isinstance(r[0], module.Pet) and r[0].id == 1
+
+    api = OpenAPI("test.yaml", petstore_expanded)
+    api.types_load(module)
+    assert api.components.schemas["Pet"].get_type() is module.Pet
+
+    api = OpenAPI("/", with_schema_patternProperties)
+    api.cache_store(tmp_path / "patternProperties.pickle")
+    api.types_store(tmp_path / "patternProperties_types.py")
+    _import_types(monkeypatch, tmp_path / "patternProperties_types.py", "patternProperties_types")
+    api = OpenAPI.cache_load(tmp_path / "patternProperties.pickle", types="patternProperties_types")
+    A = api.components.schemas["A"].get_type()
+    a = A.model_validate({"I_5": 100})
+    assert a.aio3_patternProperties == {"^S_": [], "^I_": [("I_5", 100)]}
+    with pytest.raises(ValidationError):
+        A.model_validate({"X_5": {1: 2}})
+
+    with pytest.raises(ValueError, match="missing in patternProperties_types"):
+        OpenAPI("test.yaml", petstore_expanded).types_load("patternProperties_types")
+
+
 def test_schema_discriminated_union(with_schema_discriminated_union):
     api = OpenAPI("/", with_schema_discriminated_union)
 
@@ -360,6 +463,25 @@ def test_schema_discriminated_union_discriminator_name(with_schema_discriminated
     api = OpenAPI("/", with_schema_discriminated_union_discriminator_name)
 
 
+def test_schema_discriminated_union_inferred(with_schema_discriminated_union_inferred):
+    api = OpenAPI("/", with_schema_discriminated_union_inferred)
+    A, B = (api.components.schemas[i].get_type() for i in "AB")
+
+    for name in ["OneOf", "AnyOf"]:
+        T = api.components.schemas[name].get_type()
+        assert T.model_fields["root"].discriminator == "object_type"
+        assert type(T.model_validate({"kind": "x", "object_type": "a"}).root) is A
+        assert type(T.model_validate({"kind": "x", "object_type": "bb", "b": "b"}).root) is B
+        with pytest.raises(ValidationError) as e:
+            T.model_validate({"kind": "x", "object_type": "b", "a": "a"})
+        assert len(e.value.errors()) == 1
+
+    # object_type is not required for C - no discriminator
+    T = api.components.schemas["Optional"].get_type()
+    assert T.model_fields["root"].discriminator is None
+    assert T.model_validate({"c": "c"}).root.c == "c"
+
+
 def test_schema_discriminated_union_invalid_array(with_schema_discriminated_union_invalid_array):
     with pytest.raises(aiopenapi3.errors.SpecError):
         api = OpenAPI("/", with_schema_discriminated_union_invalid_array)
@@ -804,3 +926,285 @@ def test_schema_title_name_collision(with_schema_title_name_collision):
 def test_schema_discriminated_union_extends(with_schema_discriminated_union_extends):
     # AssertionError: A.c0
     api = OpenAPI("/", with_schema_discriminated_union_extends)
+
+
+def test_schema_lazy_types(httpx_mock, petstore_expanded):
+    api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.Client, lazy_types=True)
+    assert api._types == dict()
+    schemas = api.components.schemas
+
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json={"code": 1, "message": "gone"})
+    api._.deletePet(parameters={"id": 1})
+    assert "Error" in api._types and "Pet" not in api._types
+
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=[{"id": 1, "name": "dog"}])
+    r = api._.findPets()
+    assert r[0].id == 1 and r[0].name == "dog"
+    assert "Pet" in api._types and "NewPet" in api._types
+    assert api._types["Error"] is schemas["Error"].get_type()
+
+    with pytest.raises(ResponseSchemaError):
+        httpx_mock.add_response(headers={"Content-Type": "application/json"}, json={"foo": 1})
+        api._.find_pet_by_id(parameters={"id": 1})
+
+
+def test_schema_lazy_types_threads(monkeypatch, petstore_expanded):
+    api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.Client, lazy_types=True)
+    create = api._init_schema_types_create
+    created = list()
+
+    def slow(byname):
+        created.append(sorted(byname.keys()))
+        time.sleep(0.05)
+        create(byname)
+
+    monkeypatch.setattr(api, "_init_schema_types_create", slow)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: api._.findPets.return_value().get_type(), range(4)))
+    assert len(created) == 1
+
+
+def test_schema_response_validation(httpx_mock, petstore_expanded):
+    from aiopenapi3.plugin import Message
+
+    class Counter(Message):
+        def __init__(self):
+            super().__init__()
+            self.parsed_ = self.unmarshalled_ = 0
+
+        def parsed(self, ctx):
+            self.parsed_ += 1
+            return ctx
+
+        def unmarshalled(self, ctx):
+            self.unmarshalled_ += 1
+            return ctx
+
+    api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.Client)
+    Pet = api.components.schemas["Pet"].get_type()
+    assert api.validation == "full"
+
+    pets = [{"id": 1, "name": "dog", "tag": "a"}, {"id": 2, "name": "cat"}]
+    invalid = [{"id": 1}]
+
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=invalid)
+    with pytest.raises(ResponseSchemaError):
+        api._.findPets()
+
+    api.validation = "construct"
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=pets)
+    r = api._.findPets()
+    assert all(isinstance(i, Pet) for i in r)
+    assert r[0].model_dump(exclude_unset=True) == pets[0] and r[1].tag is None
+
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=invalid)
+    assert api._.findPets()[0].model_fields_set == {"id"}
+
+    # a body not matching the type
+    for mismatch in [b"null", b"1", b'"pets"', b'{"id": 1}']:
+        httpx_mock.add_response(headers={"Content-Type": "application/json"}, content=mismatch)
+        with pytest.raises(ResponseSchemaError):
+            api._.findPets()
+
+    api.validation = "none"
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=pets)
+    assert api._.findPets() == pets
+
+    # per operation
+    req = api.createRequest("findPets")
+    req.validation = "full"
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=invalid)
+    with pytest.raises(ResponseSchemaError):
+        req()
+
+    # the Message plugins
+    api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.Client, plugins=[counter := Counter()])
+    for validation in ["full", "construct", "none"]:
+        api.validation = validation
+        httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=pets)
+        assert len(api._.findPets()) == 2
+    assert counter.parsed_ == counter.unmarshalled_ == 3
+
+
+def test_schema_request_serialization(httpx_mock, petstore_expanded):
+    import json
+
+    from aiopenapi3.plugin import Message
+
+    class Marshalled(Message):
+        def __init__(self):
+            super().__init__()
+            self.marshalled_ = list()
+
+        def marshalled(self, ctx):
+            self.marshalled_.append(ctx.marshalled)
+            return ctx
+
+    pet = {"id": 1, "name": "dog", "tag": "a"}
+    new = {"name": "dog", "tag": "a"}
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=pet, is_reusable=True)
+
+    for plugins in [[], [marshalled := Marshalled()]]:
+        api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.Client, plugins=plugins)
+        NewPet = api.components.schemas["NewPet"].get_type()
+        for data in [NewPet(**new), new]:
+            api._.addPet(data=data)
+            assert json.loads(httpx_mock.get_requests()[-1].content) == new
+    assert marshalled.marshalled_ == [new, new]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_schema_response_executor(httpx_mock, petstore_expanded):
+    import concurrent.futures
+    import threading
+
+    from aiopenapi3.plugin import Message
+
+    class Thread(Message):
+        def __init__(self):
+            super().__init__()
+            self.threads = list()
+
+        def parsed(self, ctx):
+            self.threads.append(threading.get_ident())
+            return ctx
+
+    api = OpenAPI("test.yaml", petstore_expanded, session_factory=httpx.AsyncClient, plugins=[thread := Thread()])
+    api.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    pets = [{"id": 1, "name": "dog", "tag": "a"}, {"id": 2, "name": "cat"}]
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, json=pets, is_reusable=True)
+
+    # below the threshold
+    assert len(await api._.findPets()) == 2
+
+    api.executor_threshold = 0
+    assert len(await api._.findPets()) == 2
+
+    # per operation
+    req = api.createRequest("findPets")
+    req.executor_threshold = 1024
+    assert len(await req()) == 2
+
+    api.executor.shutdown()
+    assert thread.threads[0] == thread.threads[2] == threading.get_ident() != thread.threads[1]
+
+
+def test_schema_shared_types(tmp_path):
+    item = {"type": "object", "properties": {"id": {"type": "string"}}}
+    state = {"type": "string", "enum": ["on", "off"]}
+
+    def operation(name, schema):
+        return {
+            "operationId": name,
+            "responses": {
+                "200": {"description": "", "content": {"application/json": {"schema": copy.deepcopy(schema)}}}
+            },
+        }
+
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "", "version": ""},
+        "paths": {
+            "/a": {"get": operation("a", item)},
+            "/b": {"get": operation("b", item)},
+            "/c": {"get": operation("c", {"type": "object", "properties": {"id": {"type": "integer"}}})},
+            "/d": {"get": operation("d", state)},
+            "/e": {"get": operation("e", state)},
+            "/f": {"get": operation("f", {"$ref": "#/components/schemas/X"})},
+            "/g": {"get": operation("g", {"$ref": "#/components/schemas/Y"})},
+        },
+        "components": {
+            "schemas": {
+                "X": copy.deepcopy(item),
+                "Y": {"type": "object", "properties": {"x": {"$ref": "#/components/schemas/X"}}},
+                "Z": {"type": "object", "properties": {"x": {"$ref": "#/components/schemas/X"}}},
+            }
+        },
+    }
+
+    def schema(api, path):
+        return api.paths[path].get.responses["200"].content["application/json"].schema_
+
+    api = OpenAPI("/", copy.deepcopy(spec))
+    assert schema(api, "/a").get_type() is not schema(api, "/b").get_type()
+
+    api = OpenAPI("/", copy.deepcopy(spec), shared_types=True)
+    a, b, c, d, e = (schema(api, i).get_type() for i in ["/a", "/b", "/c", "/d", "/e"])
+    assert a is b and a is not c and d is e
+    assert a is api.components.schemas["X"].get_type()
+    assert api.components.schemas["Y"].get_type() is api.components.schemas["Z"].get_type()
+
+    # the models are registered by the name of each schema
+    for i in ["/a", "/b"]:
+        assert api._types[schema(api, i)._get_identity()] is a
+    assert b.model_validate({"id": "1"}).id == "1"
+    with pytest.raises(ValidationError):
+        c.model_validate({"id": "a"})
+    assert api.createRequest("b").return_value().get_type() is a
+
+    api.cache_store(path := tmp_path / "shared.pickle")
+    api = OpenAPI.cache_load(path)
+    assert schema(api, "/a").get_type() is schema(api, "/b").get_type()
+    assert schema(api, "/a").get_type() is not schema(api, "/c").get_type()
+
+
+def test_schema_defer_build(
+    with_schema_recursion, with_schema_discriminated_union, with_paths_requestbody_formdata_encoding
+):
+    api = OpenAPI("/", with_schema_recursion, defer_build=True)
+    A, B, C = (api.components.schemas[i].get_type() for i in "ABC")
+    assert not any(i.__pydantic_complete__ for i in (A, B, C))
+
+    # forward references are resolved using the models created as __types
+    b = B.model_validate({"ofB": "b", "a": {"ofA": 1, "b": {"ofB": "c"}}})
+    assert isinstance(b.a, A) and isinstance(b.a.b, B) and b.a.b.ofB == "c"
+    assert B.__pydantic_complete__ and not C.__pydantic_complete__
+    with pytest.raises(ValidationError):
+        A.model_validate({"ofA": "a"})
+
+    Expressions = api.components.schemas["Expressions"].get_type()
+    e = Expressions.model_validate([{"Not": {"Not": {}}}])
+    assert e.root[0].Not.Not.Not is None
+
+    # serialization builds the model as well
+    assert C.model_construct(a=A.model_construct(ofA=1)).model_dump(exclude_unset=True) == {"a": {"ofA": 1}}
+    assert C.__pydantic_complete__
+
+    api = OpenAPI("/", with_schema_discriminated_union, defer_build=True)
+    L = api.components.schemas["L"].get_type()
+    A, B = (api.components.schemas[i].get_type() for i in "AB")
+    assert not L.__pydantic_complete__
+    l = L.model_validate([{"object_type": "a", "a": "a"}, {"object_type": "b", "b": "b"}])
+    assert [type(i.root) for i in l.root] == [A, B]
+    with pytest.raises(ValidationError):
+        L.model_validate([{"object_type": "b", "a": "a"}])
+
+    # the forward references of models built as part of the validator of another model
+    api = OpenAPI("/", with_paths_requestbody_formdata_encoding, defer_build=True)
+    T = api.paths["/multi-file"].post.requestBody.content["multipart/form-data"].schema_.get_type()
+    assert T.model_validate({"file": [1, "a"]}).model_dump(exclude_unset=True) == {"file": [1, "a"]}
+
+
+def test_schema_defer_build_fixtures():
+    import warnings
+
+    import yaml
+
+    from aiopenapi3.loader import YAML12Loader
+    from aiopenapi3.model import is_basemodel
+
+    for path in sorted(Path("tests/fixtures").glob("*.yaml")):
+        document = yaml.load(path.read_text(), Loader=YAML12Loader)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                api = OpenAPI("/", document, defer_build=True)
+            except Exception:
+                # fixtures of invalid documents
+                continue
+        for name, model in api._types.items():
+            if not is_basemodel(model):
+                continue
+            model.model_rebuild(raise_errors=True)
+            assert model.__pydantic_complete__, (path.name, name)
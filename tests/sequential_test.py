@@ -99,6 +99,12 @@ async def test_jsonl(server, client):
         async for obj in sequence:
             print(obj)
 
+    # streamed without Content-Length, the bytes received are limited
+    with pytest.raises(aiopenapi3.errors.ContentLengthExceededError):
+        async with req.sequence(max_content_length=64) as sequence:
+            async for obj in sequence:
+                pass
+
 
 @pytest.mark.asyncio(loop_scope="session")
 async def test_sse(server, client):
@@ -106,6 +112,24 @@ async def test_sse(server, client):
 
     req: AsyncRequestBase
     req = client.createRequest("sse")
-    async with req.sequence() as sequence:
+    async with req.sequence(reconnect=0) as sequence:
         async for obj in sequence:
             print(obj)
+
+
+@app.get("/array", operation_id="array")
+async def array() -> list[Item]:
+    return items
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_array(server, client):
+    req = client.createRequest("array")
+    async with req.sequence() as sequence:
+        r = [obj async for obj in sequence]
+    assert [i.model_dump() for i in r] == [i.model_dump() for i in items]
+    assert all(isinstance(i, sequence.model) for i in r)
+
+    with pytest.raises(aiopenapi3.errors.ContentLengthExceededError):
+        async with req.sequence(max_content_length=8):
+            pass
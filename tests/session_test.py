@@ -0,0 +1,184 @@
+import asyncio
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+from fastapi import FastAPI, Request
+
+import pytest
+import pytest_asyncio
+
+
+import aiopenapi3
+
+
+app = FastAPI(version="1.0.0", title="Session tests", servers=[{"url": "/", "description": "Default, relative server"}])
+
+
+@pytest.fixture(scope="session")
+def config(unused_tcp_port_factory):
+    c = Config()
+    c.bind = [f"localhost:{unused_tcp_port_factory()}"]
+    return c
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def server(config):
+    event_loop = asyncio.get_event_loop()
+    try:
+        sd = asyncio.Event()
+        task = event_loop.create_task(serve(app, config, shutdown_trigger=sd.wait))
+        yield config
+    finally:
+        sd.set()
+        await task
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(server):
+    api = await aiopenapi3.OpenAPI.load_async(f"http://{server.bind[0]}/openapi.json")
+    return api
+
+
+@app.get("/peer", operation_id="peer")
+def peer(request: Request) -> int:
+    return request.client.port
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_session_managed(server, client):
+    async with client as api:
+        assert api is client
+        ports = {await client._.peer() for _ in range(4)}
+        assert len(ports) == 1
+        assert len(sessions := list(client._sessions.values())) == 1
+    assert client._sessions is None
+    assert sessions[0].is_closed
+
+    ports = {await client._.peer() for _ in range(2)}
+    assert len(ports) == 2
+
+    # asyncio sessions can not be closed using close()
+    client.open()
+    await client._.peer()
+    with pytest.raises(TypeError):
+        client.close()
+    assert len(sessions := list(client._sessions.values())) == 1
+    await client.aclose()
+    assert sessions[0].is_closed
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_session_managed_stream(server, client):
+    async with client:
+        headers, schema_, session, result = await client._.peer.stream()
+        await result.aread()
+        await result.aclose()
+        assert session is list(client._sessions.values())[0]
+        assert not session.is_closed
+        port = int(result.text)
+        assert await client._.peer() == port
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sync_session_managed(server):
+    client = await asyncio.to_thread(
+        aiopenapi3.OpenAPI.load_sync,
+        f"http://{server.bind[0]}/openapi.json",
+    )
+
+    def run():
+        with client:
+            return {client._.peer() for _ in range(4)}
+
+    ports = await asyncio.to_thread(run)
+    assert len(ports) == 1
+    assert client._sessions is None
+
+    with pytest.raises(TypeError):
+        await client.open().aclose()
+    client.close()
+
+
+@app.get("/echo/{value}", operation_id="echo")
+async def echo(value: int, delay: float = 0) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_concurrent(server, client):
+    assert client._.echo is client._.echo
+    r = client._.echo
+    values = list(range(32))
+    result = await asyncio.gather(*[r(parameters={"value": i, "delay": (len(values) - i) / 1000}) for i in values])
+    assert result == values
+    assert r.vars is None
+    assert r.req.url == "/echo/{value}" and r.req.params == {}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch(server, client):
+    values = list(range(16))
+    items = [({"value": i, "delay": (len(values) - i) / 1000}, None) for i in values]
+    items.append(({"value": "fail"}, None))
+
+    r = [i async for i in client.batch("echo", items, concurrency=4)]
+    assert [i.index for i in r] == list(range(len(items)))
+    assert [i.response.data for i in r[:-1]] == values
+    assert r[-1].response is None and isinstance(r[-1].error, ValueError)
+    assert client._sessions is None
+
+    r = [i async for i in client.batch("echo", items, concurrency=len(items), ordered=False)]
+    assert sorted(i.index for i in r) == list(range(len(items)))
+
+    # unordered - the item delayed is yielded last
+    r = [
+        i async for i in client.batch("echo", [({"value": 0, "delay": 0.2}, None), ({"value": 1}, None)], ordered=False)
+    ]
+    assert [i.index for i in r] == [1, 0]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch_overlapping(server, client):
+    long = [({"value": i, "delay": 0.01}, None) for i in range(12)]
+    short = [({"value": 0, "delay": 0.005}, None)]
+
+    async def run(items, concurrency):
+        r = list()
+        async for i in client.batch("echo", items, concurrency=concurrency):
+            # the batch does not enter managed session mode, calls made meanwhile do not use the session of the batch
+            assert client._sessions is None
+            r.append(i)
+        return r
+
+    # the short batch is done while the long batch is in flight
+    s, r = await asyncio.gather(run(short, 1), run(long, 3))
+    assert [i.error for i in r + s] == [None] * 13
+    assert [i.response.data for i in r] == list(range(12))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sync_batch(server):
+    client = await asyncio.to_thread(
+        aiopenapi3.OpenAPI.load_sync,
+        f"http://{server.bind[0]}/openapi.json",
+    )
+
+    values = list(range(16))
+    items = [({"value": i}, None) for i in values] + [({}, None)]
+    r = await asyncio.to_thread(lambda: list(client.batch("echo", items, concurrency=4)))
+    assert [i.response.data for i in r[:-1]] == values
+    assert isinstance(r[-1].error, ValueError)
+    assert client._sessions is None
+
+    r = await asyncio.to_thread(lambda: list(client.batch("echo", items, ordered=False)))
+    assert sorted(i.index for i in r) == list(range(len(items)))
+
+    def overlapping():
+        long = client.batch("echo", [({"value": i, "delay": 0.01}, None) for i in range(12)], concurrency=3)
+        first = next(long)
+        assert [i.error for i in client.batch("echo", [({"value": 0}, None)], concurrency=1)] == [None]
+        return [first] + list(long)
+
+    r = await asyncio.to_thread(overlapping)
+    assert [i.response.data for i in r] == list(range(12))
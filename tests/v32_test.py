@@ -5,6 +5,7 @@ from pytest_httpx import IteratorStream
 
 from aiopenapi3 import OpenAPI
 from aiopenapi3 import v32
+from aiopenapi3.errors import ContentLengthExceededError, RequestError
 
 
 def test_Components():
@@ -77,7 +78,7 @@ async def test_MediaType(httpx_mock, with_schema_itemSchema):
             print(obj)
 
     req = api.createRequest("text_events")
-    async with req.sequence() as sequence:
+    async with req.sequence(reconnect=0) as sequence:
         async for obj in sequence:
             print(obj)
 
@@ -135,11 +136,149 @@ def test_MediaType_itemSchema_sync(httpx_mock, with_schema_itemSchema):
             print(obj)
 
     req = api.createRequest("text_events")
-    with req.sequence() as sequence:
+    with req.sequence(reconnect=0) as sequence:
         for obj in sequence:
             print(obj)
 
 
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+@pytest.mark.parametrize("batch", [0, 2])
+def test_MediaType_itemSchema_records(httpx_mock, with_schema_itemSchema, batch):
+    from aiopenapi3.request import RecordDecoder
+
+    decoder = RecordDecoder(b"\n")
+    assert decoder.decode(b'{"a":1}\n{"a"') == [b'{"a":1}']
+    assert decoder.decode(b":2}\r\n\n  \n") == [b'{"a":2}\r']
+    assert decoder.decode(b'{"a":3}') == [] and decoder.flush() == [b'{"a":3}']
+
+    # a record spanning many chunks is joined once
+    record = b'{"a":"' + b"x" * 4096 + b'"}'
+    for i in range(0, len(record), 7):
+        assert decoder.decode(record[i : i + 7]) == []
+    assert len(decoder._pending) == len(range(0, len(record), 7))
+    assert decoder.decode(b"\n") == [record] and decoder._pending == []
+
+    api = OpenAPI("https://example.org/api/", with_schema_itemSchema, session_factory=httpx.Client)
+    records = with_schema_itemSchema["components"]["examples"]["LogJSONPerLine"]["value"].strip("\n").split("\n")
+
+    jsonl = b"".join(i.encode() + b"\n" for i in records * 16)
+    json_seq = b"".join(b"\x1e" + i.encode() + b"\n" for i in records * 16)
+    httpx_mock.add_response(
+        url="https://example.org/api/jsonl",
+        headers={"Content-Type": "application/jsonl"},
+        stream=IteratorStream([jsonl[i : i + 157] for i in range(0, len(jsonl), 157)]),
+    )
+    httpx_mock.add_response(
+        url="https://example.org/api/json_seq",
+        headers={"Content-Type": "application/json-seq"},
+        stream=IteratorStream([json_seq[i : i + 157] for i in range(0, len(json_seq), 157)]),
+    )
+
+    for operationId in ["jsonl", "json_seq"]:
+        with api.createRequest(operationId).sequence(batch=batch) as sequence:
+            r = list(sequence)
+        assert len(r) == len(records) * 16
+        assert all(isinstance(i, sequence.model) for i in r)
+
+        with pytest.raises(ContentLengthExceededError):
+            with api.createRequest(operationId).sequence(batch=batch, max_content_length=len(jsonl) // 2) as sequence:
+                list(sequence)
+
+
+def test_MediaType_itemSchema_event_stream():
+    from aiopenapi3.sse import EventStreamDecoder
+
+    stream = b"\xef\xbb\xbf: comment\r\nretry: 10\r\nid: 1\r\nevent: log\r\ndata: a\r\ndata:b\r\n\r\ndata: c\n\nid\ndata\n\ndata: d"
+    for size in (1, 2, 3, 7, len(stream)):
+        decoder = EventStreamDecoder()
+        events = [e for i in range(0, len(stream), size) for e in decoder.decode(stream[i : i + size])]
+        assert events == [
+            {"data": "a\nb", "event": "log", "id": "1", "retry": 10},
+            {"data": "c", "id": "1"},
+            {"data": ""},
+        ]
+        assert decoder.retry == 10 and decoder.last_event_id == ""
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_MediaType_itemSchema_event_stream_reconnect(httpx_mock, with_schema_itemSchema):
+    api = OpenAPI("https://example.org/api/", with_schema_itemSchema, session_factory=httpx.Client)
+
+    def interrupted():
+        yield b"retry: 0\nid: 1\ndata: 1\n\nid: 2\ndata: 2"
+        raise httpx.ReadError("connection lost")
+
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events",
+        headers={"Content-Type": "text/event-stream"},
+        stream=IteratorStream(interrupted()),
+    )
+    httpx_mock.add_exception(httpx.ConnectError("connection refused"), url="https://example.org/api/text_events")
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events",
+        match_headers={"Last-Event-ID": "1"},
+        headers={"Content-Type": "text/event-stream"},
+        content=b"id: 2\ndata: 2\n\n",
+    )
+    # the stream was closed - reconnect, 204 ends the stream
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events", match_headers={"Last-Event-ID": "2"}, status_code=204
+    )
+    req = api.createRequest("text_events")
+    with req.sequence() as sequence:
+        assert [(e.root.id, e.root.data) for e in sequence] == [("1", "1"), ("2", "2")]
+
+    assert [r.headers.get("Last-Event-ID") for r in httpx_mock.get_requests()] == [None, "1", "1", "2"]
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_MediaType_itemSchema_event_stream_reconnect_limit(httpx_mock, with_schema_itemSchema):
+    api = OpenAPI("https://example.org/api/", with_schema_itemSchema, session_factory=httpx.Client)
+
+    def interrupted():
+        yield b"retry: 0\nid: 1\ndata: 1\n\n"
+        raise httpx.ReadError("connection lost")
+
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events",
+        headers={"Content-Type": "text/event-stream"},
+        stream=IteratorStream(interrupted()),
+    )
+    httpx_mock.add_exception(httpx.ConnectError("connection refused"), url="https://example.org/api/text_events")
+
+    req = api.createRequest("text_events")
+    with pytest.raises(RequestError):
+        with req.sequence(reconnect=2) as sequence:
+            assert next(iter(sequence)).root.data == "1"
+            list(sequence)
+    assert len(httpx_mock.get_requests()) == 1 + 2
+
+    httpx_mock.reset()
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events",
+        headers={"Content-Type": "text/event-stream"},
+        stream=IteratorStream(interrupted()),
+    )
+    with pytest.raises(httpx.ReadError):
+        with req.sequence(reconnect=0) as sequence:
+            list(sequence)
+    assert len(httpx_mock.get_requests()) == 1
+
+    # closed streams without data count as attempts
+    httpx_mock.reset()
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events",
+        headers={"Content-Type": "text/event-stream"},
+        content=b"retry: 0\nid: 1\ndata: 1\n\n",
+    )
+    httpx_mock.add_response(
+        url="https://example.org/api/text_events", headers={"Content-Type": "text/event-stream"}, content=b""
+    )
+    with req.sequence(reconnect=2) as sequence:
+        assert [e.root.data for e in sequence] == ["1"]
+    assert len(httpx_mock.get_requests()) == 1 + 2
+
+
 def test_Response():
     # description
     # summary